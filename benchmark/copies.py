@@ -0,0 +1,152 @@
+import sys
+import tracemalloc
+from argparse import ArgumentParser
+from array import array
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+)
+
+from numpy import (
+    asarray,
+    frombuffer,
+    ndarray,
+    shares_memory,
+    uint8,
+)
+
+import docbr as dbr
+from docbr import doctypes as dt
+from docbr.core._io import (
+    io_get,
+    io_input_narray,
+    io_zero_copy,
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+Case = Tuple[Callable[[], Any], Optional[Callable[[Any], ndarray]]]
+
+
+# each case builds an input and gives a view of the memory that holds its
+# documents, or None when the conversion cannot share it (Python objects)
+def make_cases(size: int) -> Dict[str, Case]:
+    docs = dbr.generate(size, dt.CPF, seed=0).astype("S11")
+    integers = docs.astype("int64")
+
+    cases = {
+        "ndarray[S]": (lambda: docs, lambda x: x),
+        "ndarray[U]": (lambda: docs.astype("U11"), lambda x: x),
+        "ndarray[int64]": (lambda: integers, lambda x: x),
+        "ndarray[V]": (lambda: docs.view("V11"), lambda x: x),
+        "ndarray[float64]": (lambda: integers.astype("float64"), lambda x: x),
+        "ndarray[object]": (lambda: docs.astype(object), None),
+        "memoryview[S]": (lambda: docs.data, asarray),
+        "array.array[q]": (
+            lambda: array("q", integers.tobytes()),
+            lambda x: frombuffer(x, dtype="int64"),
+        ),
+        "list[str]": (lambda: docs.astype("U11").tolist(), None),
+        "tuple[str]": (lambda: tuple(docs.astype("U11").tolist()), None),
+    }
+    if pd is not None:
+        cases["Series[int64]"] = (
+            lambda: pd.Series(integers),
+            lambda x: x.to_numpy(),
+        )
+        cases["Series[object]"] = (
+            lambda: pd.Series(docs.astype("U11").astype(object), dtype=object),
+            None,
+        )
+        cases["Series[Int64]"] = (
+            lambda: pd.Series(integers, dtype="Int64"),
+            lambda x: x.array._data,
+        )
+    if pa is not None:
+        cases["pyarrow.StringArray"] = (
+            lambda: pa.array(docs.astype("U11")),
+            lambda x: frombuffer(x.buffers()[2], dtype=uint8),
+        )
+        cases["pyarrow.StringArray[nulls]"] = (
+            lambda: pa.array(docs.astype("U11"), mask=integers % 7 == 0),
+            lambda x: frombuffer(x.buffers()[2], dtype=uint8),
+        )
+        cases["pyarrow.StringArray[widths]"] = (
+            lambda: pa.array(docs.astype("U11").tolist() + ["0"]),
+            lambda x: frombuffer(x.buffers()[2], dtype=uint8),
+        )
+        cases["pyarrow.Int64Array"] = (
+            lambda: pa.array(integers),
+            lambda x: frombuffer(x.buffers()[1], dtype="int64"),
+        )
+        cases["pyarrow.Int64Array[nulls]"] = (
+            lambda: pa.array(integers, mask=integers % 7 == 0),
+            lambda x: frombuffer(x.buffers()[1], dtype="int64"),
+        )
+    if pa is not None and pd is not None:
+        cases["Series[string[pyarrow]]"] = (
+            lambda: pd.Series(docs.astype("U11"), dtype="string[pyarrow]"),
+            lambda x: frombuffer(pa.array(x.array).buffers()[2], dtype=uint8),
+        )
+    return cases
+
+
+def measure(obj: Any) -> Tuple[ndarray, int, int]:
+    i_func, _ = io_get(obj)
+    arrow_start = pa.total_allocated_bytes() if pa is not None else 0
+    tracemalloc.start()
+    start = perf_counter_ns()
+    result = io_input_narray(obj, i_func)
+    elapsed = perf_counter_ns() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if pa is not None:
+        peak += max(pa.total_allocated_bytes() - arrow_start, 0)
+    return result, elapsed, peak
+
+
+# the cases whose registered zero-copy flag disagrees with the measured sharing
+def run_copies(size: int) -> List[str]:
+    mismatches = []
+
+    for name, (make, source) in make_cases(size).items():
+        obj = make()
+        zero_copy = io_zero_copy(obj)
+        result, elapsed, peak = measure(obj)
+        shared = source is not None and shares_memory(result, source(obj))
+        if zero_copy != shared:
+            mismatches.append(name)
+        print(
+            f"{name:>27} | registered zero-copy {str(zero_copy):>5} | "
+            f"shares input {str(shared):>5} | {elapsed / 1e9:8.4f} s | "
+            f"{peak / 2**20:8.2f} MiB allocated"
+        )
+
+    return mismatches
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description="memory copied by the input conversion of each type"
+    )
+    parser.add_argument("--size", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    mismatches = run_copies(args.size)
+    for name in mismatches:
+        print(f"MISMATCH {name} does not match its registered zero-copy flag")
+    if mismatches:
+        sys.exit(1)
@@ -1,6 +1,8 @@
+from os.path import exists
 from time import perf_counter_ns
 from typing import (
     Callable,
+    Dict,
     List,
 )
 
@@ -98,12 +100,32 @@ def run_tests(key: str, values: List[str], masked: bool = False) -> dict:
     }
 
 
+def load_data(path: str, masked: bool) -> dict:
+    if exists(path):
+        return read_table(path).to_pydict()
+
+    print(f"{path} not found, generating the documents")
+    return {
+        key: dbr.generate(1000000, doctype, mask=masked, seed=0).tolist()
+        for key, doctype in DOCTYPES.items()
+    }
+
+
+DOCTYPES: Dict[str, dt.DocType] = {
+    "CPF": dt.CPF,
+    "CNPJ": dt.CNPJ,
+    "CNH": dt.CNH,
+    "PIS": dt.PIS,
+    "TE": dt.T_ELEITOR,
+    "RENAVAM": dt.RENAVAM,
+}
+
 # parquet with 1.000.000 valid and masked documents of each type
-masked_data: dict = read_table("benchmark/masked.parquet").to_pydict()
+masked_data: dict = load_data("benchmark/masked.parquet", masked=True)
 masked_keys: list = list(masked_data.keys())
 
 # parquet with 1.000.000 valid and unmasked documents of each type
-unmasked_data: dict = read_table("benchmark/unmasked.parquet").to_pydict()
+unmasked_data: dict = load_data("benchmark/unmasked.parquet", masked=False)
 unmasked_keys: list = list(unmasked_data.keys())
 
 results: list = []
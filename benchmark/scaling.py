@@ -0,0 +1,74 @@
+from argparse import ArgumentParser
+from os import cpu_count
+from time import perf_counter_ns
+from typing import List
+
+from numpy import (
+    ndarray,
+    uint8,
+)
+from numpy.random import default_rng
+
+import docbr as dbr
+from docbr import doctypes as dt
+from docbr.core._parallel import (
+    get_process_pool,
+    shutdown_process_pool,
+)
+
+
+def random_documents(size: int, doc_len: int, seed: int = 0) -> ndarray:
+    chars = default_rng(seed).integers(0, 10, (size, doc_len), dtype=uint8)
+    chars += 48
+    return chars.view(f"S{doc_len}").reshape(size)
+
+
+def best_of(
+    docs: ndarray, doctype: dt.DocType, n_jobs: int, repeat: int
+) -> int:
+    times = []
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        dbr.validate(docs, doctype, n_jobs=n_jobs)
+        times.append(perf_counter_ns() - start)
+    return min(times)
+
+
+def run_scaling(size: int, max_jobs: int, repeat: int) -> List[dict]:
+    docs = random_documents(size, 14)
+    results = []
+    baseline = 0
+
+    for n_jobs in range(1, max_jobs + 1):
+        if n_jobs > 1:
+            get_process_pool(n_jobs)
+            dbr.validate(docs[: n_jobs * 65536], dt.CNPJ, n_jobs=n_jobs)
+
+        elapsed = best_of(docs, dt.CNPJ, n_jobs, repeat)
+        baseline = baseline or elapsed
+        results.append(
+            {
+                "n_jobs": n_jobs,
+                "seconds": elapsed / 1e9,
+                "rows_per_second": size / (elapsed / 1e9),
+                "speedup": baseline / elapsed,
+            }
+        )
+        print(
+            f"n_jobs={n_jobs:>3} | {elapsed / 1e9:8.3f} s | "
+            f"{size / (elapsed / 1e9):>14,.0f} rows/s | "
+            f"speedup {baseline / elapsed:5.2f}x"
+        )
+
+    shutdown_process_pool()
+    return results
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="CNPJ validation scaling by n_jobs")
+    parser.add_argument("--size", type=int, default=10_000_000)
+    parser.add_argument("--max-jobs", type=int, default=cpu_count() or 1)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    run_scaling(args.size, args.max_jobs, args.repeat)
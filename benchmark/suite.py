@@ -0,0 +1,186 @@
+import json
+import platform
+import sys
+from argparse import ArgumentParser
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+)
+
+import numpy
+from numpy import ndarray
+
+import docbr as dbr
+from docbr import doctypes as dt
+from docbr.api.validator import _get_instance
+
+DOCTYPES: List[dt.DocType] = [
+    dt.CPF,
+    dt.CNPJ,
+    dt.CNH,
+    dt.T_ELEITOR,
+    dt.PIS,
+    dt.CERTIDAO,
+    dt.RENAVAM,
+    dt.PLACA,
+    dt.TELEFONE,
+    dt.EMAIL,
+]
+OPERATIONS = ["validate", "parse", "parse_mask", "get_attribute"]
+SIZES = [1, 1_000, 100_000, 10_000_000]
+
+# small batches are timed in loops lasting at least this long
+MIN_RUN_NS = 200_000_000
+
+
+def get_operation(doctype: dt.DocType, operation: str) -> Optional[Callable]:
+    if operation == "validate":
+        return lambda docs: dbr.validate(docs, doctype)
+    if operation == "parse":
+        return lambda docs: dbr.parse(docs, doctype, mask=False)
+    if operation == "parse_mask":
+        return lambda docs: dbr.parse(docs, doctype, mask=True)
+
+    attributes: List[Any] = list(
+        _get_instance(doctype)(numpy.array([]))._attributes
+    )
+    if not attributes:
+        return None
+    return lambda docs: dbr.get_attribute(docs, doctype, attributes[0])
+
+
+def run_case(func: Callable, docs: ndarray, repeat: int) -> dict:
+    start = perf_counter_ns()
+    func(docs)
+    loops = max(1, MIN_RUN_NS // (perf_counter_ns() - start))
+    times = []
+
+    for _ in range(repeat):
+        start = perf_counter_ns()
+        for _ in range(loops):
+            func(docs)
+        times.append((perf_counter_ns() - start) / loops)
+
+    with dbr.profile() as profiler:
+        for _ in range(loops):
+            func(docs)
+
+    seconds = min(times) / 1e9
+    return {
+        "seconds": seconds,
+        "rows_per_second": len(docs) / seconds,
+        "stages": {
+            stage: stats[2] / loops / 1e9
+            for (_, stage), stats in profiler.stats.items()
+        },
+    }
+
+
+def run_suite(
+    doctypes: List[dt.DocType],
+    operations: List[str],
+    sizes: List[int],
+    repeat: int,
+    seed: int,
+) -> List[dict]:
+    results = []
+
+    for doctype in doctypes:
+        for size in sizes:
+            docs = dbr.generate(
+                size, doctype, mask=True, invalid_ratio=0.1, seed=seed
+            )
+            for operation in operations:
+                func = get_operation(doctype, operation)
+                if func is None:
+                    continue
+
+                result: Dict[str, Any] = {
+                    "doctype": doctype,
+                    "operation": operation,
+                }
+                result["size"] = size
+                result.update(run_case(func, docs, repeat))
+                results.append(result)
+                print(
+                    f"{doctype:>6} | {operation:>13} | {size:>10,} | "
+                    f"{result['seconds']:10.6f} s | "
+                    f"{result['rows_per_second']:>14,.0f} rows/s"
+                )
+
+    return results
+
+
+def find_regressions(
+    results: List[dict], baseline: List[dict], threshold: float
+) -> List[str]:
+    def key(result: dict) -> tuple:
+        return result["doctype"], result["operation"], result["size"]
+
+    previous = {key(result): result for result in baseline}
+    regressions = []
+
+    for result in results:
+        base = previous.get(key(result))
+        if base is None:
+            continue
+
+        ratio = result["rows_per_second"] / base["rows_per_second"]
+        if ratio < 1 - threshold:
+            doctype, operation, size = key(result)
+            regressions.append(
+                f"{doctype} {operation} size={size}: "
+                f"{result['rows_per_second']:,.0f} rows/s vs "
+                f"{base['rows_per_second']:,.0f} rows/s ({ratio - 1:+.1%})"
+            )
+
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(description="docbr benchmark suite")
+    parser.add_argument("--doctypes", nargs="+", default=DOCTYPES)
+    parser.add_argument("--operations", nargs="+", default=OPERATIONS)
+    parser.add_argument("--sizes", nargs="+", type=int, default=SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--seed", type=int, default=0, help="seed of the generated documents"
+    )
+    parser.add_argument("--output", default="benchmark/results.json")
+    parser.add_argument("--baseline", help="results file to compare with")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="maximum throughput loss allowed against the baseline",
+    )
+    args = parser.parse_args()
+
+    results = run_suite(
+        args.doctypes, args.operations, args.sizes, args.repeat, args.seed
+    )
+    report = {
+        "python": platform.python_version(),
+        "numpy": numpy.__version__,
+        "platform": platform.platform(),
+        "seed": args.seed,
+        "results": results,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["results"]
+
+        regressions = find_regressions(results, baseline, args.threshold)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            sys.exit(1)
@@ -1,5 +1,25 @@
 from docbr.api import (
+    ProfileEvent,
+    Profiler,
+    Validator,
+    add_profile_hook,
+    cache_clear,
+    cache_info,
+    detect,
+    disable_cache,
+    enable_cache,
+    generate,
     get_attribute,
+    get_attribute_iter,
+    normalize_numeric,
     parse,
+    parse_iter,
+    parse_records,
+    profile,
+    register_input,
+    remove_profile_hook,
     validate,
+    validate_frame,
+    validate_iter,
+    validate_records,
 )
@@ -1,5 +1,33 @@
+from docbr.api.detect import detect
 from docbr.api.facade import (
     get_attribute,
     parse,
     validate,
 )
+from docbr.api.frame import validate_frame
+from docbr.api.generate import generate
+from docbr.api.numeric import normalize_numeric
+from docbr.api.records import (
+    parse_records,
+    validate_records,
+)
+from docbr.api.stream import (
+    get_attribute_iter,
+    parse_iter,
+    validate_iter,
+)
+from docbr.api.validator import Validator
+from docbr.core._cache import (
+    cache_clear,
+    cache_info,
+    disable_cache,
+    enable_cache,
+)
+from docbr.core._io import register_input
+from docbr.core._profile import (
+    ProfileEvent,
+    Profiler,
+    add_profile_hook,
+    profile,
+    remove_profile_hook,
+)
@@ -0,0 +1,144 @@
+from typing import (
+    Any,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from numpy import (
+    arange,
+    array,
+    count_nonzero,
+    cumsum,
+    flatnonzero,
+    full,
+    intp,
+    ndarray,
+    newaxis,
+    repeat,
+    uint8,
+    zeros,
+)
+
+from docbr.api.validator import (
+    _get_instance,
+    _output_nulls,
+)
+from docbr.core._io import (
+    io_compact,
+    io_expand,
+    io_get,
+    io_input_narray,
+    io_null_mask,
+    io_output_narray,
+)
+from docbr.core._profile import (
+    end_stage,
+    start_stage,
+)
+from docbr.core._utils import (
+    as_unicode,
+    from_byte_matrix,
+    to_char_matrix,
+)
+from docbr.core.checkdigit._template import CheckDigit
+
+
+def _digit_matrix(doclist: ndarray, width: int) -> Tuple[ndarray, ndarray]:
+    """
+    Extracts the digits of each document into a uint8 matrix of ASCII codes, aligned to the right and padded with zeros on the left, which is the layout the check digit documents are fitted to. Documents with more than `width` digits are left blank.
+
+    :param doclist: The documents.
+    :type doclist: ndarray
+
+    :param width: The number of columns of the matrix.
+    :type width: int
+
+    :return: The matrix of digits and the number of digits of each document.
+    :rtype: Tuple[ndarray, ndarray]
+    """
+    chars = to_char_matrix(as_unicode(doclist))
+    is_digit = (chars >= 48) & (chars <= 57)
+    counts = count_nonzero(is_digit, axis=1)
+    is_digit &= (counts <= width)[:, newaxis]
+
+    kept = count_nonzero(is_digit, axis=1)
+    rows = repeat(arange(len(chars), dtype=intp), kept)
+    rank = arange(len(rows), dtype=intp) - repeat(cumsum(kept) - kept, kept)
+
+    digits = full((len(chars), width), ord("0"), dtype=uint8)
+    digits[rows, width - kept[rows] + rank] = chars[is_digit]
+    return digits, counts
+
+
+def detect(
+    doclist: Any,
+    candidates: Optional[
+        List[Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam"]]
+    ] = None,
+) -> Tuple[Union[str, ndarray], Union[bool, ndarray]]:
+    """
+    Detects the type of each document among document types validated by check digits and validates it, in a single pass over mixed columns.
+
+    Each document is reduced to its digits once and is sent only to the candidates long enough to hold them, from the shortest to the longest and, among candidates of the same length, in the given order. The detected type is the first candidate under which the document is valid. Documents that are not valid under any candidate are reported with the first candidate tried. Documents without digits, or with more digits than the longest candidate, are reported with an empty string, as are null documents, whose validity is masked.
+
+    Candidates of the same length should be listed from the most to the least likely: PIS and RENAVAM have a single check digit, so about one in ten mistyped CPFs is a valid PIS.
+
+    :param doclist: Document(s) to be detected.
+    :type doclist: Any
+
+    :param candidates: The document types that can be detected. Defaults to cpf and cnpj.
+    :type candidates: Optional[List[Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam"]]]
+
+    :return: Returns the detected type and the validity of the document(s), as numpy.ndarray or str and bool.
+    :rtype: Tuple[Union[str, ndarray], Union[bool, ndarray]]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If a candidate is not a document type validated by check digits.
+    """
+
+    if candidates is None:
+        candidates = ["cpf", "cnpj"]
+    classes = [_get_instance(doctype) for doctype in candidates]
+    engines = [e for e in classes if issubclass(e, CheckDigit)]
+    if not engines or len(engines) < len(classes):
+        raise ValueError(
+            "candidates must be document types validated by check digits: "
+            "cnpj, cpf, cnh, te, pis, cert, rnvam"
+        )
+
+    start = start_stage()
+    i_func, o_type = io_get(doclist)
+    nulls = io_null_mask(doclist)
+    doclist = io_input_narray(io_compact(doclist, nulls), i_func)
+    end_stage(start, "detect", "io_input", doclist)
+
+    lengths = [engine(array([], dtype=str))._doc_len for engine in engines]
+    order = sorted(range(len(engines)), key=lambda i: lengths[i])
+    digits, counts = _digit_matrix(doclist, max(lengths))
+
+    detected = full(len(doclist), "", dtype=f"U{max(map(len, candidates))}")
+    valid = zeros(len(doclist), dtype=bool)
+    pending = (counts > 0) & (counts <= max(lengths))
+
+    for i in order:
+        rows = flatnonzero(pending & (counts <= lengths[i]))
+        if not len(rows):
+            continue
+
+        docs = from_byte_matrix(digits[rows, digits.shape[1] - lengths[i] :])
+        result = engines[i](docs).validate(True)
+        untried = detected[rows] == ""
+        detected[rows[untried | result]] = candidates[i]
+        valid[rows[result]] = True
+        pending[rows[result]] = False
+
+    detected = io_expand(detected, nulls, "")
+    valid = io_expand(valid, nulls)
+    undetected = _output_nulls(detected != "", nulls)
+    return (
+        io_output_narray(detected, o_type, undetected),
+        io_output_narray(valid, o_type, undetected, nulls),
+    )
@@ -1,64 +1,44 @@
+from threading import Lock
 from typing import (
     Any,
+    Dict,
     Literal,
+    Optional,
+    Tuple,
     Union,
 )
 
 from numpy import ndarray
 
+from docbr.api.validator import Validator
 from docbr.attributes import AttributeStr
-from docbr.core._io import (
-    io_get,
-    io_input_narray,
-    io_output_narray,
-)
-from docbr.core.checkdigit._template import CheckDigit
-from docbr.core.checkdigit.documents import (
-    CNH,
-    CNPJ,
-    CPF,
-    PIS,
-    Certidao,
-    Renavam,
-    TituloEleitor,
-)
-from docbr.core.regexp._template import RegExr
-from docbr.core.regexp.documents import (
-    CarPlate,
-    Email,
-    Phone,
-)
+from docbr.core._io import ValidityCounts
+from docbr.doctypes import DocType
 
+_validators: Dict[str, Validator] = {}
+_validators_lock = Lock()
 
-def _get_instance(doctype: str) -> CheckDigit | RegExr:
+
+def _get_validator(doctype: DocType) -> Validator:
     """
-    Return an instance of a class that validates documents based on the input `doctype`.
+    Returns the validator shared by the calls on `doctype`, creating it on first use, so the document specification is compiled once. It does not keep scratch buffers, which would hold the memory of the largest batch of each thread.
 
-    :param doctype: A string representing the type of document to be validated.
-    :type doctype: str
+    :param doctype: Type of document, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: DocType
 
-    :return: An instance of the appropriate validation class based on `doctype`.
-    :rtype: CheckDigit or RegExr
+    :return: The validator of the document type.
+    :rtype: Validator
 
     :raises ValueError: If `doctype` is not one of the supported document types.
     """
-    classes = {
-        "cpf": CPF,
-        "cnpj": CNPJ,
-        "cnh": CNH,
-        "te": TituloEleitor,
-        "pis": PIS,
-        "cert": Certidao,
-        "rnvam": Renavam,
-        "placa": CarPlate,
-        "tfone": Phone,
-        "email": Email,
-    }
-    if doctype not in classes:
-        raise ValueError(
-            f"doctype must be one of the following: {list(classes.keys())}"
-        )
-    return classes[doctype]
+    validator = _validators.get(doctype)
+    if validator is None:
+        with _validators_lock:
+            validator = _validators.get(doctype)
+            if validator is None:
+                validator = Validator(doctype, reuse_buffers=False)
+                _validators[doctype] = validator
+    return validator
 
 
 def parse(
@@ -76,7 +56,10 @@ def parse(
         "email",
     ],
     mask: bool = False,
-) -> Union[str, ndarray]:
+    dedup: Union[bool, Literal["auto"]] = False,
+    copy: bool = True,
+    output: Literal["object", "fixed", "bytes", "arrow"] = "object",
+) -> Union[str, ndarray, Tuple[ndarray, ndarray]]:
     """
     Extracts the document and returns its corrected value.
 
@@ -89,18 +72,22 @@ def parse(
     :param mask: If True, adds a mask on the document.
     :type mask: bool
 
-    :return: Returns the extracted document(s) as numpy.ndarray or str.
-    :rtype: Union[str, ndarray]
+    :param dedup: If True, processes only the unique documents and scatters the results back, which pays off on repetitive columns. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+    :type dedup: Union[bool, Literal["auto"]]
 
-    :raises TypeError: If the type of the document(s) sent is not str, int, float, list, ndarray or pandas series.
-    :raises ValueError: If the document type is not recognized.
-    """
+    :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup`, `n_jobs` or the result cache are used, a copy is normalized instead.
+    :type copy: bool
 
-    i_func, o_type = io_get(doclist)
-    doclist = io_input_narray(doclist, i_func)
-    instance = _get_instance(doctype)
-    result = instance(doclist).parse(mask)
-    return io_output_narray(result, o_type)
+    :param output: Format of the results. "object" returns the documents with None where they are invalid or null. "fixed" and "bytes" return a fixed-width unicode or bytes numpy.ndarray, with an empty string where the document is invalid or null, and a boolean numpy.ndarray with the validity of each document; "arrow" returns a pyarrow.StringArray, null where the document is invalid or null. These formats never create Python strings.
+    :type output: Literal["object", "fixed", "bytes", "arrow"]
+
+    :return: Returns the extracted document(s) in the `output` format.
+    :rtype: Union[str, ndarray, Tuple[ndarray, ndarray]]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If the document type, `dedup` or `output` are not recognized, or the documents cannot be normalized in place.
+    """
+    return _get_validator(doctype).parse(doclist, mask, copy, output, dedup)
 
 
 def validate(
@@ -118,7 +105,13 @@ def validate(
         "email",
     ],
     lazy: bool = False,
-) -> Union[str, ndarray]:
+    n_jobs: int = 1,
+    executor: Literal["process", "thread"] = "process",
+    dedup: Union[bool, Literal["auto"]] = False,
+    out: Optional[ndarray] = None,
+    copy: bool = True,
+    output: Literal["bool", "bitmap", "invalid", "count"] = "bool",
+) -> Union[str, ndarray, ValidityCounts]:
     """
     Validates the document and returns True if the document is valid.
 
@@ -131,18 +124,33 @@ def validate(
     :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
     :type lazy: bool
 
-    :return: Returns the extracted document(s) as numpy.ndarray or str.
-    :rtype: Union[str, ndarray]
+    :param n_jobs: Number of workers used to validate large inputs, -1 means all CPUs.
+    :type n_jobs: int
 
-    :raises TypeError: If the type of the document(s) sent is not str, int, float, list, ndarray or pandas series.
-    :raises ValueError: If the document type is not recognized.
-    """
+    :param executor: Kind of worker used when `n_jobs` is not 1. "process" shares the documents with worker processes through shared memory; "thread" validates cache-sized chunks on a thread pool, avoiding the start-up and copy costs of processes for mid-sized batches.
+    :type executor: Literal["process", "thread"]
+
+    :param dedup: If True, processes only the unique documents and scatters the results back, which pays off on repetitive columns. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+    :type dedup: Union[bool, Literal["auto"]]
 
-    i_func, o_type = io_get(doclist)
-    doclist = io_input_narray(doclist, i_func)
-    instance = _get_instance(doctype)
-    result = instance(doclist).validate(lazy)
-    return io_output_narray(result, o_type)
+    :param out: A boolean numpy.ndarray, with one element per document, where the results are written and which is returned instead of a new array.
+    :type out: Optional[ndarray]
+
+    :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup`, `n_jobs` or the result cache are used, a copy is normalized instead.
+    :type copy: bool
+
+    :param output: Format of the results. "bool" returns one boolean per document; "bitmap" returns a uint8 numpy.ndarray with one bit per document, as returned by numpy.packbits; "invalid" returns the int64 indices of the invalid documents; "count" returns a ValidityCounts with the number of valid and invalid documents. Null inputs (pandas and Arrow nulls, masked values, NaN and None) are not validated: with "bool" they are masked in numpy outputs and null in Arrow outputs, and the compact formats report them as invalid.
+    :type output: Literal["bool", "bitmap", "invalid", "count"]
+
+    :return: Returns the validation results in the `output` format.
+    :rtype: Union[str, ndarray, ValidityCounts]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If the document type is not recognized, `n_jobs`, `executor`, `dedup`, `out` or `output` are not valid, or the documents cannot be normalized in place.
+    """
+    return _get_validator(doctype).validate(
+        doclist, lazy, out, copy, output, n_jobs, executor, dedup
+    )
 
 
 def get_attribute(
@@ -161,7 +169,11 @@ def get_attribute(
     ],
     attr: AttributeStr,
     lazy: bool = False,
-) -> Union[str, ndarray]:
+    dedup: Union[bool, Literal["auto"]] = False,
+    out: Optional[ndarray] = None,
+    copy: bool = True,
+    output: Literal["object", "fixed", "bytes", "arrow"] = "object",
+) -> Union[str, ndarray, Tuple[ndarray, ndarray]]:
     """
     Collects an attribute from the document if it is valid.
 
@@ -177,15 +189,24 @@ def get_attribute(
     :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
     :type lazy: bool
 
-    :return: Returns the extracted document(s) as numpy.ndarray or str.
-    :rtype: Union[str, ndarray]
+    :param dedup: If True, processes only the unique documents and scatters the results back, which pays off on repetitive columns. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+    :type dedup: Union[bool, Literal["auto"]]
 
-    :raises TypeError: If the type of the document(s) sent is not str, int, float, list, ndarray or pandas series.
-    :raises ValueError: If the document type is not recognized.
-    """
+    :param out: A numpy.ndarray, with one element per document, where the attributes are written and which is returned instead of a new array. Invalid documents are written as their null value.
+    :type out: Optional[ndarray]
+
+    :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup`, `n_jobs` or the result cache are used, a copy is normalized instead.
+    :type copy: bool
+
+    :param output: Format of the results. "object" returns the attributes with None where they are invalid or null. "fixed" and "bytes" return a fixed-width unicode or bytes numpy.ndarray, with an empty string where the document is invalid or null, and a boolean numpy.ndarray with the validity of each document; with `out`, the values are written into it; "arrow", which does not take `out`, returns a pyarrow.StringArray, null where the document is invalid or null. These formats never create Python strings.
+    :type output: Literal["object", "fixed", "bytes", "arrow"]
 
-    i_func, o_type = io_get(doclist)
-    doclist = io_input_narray(doclist, i_func)
-    instance = _get_instance(doctype)
-    result = instance(doclist).get_attribute(attr, lazy)
-    return io_output_narray(result, o_type)
+    :return: Returns the collected attribute(s) in the `output` format.
+    :rtype: Union[str, ndarray, Tuple[ndarray, ndarray]]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If the document type, `dedup`, `out` or `output` are not valid, or the documents cannot be normalized in place.
+    """
+    return _get_validator(doctype).get_attribute(
+        doclist, attr, lazy, out, copy, output, dedup
+    )
@@ -0,0 +1,230 @@
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from numpy import (
+    ma,
+    ndarray,
+)
+
+from docbr.api.validator import (
+    Validator,
+    _output_nulls,
+)
+from docbr.core._io import (
+    io_expand,
+    io_output_narray,
+)
+from docbr.core._parallel import (
+    resolve_n_jobs,
+    run_threads,
+)
+
+FRAME_OPERATIONS = ["validate", "parse"]
+
+
+def _plan(
+    columns: Dict[
+        str,
+        Literal[
+            "cnpj",
+            "cpf",
+            "cnh",
+            "te",
+            "pis",
+            "cert",
+            "rnvam",
+            "placa",
+            "tfone",
+            "email",
+        ],
+    ],
+    ops: Union[str, Sequence[str], Dict[str, Sequence[str]]],
+) -> List[Tuple[str, str, str, Validator]]:
+    """
+    Plans the operations of every column: each operation becomes a task, named after its result column, with a single compiled validator per document type.
+
+    :param columns: The document type of each column to be processed.
+    :type columns: Dict[str, Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]]
+
+    :param ops: The operations of every column, or of each column, where the columns left out are validated.
+    :type ops: Union[str, Sequence[str], Dict[str, Sequence[str]]]
+
+    :return: The result name, column, operation and validator of each task.
+    :rtype: List[Tuple[str, str, str, Validator]]
+
+    :raises ValueError: If a document type or an operation is not recognized.
+    """
+    validators: Dict[str, Validator] = {}
+    tasks = []
+
+    for column, doctype in columns.items():
+        if doctype not in validators:
+            validators[doctype] = Validator(doctype)
+        validator = validators[doctype]
+
+        column_ops = (
+            ops.get(column, "validate") if isinstance(ops, dict) else ops
+        )
+        if isinstance(column_ops, str):
+            column_ops = [column_ops]
+
+        for op in column_ops:
+            if (
+                op not in FRAME_OPERATIONS
+                and op not in validator._spec._attributes
+            ):
+                raise ValueError(
+                    f'Operation "{op}" not found for column "{column}", '
+                    f"must be one of {FRAME_OPERATIONS} or an attribute of "
+                    f"{doctype}"
+                )
+            name = column if len(column_ops) == 1 else f"{column}_{op}"
+            tasks.append((name, column, op, validator))
+
+    return tasks
+
+
+def _run_task(
+    validator: Validator,
+    op: str,
+    prepared: Tuple[ndarray, type, Any],
+    lazy: bool,
+    mask: bool,
+) -> Any:
+    """
+    Runs one operation on the documents of a column. Runs inside the worker threads, where the validator reuses the scratch buffers of the thread across columns.
+
+    :param validator: The validator of the document type of the column.
+    :type validator: Validator
+
+    :param op: The operation: "validate", "parse" or the name of an attribute.
+    :type op: str
+
+    :param prepared: The documents with a value, the output type and the null mask of the column.
+    :type prepared: Tuple[ndarray, type, Any]
+
+    :param lazy: Whether or not to skip the extraction of the documents before validating or collecting attributes.
+    :type lazy: bool
+
+    :param mask: Whether or not to add a mask on the parsed documents.
+    :type mask: bool
+
+    :return: The results of the operation.
+    :rtype: Any
+    """
+    doclist, o_type, nulls = prepared
+
+    if op == "validate":
+        result = validator._bind(doclist, True, True).validate(lazy)
+        return io_output_narray(io_expand(result, nulls), o_type, nulls, nulls)
+
+    if op == "parse":
+        engine = validator._bind(doclist, True, True)
+        result = engine.parse(mask)
+    else:
+        engine = validator._bind(doclist, False, True)
+        result = engine.get_attribute(op, lazy)
+    valid = io_expand(engine._is_valid, nulls)
+    return io_output_narray(
+        io_expand(result, nulls), o_type, _output_nulls(valid, nulls)
+    )
+
+
+def validate_frame(
+    data: Any,
+    columns: Dict[
+        str,
+        Literal[
+            "cnpj",
+            "cpf",
+            "cnh",
+            "te",
+            "pis",
+            "cert",
+            "rnvam",
+            "placa",
+            "tfone",
+            "email",
+        ],
+    ],
+    ops: Union[str, Sequence[str], Dict[str, Sequence[str]]] = "validate",
+    lazy: bool = False,
+    mask: bool = False,
+    n_jobs: int = -1,
+) -> Any:
+    """
+    Processes several document columns of a table in a single call.
+
+    All the columns are planned together: each column is converted once, each document type is compiled once, and the operations of every column are run concurrently by at most `n_jobs` threads of the shared thread pool, where each thread reuses its normalization buffers from one column to the next.
+
+    The result has one column per operation, named after the input column when it has a single operation and as "<column>_<operation>" otherwise. A pandas DataFrame gives a DataFrame with the same index; a dictionary of columns gives a dictionary. Null values are not processed: their validations are missing values, a nullable boolean column in a DataFrame, and their extractions are None.
+
+    :param data: The table with the documents, a pandas DataFrame or a dictionary of columns in any format accepted by `validate`.
+    :type data: Any
+
+    :param columns: The document type of each column to be processed.
+    :type columns: Dict[str, Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]]
+
+    :param ops: The operations to run, "validate", "parse" or the name of an attribute, for every column or, as a dictionary, for each column, where the columns left out are validated.
+    :type ops: Union[str, Sequence[str], Dict[str, Sequence[str]]]
+
+    :param lazy: If True, does not perform the extraction of the documents before validating or collecting attributes.
+    :type lazy: bool
+
+    :param mask: If True, adds a mask on the parsed documents.
+    :type mask: bool
+
+    :param n_jobs: Number of threads, -1 means all CPUs.
+    :type n_jobs: int
+
+    :return: The results, as a pandas DataFrame or a dictionary of columns.
+    :rtype: Any
+
+    :raises TypeError: If the type of a column is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If a document type, an operation or `n_jobs` are not valid.
+    """
+
+    n_jobs = resolve_n_jobs(n_jobs)
+    tasks = _plan(columns, ops)
+
+    prepared = {}
+    for _, column, _, validator in tasks:
+        if column not in prepared:
+            prepared[column] = validator._prepare(data[column])
+
+    if n_jobs == 1 or len(tasks) <= 1:
+        results = {
+            name: _run_task(validator, op, prepared[column], lazy, mask)
+            for name, column, op, validator in tasks
+        }
+    else:
+        # the largest columns are started first, so that the longest tasks
+        # do not start last
+        ordered = sorted(tasks, key=lambda task: -len(prepared[task[1]][0]))
+        outputs = run_threads(
+            lambda task: _run_task(
+                task[3], task[2], prepared[task[1]], lazy, mask
+            ),
+            ordered,
+            n_jobs,
+        )
+        done = {task[0]: output for task, output in zip(ordered, outputs)}
+        results = {name: done[name] for name, *_ in tasks}
+
+    if hasattr(data, "columns") and hasattr(data, "index"):
+        # masked validations become nullable boolean columns
+        return type(data)(results, index=data.index).astype(
+            {
+                name: "boolean"
+                for name, result in results.items()
+                if isinstance(result, ma.MaskedArray)
+            }
+        )
+    return results
@@ -0,0 +1,67 @@
+from typing import (
+    Literal,
+    Optional,
+)
+
+from numpy import (
+    ndarray,
+    zeros,
+)
+from numpy.random import default_rng
+
+from docbr.api.validator import _get_instance
+from docbr.core._generator import generate_documents
+
+
+def generate(
+    n: int,
+    doctype: Literal[
+        "cnpj",
+        "cpf",
+        "cnh",
+        "te",
+        "pis",
+        "cert",
+        "rnvam",
+        "placa",
+        "tfone",
+        "email",
+    ],
+    mask: bool = False,
+    invalid_ratio: float = 0.0,
+    seed: Optional[int] = None,
+) -> ndarray:
+    """
+    Generates random documents, valid or deliberately invalid, to be used in tests and benchmarks.
+
+    :param n: Number of documents to be generated.
+    :type n: int
+
+    :param doctype: Type of document to be generated, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]
+
+    :param mask: If True, adds a mask on the documents.
+    :type mask: bool
+
+    :param invalid_ratio: Share of the documents, between 0 and 1, that must be invalid. The invalid documents are spread randomly.
+    :type invalid_ratio: float
+
+    :param seed: Seed of the random number generator, used to generate the same documents again.
+    :type seed: Optional[int]
+
+    :return: Returns the generated documents as numpy.ndarray.
+    :rtype: ndarray
+
+    :raises ValueError: If the document type is not recognized, `n` is negative or `invalid_ratio` is not between 0 and 1.
+    """
+
+    if n < 0:
+        raise ValueError("n must not be negative")
+    if not 0 <= invalid_ratio <= 1:
+        raise ValueError("invalid_ratio must be between 0 and 1")
+
+    instance = _get_instance(doctype)
+    rng = default_rng(seed)
+    invalid = zeros(n, dtype=bool)
+    invalid[rng.permutation(n)[: round(n * invalid_ratio)]] = True
+    return generate_documents(instance, n, mask, invalid, rng)
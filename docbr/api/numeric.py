@@ -0,0 +1,31 @@
+from typing import Any
+
+from numpy import ndarray
+
+from docbr.core._io import (
+    io_get,
+    io_input_narray,
+)
+from docbr.core._utils import numeric_to_integer
+
+
+def normalize_numeric(doclist: Any) -> ndarray:
+    """
+    Restores documents that spreadsheets turned into numbers, so they can be sent to `validate`, `parse` or `get_attribute`.
+
+    Float input is converted into the exact integers it holds, whose digits are then extracted arithmetically; floats past 2 ** 53, where float64 stops holding every integer, are flagged as 0, which is never a valid document. Strings with a ".0" suffix ("12345678901.0") or in exponent notation ("1.2345678901E+10") are parsed in bulk and rewritten as the integer they denote, while the other strings, masked documents included, are kept as they are. When every string is a number, the result is an array of integers.
+
+    :param doclist: Document(s) to be normalized.
+    :type doclist: Any
+
+    :return: Returns the normalized documents as a numpy.ndarray of integers or strings.
+    :rtype: ndarray
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    """
+
+    i_func, _ = io_get(doclist)
+    doclist = io_input_narray(doclist, i_func)
+    if doclist.dtype.kind in "SU":
+        doclist = numeric_to_integer(doclist)
+    return doclist
@@ -0,0 +1,152 @@
+from typing import (
+    Any,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from numpy import (
+    argsort,
+    asarray,
+    empty,
+    flatnonzero,
+    ndarray,
+    split,
+    zeros,
+)
+
+from docbr.api.validator import (
+    _get_instance,
+    _make_engine,
+    _output_nulls,
+)
+from docbr.core._io import (
+    io_compact,
+    io_expand,
+    io_get,
+    io_input_narray,
+    io_null_mask,
+    io_output_narray,
+)
+from docbr.core._profile import (
+    end_stage,
+    start_stage,
+)
+
+
+def _groups(
+    doctypes: Any, size: int, nulls: Optional[ndarray]
+) -> Iterator[Tuple[Any, ndarray]]:
+    """
+    Partitions the rows of a batch of records by document type, with a single stable sort of the document types. The records with a null document are left out.
+
+    :param doctypes: The document type of each record.
+    :type doctypes: Any
+
+    :param size: The number of records.
+    :type size: int
+
+    :param nulls: A boolean numpy.ndarray that is True where the document is null.
+    :type nulls: Optional[ndarray]
+
+    :return: The engine of each document type and the rows of its records among the records with a document, in their original order.
+    :rtype: Iterator[Tuple[Union[Type[CheckDigit], Type[RegExr]], ndarray]]
+
+    :raises ValueError: If the number of document types is not the number of records, or a document type is not recognized.
+    """
+    doctypes = asarray(doctypes, dtype=str).ravel()
+    if len(doctypes) != size:
+        raise ValueError(
+            f"doctypes must have one element per document: expected {size}, "
+            f"got {len(doctypes)}"
+        )
+    doctypes = io_compact(doctypes, nulls)
+
+    order = argsort(doctypes, kind="stable")
+    codes = doctypes[order]
+    bounds = flatnonzero(codes[1:] != codes[:-1]) + 1
+    groups = [rows for rows in split(order, bounds) if len(rows)]
+    engines = [_get_instance(str(doctypes[rows[0]])) for rows in groups]
+    return zip(engines, groups)
+
+
+def validate_records(
+    doclist: Any, doctypes: Any, lazy: bool = False
+) -> Union[bool, ndarray]:
+    """
+    Validates a batch of records of mixed document types and returns True for each valid document.
+
+    The records are partitioned by document type with a single stable sort, each group is validated by its engine in one vectorized call and the results are scattered back into the original order.
+
+    :param doclist: Document(s) to be validated.
+    :type doclist: Any
+
+    :param doctypes: The document type of each document, with the same length as `doclist`, each one of: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctypes: Any
+
+    :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
+    :type lazy: bool
+
+    :return: Returns True or False as numpy.ndarray or bool, masked where the document is null.
+    :rtype: Union[bool, ndarray]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If `doctypes` does not have one element per document or a document type is not recognized.
+    """
+
+    start = start_stage()
+    i_func, o_type = io_get(doclist)
+    nulls = io_null_mask(doclist)
+    doclist = io_input_narray(io_compact(doclist, nulls), i_func)
+    end_stage(start, "records", "io_input", doclist)
+
+    size = len(doclist if nulls is None else nulls)
+    valid = zeros(len(doclist), dtype=bool)
+    for instance, rows in _groups(doctypes, size, nulls):
+        engine = _make_engine(instance, doclist[rows], True)
+        valid[rows] = engine.validate(lazy)
+
+    return io_output_narray(io_expand(valid, nulls), o_type, nulls, nulls)
+
+
+def parse_records(
+    doclist: Any, doctypes: Any, mask: bool = False
+) -> Union[str, ndarray]:
+    """
+    Extracts a batch of records of mixed document types and returns their corrected values.
+
+    The records are partitioned by document type with a single stable sort, each group is extracted by its engine in one vectorized call and the results are scattered back into the original order.
+
+    :param doclist: Document(s) to be extracted.
+    :type doclist: Any
+
+    :param doctypes: The document type of each document, with the same length as `doclist`, each one of: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctypes: Any
+
+    :param mask: If True, adds a mask on the document.
+    :type mask: bool
+
+    :return: Returns the extracted document(s) as numpy.ndarray or str.
+    :rtype: Union[str, ndarray]
+
+    :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+    :raises ValueError: If `doctypes` does not have one element per document or a document type is not recognized.
+    """
+
+    start = start_stage()
+    i_func, o_type = io_get(doclist)
+    nulls = io_null_mask(doclist)
+    doclist = io_input_narray(io_compact(doclist, nulls), i_func)
+    end_stage(start, "records", "io_input", doclist)
+
+    size = len(doclist if nulls is None else nulls)
+    result = empty(len(doclist), dtype=object)
+    valid = zeros(len(doclist), dtype=bool)
+    for instance, rows in _groups(doctypes, size, nulls):
+        engine = _make_engine(instance, doclist[rows], True)
+        result[rows] = engine.parse(mask)
+        valid[rows] = engine._is_valid
+
+    result, valid = io_expand(result, nulls), io_expand(valid, nulls)
+    return io_output_narray(result, o_type, _output_nulls(valid, nulls))
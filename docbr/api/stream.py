@@ -0,0 +1,240 @@
+from typing import (
+    Any,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Union,
+)
+
+from numpy import ndarray
+
+from docbr.api.facade import (
+    get_attribute,
+    parse,
+    validate,
+)
+from docbr.attributes import AttributeStr
+from docbr.core._io import ValidityCounts
+
+
+def _is_row(item: Any) -> bool:
+    """
+    Checks whether an item is a single-column row, as yielded by database cursors.
+    """
+    return isinstance(item, tuple) and len(item) == 1
+
+
+def _unpack_row(row: Any) -> Any:
+    """
+    Returns the value of a single-column row of a batch of rows.
+
+    :raises TypeError: If the row has more than one column.
+    """
+    if isinstance(row, tuple):
+        if len(row) != 1:
+            raise TypeError(
+                f"rows must have a single column, not {len(row)} columns"
+            )
+        return row[0]
+    return row
+
+
+def iter_chunks(doclist: Iterable[Any], chunk_size: int) -> Iterator[Any]:
+    """
+    Groups an iterable of documents into chunks of at most `chunk_size` documents.
+
+    The iterable may yield single documents (str, bytes, int, float) or single-column rows (tuples of one document, as yielded by database cursors), which are buffered into lists, or whole chunks (list, tuple, numpy.ndarray, pandas.Series), which are sliced without copying when larger than `chunk_size`. Lists of rows, as returned by `fetchmany`, are unpacked and buffered like single rows. The order of the documents is preserved.
+
+    :param doclist: An iterable or iterator of documents, rows or chunks of documents.
+    :type doclist: Iterable[Any]
+
+    :param chunk_size: The maximum number of documents per chunk.
+    :type chunk_size: int
+
+    :return: An iterator over the chunks.
+    :rtype: Iterator[Any]
+
+    :raises TypeError: If `doclist` is a single document instead of an iterable of documents, or a batch contains rows of more than one column.
+    :raises ValueError: If `chunk_size` is lower than 1.
+    """
+    if isinstance(doclist, (str, bytes)) or not isinstance(doclist, Iterable):
+        raise TypeError(
+            f"doclist must be an iterable of documents, not {type(doclist)}"
+        )
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+
+    pending: List[Any] = []
+    for item in doclist:
+        if isinstance(item, list) and item and _is_row(item[0]):
+            # a batch of rows, as returned by fetchmany
+            docs = [_unpack_row(row) for row in item]
+        elif _is_row(item):
+            docs = [item[0]]
+        elif isinstance(item, (str, bytes)) or not isinstance(item, Iterable):
+            docs = [item]
+        else:
+            if pending:
+                yield pending
+                pending = []
+
+            if isinstance(item, tuple):
+                item = list(item)
+            for start in range(0, len(item), chunk_size):
+                yield item[start : start + chunk_size]
+            continue
+
+        for doc in docs:
+            pending.append(doc)
+            if len(pending) == chunk_size:
+                yield pending
+                pending = []
+
+    if pending:
+        yield pending
+
+
+def parse_iter(
+    doclist: Iterable[Any],
+    doctype: Literal[
+        "cnpj",
+        "cpf",
+        "cnh",
+        "te",
+        "pis",
+        "cert",
+        "rnvam",
+        "placa",
+        "tfone",
+        "email",
+    ],
+    mask: bool = False,
+    chunk_size: int = 65536,
+) -> Iterator[Union[ndarray, Any]]:
+    """
+    Extracts documents from an iterable chunk by chunk and yields their corrected values.
+
+    Peak memory depends on `chunk_size` and not on the number of documents, so it can consume database cursors, files or any other iterator of unbounded size.
+
+    :param doclist: An iterable or iterator of documents, single-column rows or chunks of documents (list, tuple, numpy.ndarray or pandas.Series).
+    :type doclist: Iterable[Any]
+
+    :param doctype: Type of document to be extracted, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]
+
+    :param mask: If True, adds a mask on the document.
+    :type mask: bool
+
+    :param chunk_size: The maximum number of documents processed at once.
+    :type chunk_size: int
+
+    :return: An iterator over the extracted documents of each chunk, as numpy.ndarray.
+    :rtype: Iterator[Union[ndarray, pyarrow.Array]]
+
+    :raises TypeError: If `doclist` is not an iterable or contains types that are not supported.
+    :raises ValueError: If the document type is not recognized.
+    """
+    for chunk in iter_chunks(doclist, chunk_size):
+        yield parse(chunk, doctype, mask)
+
+
+def validate_iter(
+    doclist: Iterable[Any],
+    doctype: Literal[
+        "cnpj",
+        "cpf",
+        "cnh",
+        "te",
+        "pis",
+        "cert",
+        "rnvam",
+        "placa",
+        "tfone",
+        "email",
+    ],
+    lazy: bool = False,
+    chunk_size: int = 65536,
+    output: Literal["bool", "bitmap", "invalid", "count"] = "bool",
+) -> Iterator[Union[ndarray, ValidityCounts, Any]]:
+    """
+    Validates documents from an iterable chunk by chunk and yields the results.
+
+    Peak memory depends on `chunk_size` and not on the number of documents, so it can consume database cursors, files or any other iterator of unbounded size.
+
+    :param doclist: An iterable or iterator of documents, single-column rows or chunks of documents (list, tuple, numpy.ndarray or pandas.Series).
+    :type doclist: Iterable[Any]
+
+    :param doctype: Type of document to be validated, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]
+
+    :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
+    :type lazy: bool
+
+    :param chunk_size: The maximum number of documents processed at once.
+    :type chunk_size: int
+
+    :param output: Format of the results of each chunk, as in `validate`. The indices yielded with "invalid" are positions in the whole iterable, not in the chunk.
+    :type output: Literal["bool", "bitmap", "invalid", "count"]
+
+    :return: An iterator over the validation results of each chunk.
+    :rtype: Iterator[Union[ndarray, ValidityCounts, pyarrow.Array]]
+
+    :raises TypeError: If `doclist` is not an iterable or contains types that are not supported.
+    :raises ValueError: If the document type or `output` are not recognized.
+    """
+    offset = 0
+    for chunk in iter_chunks(doclist, chunk_size):
+        result = validate(chunk, doctype, lazy, output=output)
+        if isinstance(result, ndarray) and output == "invalid":
+            result += offset
+        offset += len(chunk)
+        yield result
+
+
+def get_attribute_iter(
+    doclist: Iterable[Any],
+    doctype: Literal[
+        "cnpj",
+        "cpf",
+        "cnh",
+        "te",
+        "pis",
+        "cert",
+        "rnvam",
+        "placa",
+        "tfone",
+        "email",
+    ],
+    attr: AttributeStr,
+    lazy: bool = False,
+    chunk_size: int = 65536,
+) -> Iterator[Union[ndarray, Any]]:
+    """
+    Collects an attribute from documents of an iterable chunk by chunk and yields the results.
+
+    Peak memory depends on `chunk_size` and not on the number of documents, so it can consume database cursors, files or any other iterator of unbounded size.
+
+    :param doclist: An iterable or iterator of documents, single-column rows or chunks of documents (list, tuple, numpy.ndarray or pandas.Series).
+    :type doclist: Iterable[Any]
+
+    :param doctype: Type of document to be extracted, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]
+
+    :param attr: Document attribute, must be one of the document class attributes.
+    :type attr: AttributeStr
+
+    :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
+    :type lazy: bool
+
+    :param chunk_size: The maximum number of documents processed at once.
+    :type chunk_size: int
+
+    :return: An iterator over the collected attributes of each chunk, as numpy.ndarray.
+    :rtype: Iterator[Union[ndarray, pyarrow.Array]]
+
+    :raises TypeError: If `doclist` is not an iterable or contains types that are not supported.
+    :raises ValueError: If the document type is not recognized.
+    """
+    for chunk in iter_chunks(doclist, chunk_size):
+        yield get_attribute(chunk, doctype, attr, lazy)
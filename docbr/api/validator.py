@@ -0,0 +1,598 @@
+from re import compile
+from threading import local
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Literal,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from numpy import (
+    array,
+    bool_,
+    copyto,
+    empty,
+    ndarray,
+)
+
+from docbr.attributes import AttributeStr
+from docbr.core._cache import cached_results
+from docbr.core._dedup import deduplicate
+from docbr.core._io import (
+    PARSE_OUTPUTS,
+    VALIDITY_OUTPUTS,
+    ValidityCounts,
+    io_compact,
+    io_expand,
+    io_get,
+    io_input_narray,
+    io_null_mask,
+    io_output_narray,
+    io_output_strings,
+    io_output_validity,
+)
+from docbr.core._parallel import (
+    validate_processes,
+    validate_threads,
+)
+from docbr.core._profile import (
+    end_stage,
+    start_stage,
+)
+from docbr.core.checkdigit._template import CheckDigit
+from docbr.core.checkdigit.documents import (
+    CNH,
+    CNPJ,
+    CPF,
+    PIS,
+    Certidao,
+    Renavam,
+    TituloEleitor,
+)
+from docbr.core.regexp._template import RegExr
+from docbr.core.regexp.documents import (
+    CarPlate,
+    Email,
+    Phone,
+)
+
+
+def _get_instance(doctype: str) -> Type[Union[CheckDigit, RegExr]]:
+    """
+    Return the class that validates documents based on the input `doctype`.
+
+    :param doctype: A string representing the type of document to be validated.
+    :type doctype: str
+
+    :return: The appropriate validation class based on `doctype`.
+    :rtype: Type[Union[CheckDigit, RegExr]]
+
+    :raises ValueError: If `doctype` is not one of the supported document types.
+    """
+    classes: Dict[str, Type[Union[CheckDigit, RegExr]]] = {
+        "cpf": CPF,
+        "cnpj": CNPJ,
+        "cnh": CNH,
+        "te": TituloEleitor,
+        "pis": PIS,
+        "cert": Certidao,
+        "rnvam": Renavam,
+        "placa": CarPlate,
+        "tfone": Phone,
+        "email": Email,
+    }
+    if doctype not in classes:
+        raise ValueError(
+            f"doctype must be one of the following: {list(classes.keys())}"
+        )
+    return classes[doctype]
+
+
+def _scatter(result: ndarray, inverse: Optional[ndarray]) -> ndarray:
+    """
+    Scatters the results computed on unique documents back to the original rows.
+
+    :param result: The results of the unique documents.
+    :type result: ndarray
+
+    :param inverse: The inverse indices returned by the deduplication, or None if the documents were not deduplicated.
+    :type inverse: Optional[ndarray]
+
+    :return: The results of every original document.
+    :rtype: ndarray
+    """
+    if inverse is None:
+        return result
+    return result[inverse]
+
+
+def _output_nulls(valid: ndarray, nulls: Optional[ndarray]) -> ndarray:
+    """
+    Returns a boolean numpy.ndarray marking the output values that must be null: the invalid documents and the null inputs.
+
+    :param valid: A boolean numpy.ndarray that is True where the document is valid.
+    :type valid: ndarray
+
+    :param nulls: A boolean numpy.ndarray that is True where the input is null.
+    :type nulls: Optional[ndarray]
+
+    :return: A numpy.ndarray that is True where the output must be null.
+    :rtype: ndarray
+    """
+    invalid = ~valid
+    if nulls is not None:
+        invalid |= nulls
+    return invalid
+
+
+def _check_in_place(doclist: Any, copy: bool) -> None:
+    """
+    Checks that the documents can be normalized in place when `copy` is False.
+
+    :param doclist: Document(s) sent by the caller.
+    :type doclist: Any
+
+    :param copy: If False, the documents must be normalized in place.
+    :type copy: bool
+
+    :raises ValueError: If `copy` is False and the documents are not a writable one-dimensional numpy.ndarray of fixed-width strings.
+    """
+    if copy:
+        return
+    if not (
+        isinstance(doclist, ndarray)
+        and doclist.ndim == 1
+        and doclist.dtype.kind in "SU"
+        and doclist.flags.writeable
+    ):
+        raise ValueError(
+            "copy=False requires a writable one-dimensional numpy.ndarray "
+            "of fixed-width strings"
+        )
+
+
+def _check_out(out: Optional[ndarray], size: int, dtype: Any = None) -> None:
+    """
+    Checks that an output buffer can hold the results of `size` documents.
+
+    :param out: The output buffer, or None.
+    :type out: Optional[ndarray]
+
+    :param size: The number of documents.
+    :type size: int
+
+    :param dtype: The type required for the output buffer, or None to accept any type.
+    :type dtype: Any
+
+    :raises ValueError: If `out` is not a numpy.ndarray with one element per document and the required type.
+    """
+    if out is None:
+        return
+    if not isinstance(out, ndarray) or out.shape != (size,):
+        raise ValueError(f"out must be a numpy.ndarray with shape ({size},)")
+    if dtype is not None and out.dtype != dtype:
+        raise ValueError(f"out must be a numpy.ndarray of {dtype.__name__}")
+
+
+def _write_out(result: ndarray, out: Optional[ndarray]) -> ndarray:
+    """
+    Writes the results into the output buffer, if any.
+
+    :param result: The results.
+    :type result: ndarray
+
+    :param out: The output buffer, or None.
+    :type out: Optional[ndarray]
+
+    :return: The output buffer, or the results if there is no output buffer.
+    :rtype: ndarray
+    """
+    if out is None or result is out:
+        return result
+    copyto(out, result)
+    return out
+
+
+def _make_engine(
+    instance: Type[Union[CheckDigit, RegExr]],
+    docs: ndarray,
+    copy: bool,
+    fixed_width: bool = False,
+) -> Union[CheckDigit, RegExr]:
+    """
+    Creates the engine that processes the documents.
+
+    :param instance: The class that validates the document type.
+    :type instance: Type[Union[CheckDigit, RegExr]]
+
+    :param docs: The documents.
+    :type docs: ndarray
+
+    :param copy: If False, the check digit documents are normalized in place.
+    :type copy: bool
+
+    :param fixed_width: If True, the parsed documents and collected attributes are kept as fixed-width strings, empty where the document is invalid.
+    :type fixed_width: bool
+
+    :return: The engine.
+    :rtype: Union[CheckDigit, RegExr]
+    """
+    engine = instance(docs)
+    if not copy and isinstance(engine, CheckDigit):
+        engine._in_place = True
+    engine._fixed_width = fixed_width
+    return engine
+
+
+class Validator:
+    """
+    A reusable validator of a single document type.
+
+    The document specification (weights, masks, lookup tables and regular expression) is compiled once, when the validator is created, into read-only state. The `validate`, `parse` and `get_attribute` methods keep no state between calls, so a single validator can be shared by many threads.
+
+    :param doctype: Type of document, can be: cnpj, cpf, cnh, te, pis, cert, rnvam, placa, tfone, email.
+    :type doctype: Literal["cnpj", "cpf", "cnh", "te", "pis", "cert", "rnvam", "placa", "tfone", "email"]
+
+    :param reuse_buffers: If True, each thread keeps the intermediate matrices of its last batch and reuses them when the next batch has the same size, instead of allocating them again.
+    :type reuse_buffers: bool
+
+    :raises ValueError: If the document type is not recognized.
+    """
+
+    def __init__(
+        self,
+        doctype: Literal[
+            "cnpj",
+            "cpf",
+            "cnh",
+            "te",
+            "pis",
+            "cert",
+            "rnvam",
+            "placa",
+            "tfone",
+            "email",
+        ],
+        reuse_buffers: bool = True,
+    ) -> None:
+        self.doctype = doctype
+        self.reuse_buffers = reuse_buffers
+        self._engine = _get_instance(doctype)
+        self._spec = self._engine(array([], dtype=str))
+        self._local = local()
+
+        if isinstance(self._spec, CheckDigit):
+            self._spec._compile_sequence()
+        if isinstance(self._spec, RegExr):
+            self._spec._pattern = compile(self._spec._pattern)
+        for value in vars(self._spec).values():
+            if isinstance(value, ndarray):
+                value.flags.writeable = False
+
+    def __repr__(self) -> str:
+        return f"Validator({self.doctype!r})"
+
+    def _scratch(self) -> Optional[Dict[str, ndarray]]:
+        """
+        Returns the scratch buffers of the current thread.
+
+        :return: The scratch buffers, or None if `reuse_buffers` is False.
+        :rtype: Optional[Dict[str, numpy.ndarray]]
+        """
+        if not self.reuse_buffers:
+            return None
+        if not hasattr(self._local, "scratch"):
+            self._local.scratch = {}
+        return self._local.scratch
+
+    def _bind(self, doclist: ndarray, scratch: bool, copy: bool) -> Any:
+        """
+        Creates the engine that processes a batch of documents.
+
+        :param doclist: The documents.
+        :type doclist: numpy.ndarray
+
+        :param scratch: Whether or not the engine may use the scratch buffers of the current thread.
+        :type scratch: bool
+
+        :param copy: If False, the check digit documents are normalized in place.
+        :type copy: bool
+
+        :return: The engine.
+        :rtype: Union[CheckDigit, RegExr]
+        """
+        engine = self._spec._bind(doclist, self._scratch() if scratch else None)
+        if not copy and isinstance(engine, CheckDigit):
+            engine._in_place = True
+        return engine
+
+    def _normalizer(self, lazy: bool) -> Optional[Callable[[ndarray], ndarray]]:
+        """
+        Returns the function that normalizes the documents into result cache keys.
+
+        The check digit documents are fitted to their digits, which every operation that is not lazy starts with, so their spellings share one entry. The regular expressions search the raw text, and lazy operations read it as it is, so their documents are not normalized.
+
+        :param lazy: Whether or not the operation skips the fitting of the documents.
+        :type lazy: bool
+
+        :return: The normalizing function, or None if the documents are kept as they are.
+        :rtype: Optional[Callable[[ndarray], ndarray]]
+        """
+        if lazy or not isinstance(self._spec, CheckDigit):
+            return None
+        spec = self._spec
+
+        def normalize(docs: ndarray) -> ndarray:
+            engine = spec._bind(docs)
+            engine._fit_documents()
+            return engine._documents
+
+        return normalize
+
+    def _target(
+        self, out: Optional[ndarray], output: str, size: int
+    ) -> Optional[ndarray]:
+        """
+        Returns the array where the engine writes the validity of `size` documents: `out` when it holds exactly these documents, or, with a compact output format, a scratch buffer of the current thread.
+
+        :param out: The output buffer sent by the caller, or None.
+        :type out: Optional[ndarray]
+
+        :param output: The output format.
+        :type output: str
+
+        :param size: The number of documents validated by the engine.
+        :type size: int
+
+        :return: The array, or None to let the engine create it.
+        :rtype: Optional[ndarray]
+        """
+        if out is not None:
+            return out if len(out) == size else None
+
+        scratch = self._scratch()
+        if output == "bool" or scratch is None:
+            return None
+        target = scratch.get("valid")
+        if target is None or len(target) != size:
+            target = scratch["valid"] = empty(size, dtype=bool)
+        return target
+
+    def _prepare(self, doclist: Any) -> Tuple[ndarray, type, Any]:
+        """
+        Converts the documents into a numpy.ndarray.
+
+        :param doclist: Document(s) to be processed.
+        :type doclist: Any
+
+        :return: The documents with a value, the output type and the null mask of the input.
+        :rtype: Tuple[ndarray, type, Any]
+        """
+        start = start_stage()
+        i_func, o_type = io_get(doclist)
+        nulls = io_null_mask(doclist)
+        doclist = io_input_narray(io_compact(doclist, nulls), i_func)
+        end_stage(start, self._engine.__name__, "io_input", doclist)
+        return doclist, o_type, nulls
+
+    def validate(
+        self,
+        doclist: Any,
+        lazy: bool = False,
+        out: Optional[ndarray] = None,
+        copy: bool = True,
+        output: Literal["bool", "bitmap", "invalid", "count"] = "bool",
+        n_jobs: int = 1,
+        executor: Literal["process", "thread"] = "process",
+        dedup: Union[bool, Literal["auto"]] = False,
+    ) -> Union[str, ndarray, ValidityCounts]:
+        """
+        Validates the document and returns True if the document is valid.
+
+        :param doclist: Document(s) to be validated.
+        :type doclist: Any
+
+        :param lazy: If True, does not perform the extraction of the document, just returns True or False directly on the conceived value.
+        :type lazy: bool
+
+        :param out: A boolean numpy.ndarray, with one element per document, where the results are written and which is returned instead of a new array.
+        :type out: Optional[ndarray]
+
+        :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup`, `n_jobs` or the result cache are used, a copy is normalized instead.
+        :type copy: bool
+
+        :param output: Format of the results: "bool", "bitmap" (numpy.packbits of the results), "invalid" (int64 indices of the invalid documents) or "count" (a ValidityCounts). Null inputs are not validated: with "bool" they are masked in numpy outputs and null in Arrow outputs, and the compact formats report them as invalid. With a compact format, the boolean results are kept in a scratch buffer of the current thread when `reuse_buffers` is True.
+        :type output: Literal["bool", "bitmap", "invalid", "count"]
+
+        :param n_jobs: Number of workers used to validate large inputs, -1 means all CPUs.
+        :type n_jobs: int
+
+        :param executor: Kind of worker used when `n_jobs` is not 1: "process" or "thread", as in `validate`.
+        :type executor: Literal["process", "thread"]
+
+        :param dedup: If True, processes only the unique documents and scatters the results back. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+        :type dedup: Union[bool, Literal["auto"]]
+
+        :return: Returns the validation results in the `output` format.
+        :rtype: Union[str, ndarray, ValidityCounts]
+
+        :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+        :raises ValueError: If `n_jobs`, `executor`, `dedup`, `out` or `output` are not valid or the documents cannot be normalized in place.
+        """
+        if executor not in ["process", "thread"]:
+            raise ValueError('executor must be "process" or "thread"')
+        if output not in VALIDITY_OUTPUTS:
+            raise ValueError(f"output must be one of {VALIDITY_OUTPUTS}")
+        _check_in_place(doclist, copy)
+        doclist, o_type, nulls = self._prepare(doclist)
+        _check_out(out, len(doclist if nulls is None else nulls), bool_)
+
+        def compute(docs: ndarray) -> Tuple[ndarray, ndarray]:
+            docs, inverse = deduplicate(docs, dedup, self._engine, "validate")
+            if n_jobs != 1 and executor == "thread":
+                result = validate_threads(docs, self._engine, lazy, n_jobs)
+            elif n_jobs != 1:
+                result = validate_processes(docs, self._engine, lazy, n_jobs)
+            else:
+                target = self._target(out, output, len(docs))
+                if inverse is not None:
+                    target = None
+                engine = self._bind(docs, True, copy)
+                result = engine.validate(lazy, target)
+            result = _scatter(result, inverse)
+            return result, result
+
+        result, _ = cached_results(
+            doclist,
+            (self.doctype, "validate", lazy),
+            compute,
+            self._normalizer(lazy),
+        )
+        result = io_expand(result, nulls)
+        if out is not None:
+            result = _write_out(result, out)
+        if output != "bool":
+            return io_output_validity(result, output, nulls)
+        if out is not None:
+            return result
+        return io_output_narray(result, o_type, nulls, nulls)
+
+    def parse(
+        self,
+        doclist: Any,
+        mask: bool = False,
+        copy: bool = True,
+        output: Literal["object", "fixed", "bytes", "arrow"] = "object",
+        dedup: Union[bool, Literal["auto"]] = False,
+    ) -> Union[str, ndarray, Tuple[ndarray, ndarray]]:
+        """
+        Extracts the document and returns its corrected value.
+
+        :param doclist: Document(s) to be extracted.
+        :type doclist: Any
+
+        :param mask: If True, adds a mask on the document.
+        :type mask: bool
+
+        :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup` or the result cache are used, a copy is normalized instead.
+        :type copy: bool
+
+        :param output: Format of the results: "object" (None where the document is invalid or null), "fixed" or "bytes" (a fixed-width unicode or bytes numpy.ndarray, empty where the document is invalid or null, and the validity of each document) or "arrow" (a pyarrow.StringArray with nulls).
+        :type output: Literal["object", "fixed", "bytes", "arrow"]
+
+        :param dedup: If True, processes only the unique documents and scatters the results back. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+        :type dedup: Union[bool, Literal["auto"]]
+
+        :return: Returns the extracted document(s) in the `output` format.
+        :rtype: Union[str, ndarray, Tuple[ndarray, ndarray]]
+
+        :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+        :raises ValueError: If `dedup` or `output` are not valid or the documents cannot be normalized in place.
+        """
+        if output not in PARSE_OUTPUTS:
+            raise ValueError(f"output must be one of {PARSE_OUTPUTS}")
+        _check_in_place(doclist, copy)
+        doclist, o_type, nulls = self._prepare(doclist)
+        fixed = output != "object"
+
+        def compute(docs: ndarray) -> Tuple[ndarray, ndarray]:
+            docs, inverse = deduplicate(docs, dedup, self._engine, "parse")
+            engine = self._bind(docs, True, copy)
+            engine._fixed_width = fixed
+            result = _scatter(engine.parse(mask), inverse)
+            return result, _scatter(engine._is_valid, inverse)
+
+        result, valid = cached_results(
+            doclist,
+            (self.doctype, "parse", mask, fixed),
+            compute,
+            self._normalizer(False),
+        )
+        valid = io_expand(valid, nulls)
+        if fixed:
+            return io_output_strings(
+                io_expand(result, nulls, ""), valid, output
+            )
+        result = io_expand(result, nulls)
+        return io_output_narray(result, o_type, _output_nulls(valid, nulls))
+
+    def get_attribute(
+        self,
+        doclist: Any,
+        attr: AttributeStr,
+        lazy: bool = False,
+        out: Optional[ndarray] = None,
+        copy: bool = True,
+        output: Literal["object", "fixed", "bytes", "arrow"] = "object",
+        dedup: Union[bool, Literal["auto"]] = False,
+    ) -> Union[str, ndarray, Tuple[ndarray, ndarray]]:
+        """
+        Collects an attribute from the document if it is valid.
+
+        :param doclist: Document(s) to be extracted.
+        :type doclist: Any
+
+        :param attr: Document attribute, must be one of the document class attributes.
+        :type attr: AttributeStr
+
+        :param lazy: If True, does not perform the extraction of the document before collecting the attribute.
+        :type lazy: bool
+
+        :param out: A numpy.ndarray, with one element per document, where the attributes are written and which is returned instead of a new array. Invalid documents are written as their null value.
+        :type out: Optional[ndarray]
+
+        :param copy: If False, normalizes the documents in place, overwriting the caller's array, which must be a writable numpy.ndarray of fixed-width strings, at least as wide as the document. Only the document types validated by check digits are normalized in place; when `dedup` or the result cache are used, a copy is normalized instead.
+        :type copy: bool
+
+        :param output: Format of the results: "object" (None where the document is invalid or null), "fixed" or "bytes" (a fixed-width unicode or bytes numpy.ndarray, empty where the document is invalid or null, written into `out` if given, and the validity of each document) or "arrow" (a pyarrow.StringArray with nulls, without `out`).
+        :type output: Literal["object", "fixed", "bytes", "arrow"]
+
+        :param dedup: If True, processes only the unique documents and scatters the results back. If "auto", does so when a sampled estimate of the share of distinct documents is low enough.
+        :type dedup: Union[bool, Literal["auto"]]
+
+        :return: Returns the collected attribute(s) in the `output` format.
+        :rtype: Union[str, ndarray, Tuple[ndarray, ndarray]]
+
+        :raises TypeError: If the type of the document(s) sent is not str, bytes, int, float, list, tuple, iterator, buffer, ndarray, pandas series, pyarrow array or a type added with `register_input`.
+        :raises ValueError: If the attribute is not one of the document class attributes, `dedup`, `out` or `output` are not valid or the documents cannot be normalized in place.
+        """
+        if output not in PARSE_OUTPUTS:
+            raise ValueError(f"output must be one of {PARSE_OUTPUTS}")
+        if output == "arrow" and out is not None:
+            raise ValueError('out cannot be used with output "arrow"')
+        _check_in_place(doclist, copy)
+        doclist, o_type, nulls = self._prepare(doclist)
+        _check_out(out, len(doclist if nulls is None else nulls))
+        fixed = output != "object"
+
+        def compute(docs: ndarray) -> Tuple[ndarray, ndarray]:
+            docs, inverse = deduplicate(
+                docs, dedup, self._engine, "get_attribute"
+            )
+            engine = self._bind(docs, False, copy)
+            engine._fixed_width = fixed
+            result = _scatter(engine.get_attribute(attr, lazy), inverse)
+            return result, _scatter(engine._is_valid, inverse)
+
+        result, valid = cached_results(
+            doclist,
+            (self.doctype, "get_attribute", attr, lazy, fixed),
+            compute,
+            self._normalizer(lazy),
+        )
+        valid = io_expand(valid, nulls)
+        if fixed:
+            strings = io_output_strings(
+                io_expand(result, nulls, ""), valid, output
+            )
+            if out is not None:
+                return _write_out(strings[0], out), strings[1]
+            return strings
+        result = io_expand(result, nulls)
+        if out is not None:
+            return _write_out(result, out)
+        return io_output_narray(result, o_type, _output_nulls(valid, nulls))
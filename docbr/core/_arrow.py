@@ -0,0 +1,222 @@
+from typing import (
+    Any,
+    List,
+    Optional,
+)
+
+from numpy import (
+    array,
+    frombuffer,
+    int32,
+    int64,
+    ndarray,
+    uint8,
+    unpackbits,
+    zeros,
+)
+
+from docbr.core._utils import (
+    float_to_integer,
+    from_byte_matrix,
+)
+
+try:
+    import pyarrow as pa
+except ImportError:  # pragma: no cover
+    pa = None
+
+
+ARROW_TYPES = [
+    "<class 'pyarrow.lib.StringArray'>",
+    "<class 'pyarrow.lib.LargeStringArray'>",
+    "<class 'pyarrow.lib.BinaryArray'>",
+    "<class 'pyarrow.lib.LargeBinaryArray'>",
+    "<class 'pyarrow.lib.FixedSizeBinaryArray'>",
+    "<class 'pyarrow.lib.ChunkedArray'>",
+]
+
+
+def _arrow_chunks(obj: Any) -> List[Any]:
+    """
+    Returns the chunks of an Arrow array or chunked array.
+    """
+    if isinstance(obj, pa.ChunkedArray):
+        return obj.chunks
+    return [obj]
+
+
+def _validity(chunk: Any) -> Optional[ndarray]:
+    """
+    Unpacks the validity bitmap of an Arrow array into a boolean numpy.ndarray, or returns None if the array has no nulls.
+    """
+    if chunk.null_count == 0:
+        return None
+
+    bitmap = frombuffer(chunk.buffers()[0], dtype=uint8)
+    bits = unpackbits(bitmap, bitorder="little")
+    return bits[chunk.offset : chunk.offset + len(chunk)].astype(bool)
+
+
+def _offsets(chunk: Any) -> ndarray:
+    """
+    Returns the offsets of the values of a variable-length Arrow binary or string array.
+    """
+    large = pa.types.is_large_string(chunk.type)
+    large |= pa.types.is_large_binary(chunk.type)
+    offsets = frombuffer(chunk.buffers()[1], dtype=int64 if large else int32)
+    return offsets[chunk.offset : chunk.offset + len(chunk) + 1]
+
+
+def arrow_null_mask(obj: Any) -> Optional[ndarray]:
+    """
+    Returns a boolean numpy.ndarray marking the null values of an Arrow array or chunked array, or None if there are none.
+
+    :param obj: The Arrow array or chunked array.
+    :type obj: pyarrow.Array or pyarrow.ChunkedArray
+
+    :return: A numpy.ndarray that is True where the value is null.
+    :rtype: Optional[numpy.ndarray]
+    """
+    if obj.null_count == 0:
+        return None
+    return obj.is_null().to_numpy(zero_copy_only=False)
+
+
+def arrow_to_narray(obj: Any) -> ndarray:
+    """
+    Converts an Arrow array or chunked array into a fixed-width bytes (`S` dtype) numpy.ndarray.
+
+    String and binary arrays are read straight from their offsets and data buffers, without creating Python objects or UCS4 strings. Fixed-size binary arrays and variable-length arrays whose values all have the same length are viewed without copying; other arrays are copied column by column into a matrix as wide as their longest value. Null values become empty strings. Integer arrays become integer numpy.ndarrays, with nulls as 0, and float arrays are converted into the exact integers they hold, as numpy.ndarrays of the same types are. Arrays of other types are converted through numpy.
+
+    :param obj: The Arrow array or chunked array.
+    :type obj: pyarrow.Array or pyarrow.ChunkedArray
+
+    :return: The values as a fixed-width or integer numpy.ndarray.
+    :rtype: numpy.ndarray
+    """
+    chunks = _arrow_chunks(obj)
+    kind = obj.type
+    if pa.types.is_integer(kind):
+        return (obj.fill_null(0) if obj.null_count else obj).to_numpy()
+    if pa.types.is_floating(kind):
+        return float_to_integer(obj.to_numpy(zero_copy_only=False))
+    if not (
+        pa.types.is_string(kind)
+        or pa.types.is_large_string(kind)
+        or pa.types.is_binary(kind)
+        or pa.types.is_large_binary(kind)
+        or pa.types.is_fixed_size_binary(kind)
+    ):
+        return array(obj.to_numpy(zero_copy_only=False), dtype=str)
+
+    if pa.types.is_fixed_size_binary(kind):
+        width = max(kind.byte_width, 1)
+        views = []
+        for chunk in chunks:
+            data = frombuffer(chunk.buffers()[1], dtype=f"S{width}")
+            data = data[chunk.offset : chunk.offset + len(chunk)]
+            validity = _validity(chunk)
+            if validity is not None:
+                data = data.copy()
+                data[~validity] = b""
+            views.append(data)
+        return views[0] if len(views) == 1 else _concat(views, width)
+
+    layouts = []
+    width = 1
+    for chunk in chunks:
+        offsets = _offsets(chunk)
+        lengths = offsets[1:] - offsets[:-1]
+        validity = _validity(chunk)
+        if validity is not None:
+            lengths = lengths * validity
+        data = chunk.buffers()[2]
+        data = (
+            zeros(0, dtype=uint8) if data is None else frombuffer(data, uint8)
+        )
+        layouts.append((offsets, lengths, data))
+        if len(lengths) > 0:
+            width = max(width, int(lengths.max()))
+
+    if len(layouts) == 1:
+        offsets, lengths, data = layouts[0]
+        if len(lengths) > 0 and (lengths == width).all():
+            data = data[offsets[0] : offsets[0] + width * len(lengths)]
+            return data.view(f"S{width}")
+
+    chars = zeros((len(obj), width), dtype=uint8)
+    row = 0
+    for offsets, lengths, data in layouts:
+        starts = offsets[:-1]
+        block = chars[row : row + len(lengths)]
+        for col in range(width):
+            present = lengths > col
+            if not present.any():
+                break
+            block[present, col] = data[starts[present] + col]
+        row += len(lengths)
+
+    return from_byte_matrix(chars)
+
+
+def arrow_zero_copy(obj: Any) -> bool:
+    """
+    Checks whether `arrow_to_narray` views the memory of an Arrow array instead of copying it, which happens for integer, fixed-size binary and same-length string or binary arrays in a single chunk and without nulls.
+
+    :param obj: The Arrow array or chunked array.
+    :type obj: pyarrow.Array or pyarrow.ChunkedArray
+
+    :return: Whether the converted array is a view of the memory of the input.
+    :rtype: bool
+    """
+    chunks = _arrow_chunks(obj)
+    if len(chunks) != 1 or obj.null_count or len(obj) == 0:
+        return False
+
+    kind = obj.type
+    if pa.types.is_integer(kind) or pa.types.is_fixed_size_binary(kind):
+        return True
+    if (
+        pa.types.is_string(kind)
+        or pa.types.is_large_string(kind)
+        or pa.types.is_binary(kind)
+        or pa.types.is_large_binary(kind)
+    ):
+        offsets = _offsets(chunks[0])
+        lengths = offsets[1:] - offsets[:-1]
+        return bool(lengths[0] > 0 and (lengths == lengths[0]).all())
+    return False
+
+
+def _concat(views: List[ndarray], width: int) -> ndarray:
+    """
+    Concatenates fixed-width bytes arrays with the same width.
+    """
+    out = zeros(sum(len(v) for v in views), dtype=f"S{width}")
+    row = 0
+    for view in views:
+        out[row : row + len(view)] = view
+        row += len(view)
+    return out
+
+
+def narray_to_arrow(obj: ndarray, nulls: Optional[ndarray] = None) -> Any:
+    """
+    Converts a result numpy.ndarray into an Arrow array, with nulls in place of None values.
+
+    Boolean results become a BooleanArray and string results a StringArray, both with a validity bitmap built from `nulls`.
+
+    :param obj: The result numpy.ndarray.
+    :type obj: numpy.ndarray
+
+    :param nulls: A boolean numpy.ndarray that is True where the result must be null.
+    :type nulls: Optional[numpy.ndarray]
+
+    :return: The result as an Arrow array.
+    :rtype: pyarrow.Array
+    """
+    if obj.dtype == bool:
+        return pa.array(obj, mask=nulls)
+    if obj.dtype.kind == "S":
+        return pa.array(obj, type=pa.binary(), mask=nulls).cast(pa.string())
+    return pa.array(obj, type=pa.string(), mask=nulls, from_pandas=True)
@@ -0,0 +1,218 @@
+from collections import (
+    OrderedDict,
+    namedtuple,
+)
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Hashable,
+    List,
+    Optional,
+    Tuple,
+)
+
+from numpy import (
+    array,
+    ndarray,
+)
+
+from docbr.core._utils import as_unicode
+
+CacheInfo = namedtuple(
+    "CacheInfo", ["hits", "misses", "evictions", "maxsize", "currsize"]
+)
+
+DEFAULT_MAXSIZE = 65536
+
+
+class ResultCache:
+    """
+    A size-bounded, thread-safe LRU cache of per-document results.
+
+    Each entry maps a key to the `(value, valid, dtype)` triple computed for a single document, so a batch can be assembled from cached and freshly computed rows.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        """
+        Initializes an empty cache.
+
+        :param maxsize: The maximum number of entries kept in the cache.
+        :type maxsize: int
+
+        :raises ValueError: If `maxsize` is lower than 1.
+        """
+        if maxsize < 1:
+            raise ValueError("maxsize must be a positive integer")
+
+        self.maxsize = maxsize
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def lookup(self, keys: List[Hashable]) -> Tuple[List[Any], List[int]]:
+        """
+        Looks up a batch of keys, marking the hits as most recently used.
+
+        :param keys: The keys to be looked up.
+        :type keys: List[Hashable]
+
+        :return: The entries found, with None for the misses, and the positions of the misses.
+        :rtype: Tuple[List[Any], List[int]]
+        """
+        entries = []
+        misses = []
+        with self._lock:
+            for i, key in enumerate(keys):
+                entry = self._entries.get(key)
+                if entry is None:
+                    misses.append(i)
+                else:
+                    self._entries.move_to_end(key)
+                entries.append(entry)
+            self._hits += len(keys) - len(misses)
+            self._misses += len(misses)
+        return entries, misses
+
+    def store(self, keys: List[Hashable], entries: List[Any]) -> None:
+        """
+        Stores a batch of entries, evicting the least recently used ones when the cache is full.
+
+        :param keys: The keys of the entries.
+        :type keys: List[Hashable]
+
+        :param entries: The entries to be stored.
+        :type entries: List[Any]
+        """
+        with self._lock:
+            for key, entry in zip(keys, entries):
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def info(self) -> CacheInfo:
+        """
+        Returns the cache statistics.
+
+        :return: The hits, misses, evictions, maximum size and current size of the cache.
+        :rtype: CacheInfo
+        """
+        with self._lock:
+            return CacheInfo(
+                self._hits,
+                self._misses,
+                self._evictions,
+                self.maxsize,
+                len(self._entries),
+            )
+
+    def clear(self) -> None:
+        """
+        Removes every entry and resets the statistics.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+
+_cache: Optional[ResultCache] = None
+
+
+def enable_cache(maxsize: int = DEFAULT_MAXSIZE) -> None:
+    """
+    Enables the result cache, replacing the current one if any.
+
+    :param maxsize: The maximum number of documents kept in the cache.
+    :type maxsize: int
+
+    :raises ValueError: If `maxsize` is lower than 1.
+    """
+    global _cache
+    _cache = ResultCache(maxsize)
+
+
+def disable_cache() -> None:
+    """
+    Disables the result cache and discards its entries.
+    """
+    global _cache
+    _cache = None
+
+
+def cache_info() -> Optional[CacheInfo]:
+    """
+    Returns the statistics of the result cache.
+
+    :return: The cache statistics, or None if the cache is disabled.
+    :rtype: Optional[CacheInfo]
+    """
+    return None if _cache is None else _cache.info()
+
+
+def cache_clear() -> None:
+    """
+    Removes every entry of the result cache and resets its statistics.
+    """
+    if _cache is not None:
+        _cache.clear()
+
+
+def cached_results(
+    docs: ndarray,
+    key: Tuple[Hashable, ...],
+    compute: Callable[[ndarray], Tuple[ndarray, ndarray]],
+    normalize: Optional[Callable[[ndarray], ndarray]] = None,
+) -> Tuple[ndarray, ndarray]:
+    """
+    Returns the results and validity of a batch of documents, computing only the documents missing from the result cache.
+
+    With `normalize`, the documents are normalized before building the keys, so the different spellings of a document, such as masked and unmasked, share one entry. The misses are computed from the normalized documents.
+
+    :param docs: A numpy.ndarray of documents.
+    :type docs: ndarray
+
+    :param key: The doctype, operation and options that identify the results, combined with each document to build the cache keys.
+    :type key: Tuple[Hashable, ...]
+
+    :param compute: A function that returns the results and validity of a numpy.ndarray of documents.
+    :type compute: Callable[[ndarray], Tuple[ndarray, ndarray]]
+
+    :param normalize: A function that returns the normalized documents, whose results must be the same as those of the original ones, or None to key on the documents as they are.
+    :type normalize: Optional[Callable[[ndarray], ndarray]]
+
+    :return: The results and the validity of the documents.
+    :rtype: Tuple[ndarray, ndarray]
+    """
+    cache = _cache
+    if cache is None or len(docs) == 0:
+        return compute(docs)
+
+    if normalize is not None:
+        docs = normalize(docs)
+    keys: List[Hashable] = [key + (doc,) for doc in as_unicode(docs).tolist()]
+    entries, misses = cache.lookup(keys)
+
+    if misses:
+        result, valid = compute(docs[misses])
+        computed = list(
+            zip(
+                result.tolist(),
+                valid.tolist(),
+                [result.dtype.char] * len(result),
+            )
+        )
+        cache.store([keys[i] for i in misses], computed)
+        for i, entry in zip(misses, computed):
+            entries[i] = entry
+
+    values, validity, chars = zip(*entries)
+    result = array(values, dtype=object)
+    if chars[0] != "O":
+        result = result.astype(chars[0])
+    return result, array(validity, dtype=bool)
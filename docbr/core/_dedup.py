@@ -0,0 +1,162 @@
+from typing import (
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
+
+from numpy import (
+    full,
+    ndarray,
+    uint64,
+    unique,
+)
+from numpy.random import default_rng
+
+from docbr.core._utils import to_char_matrix
+from docbr.core.checkdigit._template import CheckDigit
+from docbr.core.regexp._template import RegExr
+
+SAMPLE_SIZE = 4096
+MIN_ROWS = 4 * SAMPLE_SIZE
+
+_FNV_OFFSET = uint64(14695981039346656037)
+_FNV_PRIME = uint64(1099511628211)
+
+
+def hash_documents(docs: ndarray) -> ndarray:
+    """
+    Computes a 64-bit FNV-1a hash of each document, one character column at a time. Integer documents are hashed as a single 64-bit word.
+
+    :param docs: A fixed-width string or integer numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :return: A uint64 numpy.ndarray with the hash of each document.
+    :rtype: numpy.ndarray
+    """
+    hashes = full(len(docs), _FNV_OFFSET, dtype=uint64)
+    if docs.dtype.kind in "iu":
+        hashes ^= docs.astype(uint64)
+        hashes *= _FNV_PRIME
+        return hashes
+
+    chars = to_char_matrix(docs)
+    for col in range(chars.shape[1]):
+        hashes ^= chars[:, col]
+        hashes *= _FNV_PRIME
+    return hashes
+
+
+def estimate_distinct_ratio(docs: ndarray, seed: int = 0) -> float:
+    """
+    Estimates the share of distinct documents from the collisions in a random sample.
+
+    Two rows drawn at random hold the same document with probability 1 / d when the column has d equally frequent distinct documents, so d is estimated as the number of pairs in the sample divided by the number of pairs with equal documents. Skewed columns, where a few documents repeat a lot, are estimated with fewer distinct documents than they have, which is where deduplication pays off the most anyway.
+
+    :param docs: A fixed-width string numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :param seed: The seed of the sample.
+    :type seed: int
+
+    :return: The estimated number of distinct documents divided by the number of documents.
+    :rtype: float
+    """
+    size = len(docs)
+    if size < 2:
+        return 1.0
+
+    sample = docs[default_rng(seed).integers(0, size, SAMPLE_SIZE)]
+    _, counts = unique(hash_documents(sample), return_counts=True)
+    equal_pairs = float((counts * (counts - 1)).sum()) / 2
+    if equal_pairs == 0:
+        return 1.0
+
+    pairs = SAMPLE_SIZE * (SAMPLE_SIZE - 1) / 2
+    return min(pairs / equal_pairs / size, 1.0)
+
+
+def auto_dedup_ratio(
+    engine: Type[Union[CheckDigit, RegExr]], operation: str
+) -> float:
+    """
+    Returns the highest estimated share of distinct documents for which deduplicating is expected to pay off.
+
+    Hashing and sorting cost about as much as the whole check digit validation, so it only pays off for the more expensive operations: regular expression searches and the creation of string results.
+
+    :param engine: The validation class of the document type.
+    :type engine: Type[Union[CheckDigit, RegExr]]
+
+    :param operation: The operation to be run: validate, parse or get_attribute.
+    :type operation: str
+
+    :return: The highest share of distinct documents to deduplicate.
+    :rtype: float
+    """
+    if issubclass(engine, RegExr):
+        return 0.8
+    if operation == "validate":
+        return 0.0
+    return 0.1
+
+
+def unique_documents(docs: ndarray) -> Tuple[ndarray, ndarray]:
+    """
+    Reduces the documents to their unique values.
+
+    Documents are grouped by their hash and the grouping is verified against the documents themselves; on a hash collision it falls back to an exact sort of the documents.
+
+    :param docs: A fixed-width string numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :return: The unique documents and the inverse indices that rebuild the input from them.
+    :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+    """
+    _, index, inverse = unique(
+        hash_documents(docs), return_index=True, return_inverse=True
+    )
+    uniques = docs[index]
+    inverse = inverse.reshape(-1)
+    if not (uniques[inverse] == docs).all():
+        uniques, inverse = unique(docs, return_inverse=True)
+        inverse = inverse.reshape(-1)
+    return uniques, inverse
+
+
+def deduplicate(
+    docs: ndarray,
+    dedup: Union[bool, str],
+    engine: Type[Union[CheckDigit, RegExr]],
+    operation: str,
+) -> Tuple[ndarray, Optional[ndarray]]:
+    """
+    Reduces the documents to their unique values when requested, or when `dedup` is "auto" and the estimated share of distinct documents is low enough for the operation.
+
+    :param docs: A fixed-width string numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :param dedup: True to always deduplicate, False to never deduplicate, or "auto".
+    :type dedup: Union[bool, str]
+
+    :param engine: The validation class of the document type.
+    :type engine: Type[Union[CheckDigit, RegExr]]
+
+    :param operation: The operation to be run: validate, parse or get_attribute.
+    :type operation: str
+
+    :return: The documents to be processed and the inverse indices to scatter the results back, or None if the documents were not deduplicated.
+    :rtype: Tuple[numpy.ndarray, Optional[numpy.ndarray]]
+
+    :raises ValueError: If `dedup` is not a boolean or "auto".
+    """
+    if dedup not in [True, False, "auto"]:
+        raise ValueError('dedup must be True, False or "auto"')
+
+    if dedup == "auto":
+        max_ratio = auto_dedup_ratio(engine, operation)
+        dedup = len(docs) >= MIN_ROWS and max_ratio > 0
+        dedup = dedup and estimate_distinct_ratio(docs) <= max_ratio
+
+    if not dedup or len(docs) == 0:
+        return docs, None
+    return unique_documents(docs)
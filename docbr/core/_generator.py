@@ -0,0 +1,329 @@
+from typing import (
+    Callable,
+    Dict,
+    Tuple,
+    Type,
+    Union,
+)
+
+from numpy import (
+    arange,
+    array,
+    concatenate,
+    equal,
+    flatnonzero,
+    frombuffer,
+    full,
+    int8,
+    ndarray,
+    newaxis,
+    take_along_axis,
+    uint8,
+    where,
+    zeros,
+)
+from numpy.random import Generator
+
+from docbr.core._utils import (
+    as_unicode,
+    from_byte_matrix,
+    to_char_matrix,
+)
+from docbr.core.checkdigit._template import CheckDigit
+from docbr.core.checkdigit.documents import TituloEleitor
+from docbr.core.regexp._template import RegExr
+from docbr.core.regexp.documents import (
+    CarPlate,
+    Email,
+    Phone,
+)
+
+EMAIL_DOMAINS = array(
+    [
+        b"gmail.com",
+        b"hotmail.com",
+        b"outlook.com",
+        b"yahoo.com.br",
+        b"uol.com.br",
+        b"bol.com.br",
+        b"empresa.com.br",
+        b"gov.br",
+    ]
+)
+
+
+def _ascii(text: bytes) -> ndarray:
+    """
+    Returns the ASCII codes of a byte string.
+
+    :param text: The byte string.
+    :type text: bytes
+
+    :return: A uint8 numpy.ndarray with the ASCII codes.
+    :rtype: numpy.ndarray
+    """
+    return frombuffer(text, dtype=uint8)
+
+
+def _digits(
+    rng: Generator,
+    shape: Union[int, Tuple[int, ...]],
+    low: int = 0,
+    high: int = 9,
+) -> ndarray:
+    """
+    Draws random ASCII digits.
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :param shape: The shape of the matrix of digits.
+    :type shape: Union[int, Tuple[int, ...]]
+
+    :param low: The lowest digit to be drawn.
+    :type low: int
+
+    :param high: The highest digit to be drawn.
+    :type high: int
+
+    :return: A uint8 numpy.ndarray with the ASCII codes of the digits.
+    :rtype: numpy.ndarray
+    """
+    return rng.integers(48 + low, 49 + high, shape, dtype=uint8)
+
+
+def _letters(rng: Generator, shape: Union[int, Tuple[int, ...]]) -> ndarray:
+    """
+    Draws random ASCII uppercase letters.
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :param shape: The shape of the matrix of letters.
+    :type shape: Union[int, Tuple[int, ...]]
+
+    :return: A uint8 numpy.ndarray with the ASCII codes of the letters.
+    :rtype: numpy.ndarray
+    """
+    return rng.integers(65, 91, shape, dtype=uint8)
+
+
+def generate_check_digit(
+    engine: Type[CheckDigit],
+    n: int,
+    mask: bool,
+    invalid: ndarray,
+    rng: Generator,
+) -> ndarray:
+    """
+    Generates documents validated by check digits.
+
+    The base digits are drawn as a matrix and the check digits are computed with the `_sequence` and `_operation` of the document type, so every document type validated by check digits is supported. Documents made of a single repeated digit are drawn again. Invalid documents get their last check digit changed.
+
+    :param engine: The class that validates the document type.
+    :type engine: Type[CheckDigit]
+
+    :param n: The number of documents.
+    :type n: int
+
+    :param mask: Whether or not to apply the formatting mask to the documents.
+    :type mask: bool
+
+    :param invalid: A boolean numpy.ndarray that is True where the document must be invalid.
+    :type invalid: numpy.ndarray
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :return: A numpy.ndarray with the documents.
+    :rtype: numpy.ndarray
+    """
+    instance = engine(array([], dtype="S1"))
+    digits = zeros((n, instance._doc_len), dtype=int8)
+    rows = arange(n)
+
+    while len(rows):
+        draw = rng.integers(0, 10, (len(rows), instance._doc_len), dtype=int8)
+        if isinstance(instance, TituloEleitor):
+            left, right = instance._federal
+            federal_unit = rng.integers(1, 29, len(rows), dtype=int8)
+            draw[:, left] = federal_unit // 10
+            draw[:, right] = federal_unit % 10
+
+        for digit, position in instance._generate_check_digit(draw):
+            draw[:, position] = digit
+        digits[rows] = draw
+
+        repeated = (draw == draw[:, :1]).all(axis=1)
+        rows = rows[repeated]
+
+    position = instance._sequence[-1][1]
+    shift = rng.integers(1, 10, invalid.sum(), dtype=int8)
+    digits[invalid, position] = (digits[invalid, position] + shift) % 10
+
+    instance._documents = from_byte_matrix(digits.view(uint8) + uint8(48))
+    if mask:
+        instance._apply_mask()
+    return as_unicode(instance._documents)
+
+
+def generate_car_plate(
+    n: int, mask: bool, invalid: ndarray, rng: Generator
+) -> ndarray:
+    """
+    Generates car plates, half of them in the Brazilian pattern (LLL9999) and half in the Mercosul pattern (LLL9L99). Invalid plates start with a digit.
+
+    :param n: The number of documents.
+    :type n: int
+
+    :param mask: Whether or not to apply the formatting mask to the documents.
+    :type mask: bool
+
+    :param invalid: A boolean numpy.ndarray that is True where the document must be invalid.
+    :type invalid: numpy.ndarray
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :return: A numpy.ndarray with the documents.
+    :rtype: numpy.ndarray
+    """
+    chars = concatenate([_letters(rng, (n, 3)), _digits(rng, (n, 4))], axis=1)
+    mercosul = rng.integers(0, 2, n, dtype=bool)
+    chars[:, 4] = where(mercosul, _letters(rng, n), chars[:, 4])
+    chars[:, 0] = where(invalid, _digits(rng, n), chars[:, 0])
+
+    if mask:
+        dash = full((n, 1), ord("-"), dtype=uint8)
+        chars = concatenate([chars[:, :3], dash, chars[:, 3:]], axis=1)
+    return as_unicode(from_byte_matrix(chars))
+
+
+def generate_phone(
+    n: int, mask: bool, invalid: ndarray, rng: Generator
+) -> ndarray:
+    """
+    Generates phone numbers with a valid DDD, half of them mobile (9 digits starting with 9) and half landline (8 digits starting with 2 to 5). Invalid phones are 7 digits long.
+
+    :param n: The number of documents.
+    :type n: int
+
+    :param mask: Whether or not to apply the formatting mask to the documents.
+    :type mask: bool
+
+    :param invalid: A boolean numpy.ndarray that is True where the document must be invalid.
+    :type invalid: numpy.ndarray
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :return: A numpy.ndarray with the documents.
+    :rtype: numpy.ndarray
+    """
+    ddds = flatnonzero(~equal(Phone(array([]))._ddd_estados, array(None)))
+    drawn = ddds[rng.integers(0, len(ddds), n)]
+    ddd = array([drawn // 10, drawn % 10], dtype=uint8).T + uint8(48)
+
+    mobile = rng.integers(0, 2, n, dtype=bool)[:, newaxis]
+    body = _digits(rng, (n, 9))
+    body[:, 0] = where(mobile[:, 0], ord("9"), _digits(rng, n, 2, 5))
+    body[:, 1] = where(mobile[:, 0], _digits(rng, n, low=1), body[:, 1])
+    body[:, 8] = where(mobile[:, 0], body[:, 8], 0)
+
+    if mask:
+        open_, close, dash = (full((n, 1), ord(c), uint8) for c in "()-")
+        head = concatenate([open_, ddd, close], axis=1)
+        mobile_body = concatenate([body[:, :5], dash, body[:, 5:]], axis=1)
+        landline_body = concatenate(
+            [body[:, :4], dash, body[:, 4:8], zeros((n, 1), uint8)], axis=1
+        )
+        chars = concatenate(
+            [head, where(mobile, mobile_body, landline_body)], axis=1
+        )
+    else:
+        chars = concatenate([ddd, body], axis=1)
+
+    short = zeros(chars.shape, dtype=uint8)
+    short[:, 0] = ord("1")
+    short[:, 1:7] = _digits(rng, (n, 6))
+    chars = where(invalid[:, newaxis], short, chars)
+    return as_unicode(from_byte_matrix(chars))
+
+
+def generate_email(
+    n: int, mask: bool, invalid: ndarray, rng: Generator
+) -> ndarray:
+    """
+    Generates email addresses with a random local part of 5 to 12 lowercase letters and digits and a common domain. Invalid emails have no "@".
+
+    :param n: The number of documents.
+    :type n: int
+
+    :param mask: Does nothing, emails have no formatting mask.
+    :type mask: bool
+
+    :param invalid: A boolean numpy.ndarray that is True where the document must be invalid.
+    :type invalid: numpy.ndarray
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :return: A numpy.ndarray with the documents.
+    :rtype: numpy.ndarray
+    """
+    alphabet = _ascii(b"abcdefghijklmnopqrstuvwxyz0123456789")
+    domains = EMAIL_DOMAINS[rng.integers(0, len(EMAIL_DOMAINS), n)]
+    at = where(invalid, ord("#"), ord("@")).astype(uint8)
+    tail = concatenate([at[:, newaxis], to_char_matrix(domains)], axis=1)
+
+    width = 12 + tail.shape[1]
+    chars = alphabet[rng.integers(0, len(alphabet), (n, width))]
+    chars[:, 0] = _letters(rng, n) + uint8(32)
+
+    cols = arange(width) - rng.integers(5, 13, (n, 1))
+    domain = take_along_axis(tail, cols.clip(0, tail.shape[1] - 1), axis=1)
+    chars = where(cols >= 0, domain, chars)
+    chars[cols >= tail.shape[1]] = 0
+    return as_unicode(from_byte_matrix(chars))
+
+
+GENERATORS: Dict[
+    Type[RegExr], Callable[[int, bool, ndarray, Generator], ndarray]
+] = {
+    CarPlate: generate_car_plate,
+    Phone: generate_phone,
+    Email: generate_email,
+}
+
+
+def generate_documents(
+    engine: Union[Type[CheckDigit], Type[RegExr]],
+    n: int,
+    mask: bool,
+    invalid: ndarray,
+    rng: Generator,
+) -> ndarray:
+    """
+    Generates random documents of the type validated by `engine`.
+
+    :param engine: The class that validates the document type.
+    :type engine: Union[Type[CheckDigit], Type[RegExr]]
+
+    :param n: The number of documents.
+    :type n: int
+
+    :param mask: Whether or not to apply the formatting mask to the documents.
+    :type mask: bool
+
+    :param invalid: A boolean numpy.ndarray that is True where the document must be invalid.
+    :type invalid: numpy.ndarray
+
+    :param rng: The random number generator.
+    :type rng: numpy.random.Generator
+
+    :return: A numpy.ndarray with the documents.
+    :rtype: numpy.ndarray
+    """
+    if issubclass(engine, CheckDigit):
+        return generate_check_digit(engine, n, mask, invalid, rng)
+    return GENERATORS[engine](n, mask, invalid, rng)
@@ -1,7 +1,10 @@
+from collections import namedtuple
 from typing import (
     Any,
     Callable,
-    Iterable,
+    Dict,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -9,61 +12,345 @@ from typing import (
 
 from numpy import (
     array,
+    asarray,
+    bool_,
+    count_nonzero,
+    equal,
+    flatnonzero,
+    floating,
+    full,
+    generic,
+    int64,
     integer,
+    isnan,
+    ma,
     ndarray,
+    packbits,
+    promote_types,
 )
 
+from docbr.core._arrow import (
+    ARROW_TYPES,
+    arrow_null_mask,
+    arrow_to_narray,
+    arrow_zero_copy,
+    narray_to_arrow,
+    pa,
+)
+from docbr.core._utils import (
+    as_bytes,
+    as_unicode,
+    float_to_integer,
+)
+
+ValidityCounts = namedtuple("ValidityCounts", ["valid", "invalid"])
+
+VALIDITY_OUTPUTS = ["bool", "bitmap", "invalid", "count"]
+
+PARSE_OUTPUTS = ["object", "fixed", "bytes", "arrow"]
+
+# pandas 3 reports the Series class under its public path
+SERIES_TYPES = [
+    "<class 'pandas.core.series.Series'>",
+    "<class 'pandas.Series'>",
+]
+
+MASKED_TYPE = "<class 'numpy.ma.MaskedArray'>"
+
+
+def _numeric_or_str(narray: ndarray) -> ndarray:
+    """
+    Keeps integer numpy.ndarrays as they are and converts float ones into the exact integers they hold, so their digits are extracted arithmetically, and converts the other ones to strings.
+
+    :param narray: The numpy.ndarray to be converted.
+    :type narray: ndarray
+
+    :return: The integer or string numpy.ndarray.
+    :rtype: ndarray
+    """
+    if narray.dtype.kind in "iu":
+        return narray
+    if narray.dtype.kind == "f":
+        return float_to_integer(narray)
+    return narray.astype(str)
+
+
+def _from_narray(narray: ndarray) -> ndarray:
+    """
+    Converts a numpy.ndarray into documents. Fixed-width strings and integers are kept as they are and raw bytes (`V` dtype) are viewed as fixed-width bytes, both without copying.
+
+    :param narray: The numpy.ndarray to be converted.
+    :type narray: ndarray
+
+    :return: The documents.
+    :rtype: ndarray
+    """
+    if narray.dtype.kind in "SU":
+        return narray
+    if narray.dtype.kind == "V":
+        return narray.view(f"S{max(narray.dtype.itemsize, 1)}")
+    return _numeric_or_str(narray)
+
+
+def _narray_zero_copy(narray: ndarray) -> bool:
+    """
+    Checks whether `_from_narray` keeps or views a numpy.ndarray instead of converting it.
+    """
+    return narray.dtype.kind in "SUViu"
+
+
+def _check_elements(obj: Any) -> None:
+    """
+    Checks the type of the first element of a sequence of documents.
+
+    :param obj: The sequence of documents.
+    :type obj: Any
+
+    :raises ValueError: If the elements are not int, float, str or bytes.
+    """
+    if len(obj) and not isinstance(obj[0], (float, int, str, bytes, integer)):
+        raise ValueError(
+            "Cannot convert {} to numpy array because it contains types not supported: {}".format(
+                obj.__class__, type(obj[0])
+            )
+        )
+
+
+def _from_sequence(obj: Any) -> ndarray:
+    """
+    Converts a list, tuple or iterator of documents into a numpy.ndarray, of integers when the documents are numbers and of strings otherwise.
+
+    :param obj: The sequence of documents.
+    :type obj: Any
+
+    :return: The documents.
+    :rtype: ndarray
+
+    :raises ValueError: If the elements are not int, float, str or bytes.
+    """
+    if not isinstance(obj, (list, tuple)):
+        obj = list(obj)
+        _check_elements(obj)
+    if len(obj) and isinstance(obj[0], (int, float, integer, floating)):
+        return _numeric_or_str(array(obj))
+    return array(obj, dtype=str)
+
+
+def _from_series(obj: Any) -> ndarray:
+    """
+    Converts a pandas series into a numpy.ndarray. Series backed by Arrow, such as `string[pyarrow]`, are read from their Arrow buffers instead of being converted into Python strings.
+
+    :param obj: The pandas series.
+    :type obj: pandas.Series
+
+    :return: The documents.
+    :rtype: ndarray
+    """
+    if pa is not None and hasattr(obj.array, "__arrow_array__"):
+        return arrow_to_narray(pa.array(obj.array))
+    return _from_narray(obj.to_numpy())
+
+
+def _series_zero_copy(obj: Any) -> bool:
+    """
+    Checks whether `_from_series` reads a pandas series without copying it.
+    """
+    if pa is not None and hasattr(obj.array, "__arrow_array__"):
+        return arrow_zero_copy(pa.array(obj.array))
+    return _narray_zero_copy(obj.to_numpy())
+
+
+def _has_buffer(obj: Any) -> bool:
+    """
+    Checks whether an object exposes the buffer protocol.
+    """
+    try:
+        memoryview(obj).release()
+    except TypeError:
+        return False
+    return True
+
+
+def _is_arrow(obj: Any) -> bool:
+    """
+    Checks whether an object is an Arrow array or chunked array, of any type.
+    """
+    return pa is not None and isinstance(obj, (pa.Array, pa.ChunkedArray))
+
+
+def _import_arrow(obj: Any) -> Any:
+    """
+    Imports an object that exposes the Arrow PyCapsule interface as an Arrow array or chunked array.
+    """
+    if hasattr(obj, "__arrow_c_array__"):
+        return pa.array(obj)
+    return pa.chunked_array(obj)
+
+
+def _has_arrow_interface(obj: Any) -> bool:
+    """
+    Checks whether an object exposes the Arrow PyCapsule interface.
+    """
+    return pa is not None and (
+        hasattr(obj, "__arrow_c_array__") or hasattr(obj, "__arrow_c_stream__")
+    )
+
+
+InputConverter = namedtuple(
+    "InputConverter", ["convert", "output", "zero_copy"]
+)
+
+# input types, matched along the class hierarchy of the input, by class or by
+# the repr of the class for optional dependencies that are not imported
+_INPUT_TYPES: Dict[Union[type, str], Optional[InputConverter]] = {}
+
+# input protocols, probed in order when no input type matches
+_INPUT_PROTOCOLS: List[Tuple[Callable[[Any], bool], InputConverter]] = []
+
+
+def register_input(
+    key: Union[type, str, Callable[[Any], bool]],
+    convert: Callable[[Any], ndarray],
+    output: type = ndarray,
+    zero_copy: Union[bool, Callable[[Any], bool]] = False,
+) -> None:
+    """
+    Registers the conversion of an input type into the fixed-width string or integer numpy.ndarray of documents processed by the engines.
+
+    Input types are matched along the class hierarchy of the input, so a converter also applies to subclasses that have none. When no type matches, the protocol predicates are tried in the order they were registered. A new converter replaces the one previously registered for the same type.
+
+    :param key: The input class, the repr of the class (e.g. "<class 'polars.series.series.Series'>") to match it without importing its module, or a predicate of the inputs that follow a protocol.
+    :type key: Union[type, str, Callable[[Any], bool]]
+
+    :param convert: The function that converts an input into a one-dimensional numpy.ndarray of fixed-width strings (`S` or `U`) or integers.
+    :type convert: Callable[[Any], ndarray]
+
+    :param output: The type of the results: str for scalars, numpy.ndarray or pyarrow.Array.
+    :type output: type
+
+    :param zero_copy: Whether the converted array is a view of the memory of the input, or a predicate that tells it for each input, when only some layouts or dtypes are read without copying.
+    :type zero_copy: Union[bool, Callable[[Any], bool]]
+
+    :raises TypeError: If `convert` or a protocol predicate are not callable.
+    """
+    if not callable(convert):
+        raise TypeError("convert must be callable")
+    converter = InputConverter(convert, output, zero_copy)
+
+    if isinstance(key, (type, str)):
+        _INPUT_TYPES[key] = converter
+    elif callable(key):
+        _INPUT_PROTOCOLS.append((key, converter))
+    else:
+        raise TypeError(
+            "key must be a class, the repr of a class or a predicate"
+        )
+
 
-def io_get(obj: Any) -> Tuple[Optional[Callable[[Any], Any]], Optional[Any]]:
+def io_converter(obj: Any) -> Optional[InputConverter]:
     """
-    Determines the input conversion function and output type based on the type of an input object.
+    Finds the registered converter of an input object.
+
+    :param obj: The input object.
+    :type obj: Any
+
+    :return: The converter, or None if the input is not supported.
+    :rtype: Optional[InputConverter]
+    """
+    for cls in obj.__class__.__mro__[:-1]:
+        for key in (cls, str(cls)):
+            if key in _INPUT_TYPES:
+                return _INPUT_TYPES[key]
+
+    for probe, converter in _INPUT_PROTOCOLS:
+        if probe(obj):
+            return converter
+    return None
+
+
+def io_zero_copy(obj: Any) -> bool:
+    """
+    Checks whether the registered converter of an input object reads its documents without copying them.
+
+    :param obj: The input object.
+    :type obj: Any
+
+    :return: Whether the converted array is a view of the memory of the input.
+    :rtype: bool
+    """
+    converter = io_converter(obj)
+    if converter is None:
+        return False
+    if callable(converter.zero_copy):
+        return bool(converter.zero_copy(obj))
+    return bool(converter.zero_copy)
+
+
+def io_get(obj: Any) -> Tuple[Callable[[Any], Any], type]:
+    """
+    Determines the input conversion function and output type based on the type of an input object, from the converters registered with `register_input`.
 
     :param obj: The input object.
     :type obj: Any
 
     :return: A tuple containing the input conversion function and the output type.
-    :rtype: Tuple[Optional[Callable[[Any], Any]], Optional[Any]]
+    :rtype: Tuple[Callable[[Any], Any], type]
 
     :raises TypeError: If the type of the input object is not supported.
     :raises ValueError: If the input object contains types that are not supported.
     """
-    _iotypes = {
-        "<class 'int'>": (lambda x: array([str(x)]), str),
-        "<class 'float'>": (lambda x: array([str(x)]), str),
-        "<class 'str'>": (lambda x: array([x]), str),
-        "<class 'numpy.ndarray'>": (lambda x: array(x, dtype=str), ndarray),
-        "<class 'list'>": (lambda x: array(x, dtype=str), ndarray),
-        "<class 'pandas.core.series.Series'>": (
-            lambda x: x.to_numpy().astype(str),
-            ndarray,
-        ),
-    }
-
-    dtype = str(obj.__class__)
-    i_func, o_type = _iotypes.get(dtype, (None, None))
-
-    valid_type = i_func is not None
-    invalid_iterable = isinstance(obj, Iterable)
-    if invalid_iterable:
-        invalid_iterable &= dtype != "<class 'pandas.core.series.Series'>"
-        invalid_iterable &= not isinstance(obj[0], (float, int, str, integer))
-
-    if valid_type:
-        if not invalid_iterable:
-            return i_func, o_type
-        else:
-            raise ValueError(
-                "Cannot convert {} to numpy array because it contains types not supported: {}".format(
-                    dtype, type(obj[0])
-                )
-            )
-    else:
+    converter = io_converter(obj)
+    if converter is None:
         raise TypeError(
-            "Type {} not supported, please use one of the following: int, float, str, numpy.ndarray, list, pandas.series".format(
-                dtype
+            "Type {} not supported, please use one of the following: int, float, str, bytes, numpy.ndarray, list, tuple, iterator, buffer, pandas.series, pyarrow.Array".format(
+                obj.__class__
             )
         )
 
+    if isinstance(obj, (list, tuple)):
+        _check_elements(obj)
+    return converter.convert, converter.output
+
+
+def _scalar(obj: Any) -> ndarray:
+    return _from_narray(array([obj]))
+
+
+# booleans are not documents, even though bool is a subclass of int
+_INPUT_TYPES[bool] = _INPUT_TYPES[bool_] = None
+for _type in [int, float, str, bytes, generic]:
+    register_input(_type, _scalar, str)
+register_input(bytearray, lambda x: array([bytes(x)]), str)
+register_input(ndarray, _from_narray, ndarray, _narray_zero_copy)
+register_input(
+    ma.MaskedArray,
+    lambda x: _from_narray(x.data),
+    ndarray,
+    lambda x: _narray_zero_copy(x.data),
+)
+register_input(list, _from_sequence)
+register_input(tuple, _from_sequence)
+for _name in SERIES_TYPES:
+    register_input(_name, _from_series, ndarray, _series_zero_copy)
+for _name in ARROW_TYPES:
+    register_input(_name, arrow_to_narray, pa and pa.Array, arrow_zero_copy)
+register_input(
+    _has_arrow_interface,
+    lambda x: arrow_to_narray(_import_arrow(x)),
+    pa and pa.Array,
+    lambda x: arrow_zero_copy(_import_arrow(x)),
+)
+register_input(
+    lambda x: hasattr(x, "__array__"), lambda x: _from_narray(asarray(x))
+)
+register_input(
+    _has_buffer,
+    lambda x: _from_narray(asarray(x)),
+    ndarray,
+    lambda x: _narray_zero_copy(asarray(x)),
+)
+register_input(lambda x: isinstance(x, Iterator), _from_sequence)
+
 
 def io_input_narray(obj: Any, i_func: Callable) -> ndarray:
     """
@@ -81,9 +368,97 @@ def io_input_narray(obj: Any, i_func: Callable) -> ndarray:
     return i_func(obj)
 
 
-def io_output_narray(obj: ndarray, o_type: type) -> Union[str, ndarray]:
+def io_null_mask(obj: Any) -> Optional[ndarray]:
+    """
+    Returns a boolean numpy.ndarray marking the null values of an input object, or None if the input has no null values.
+
+    The null values are the nulls of Arrow arrays of any type and of pandas series, the masked values of numpy masked arrays, NaN in float numpy.ndarrays, and None and NaN in object numpy.ndarrays.
+
+    :param obj: The input object.
+    :type obj: Any
+
+    :return: A numpy.ndarray that is True where the input is null.
+    :rtype: Optional[ndarray]
+    """
+    if _is_arrow(obj):
+        return arrow_null_mask(obj)
+
+    dtype = str(obj.__class__)
+    if dtype in SERIES_TYPES:
+        nulls = obj.isna().to_numpy()
+    elif dtype == MASKED_TYPE:
+        nulls = ma.getmaskarray(obj)
+    elif dtype == "<class 'numpy.ndarray'>" and obj.dtype.kind == "f":
+        nulls = isnan(obj)
+    elif dtype == "<class 'numpy.ndarray'>" and obj.dtype.kind == "O":
+        # NaN is the only value that is not equal to itself
+        nulls = equal(obj, array(None)) | (obj != obj)
+    else:
+        return None
+    return nulls if nulls.any() else None
+
+
+def io_compact(obj: Any, nulls: Optional[ndarray]) -> Any:
+    """
+    Drops the null values of an input object before it is converted, so that only the documents with a value are converted and processed.
+
+    :param obj: The input object.
+    :type obj: Any
+
+    :param nulls: A boolean numpy.ndarray that is True where the input is null, as returned by `io_null_mask`.
+    :type nulls: Optional[ndarray]
+
+    :return: The input object without its null values.
+    :rtype: Any
+    """
+    if nulls is None:
+        return obj
+
+    if _is_arrow(obj):
+        return obj.filter(pa.array(~nulls))
+    dtype = str(obj.__class__)
+    if dtype in SERIES_TYPES:
+        return obj.iloc[~nulls]
+    return obj[~nulls]
+
+
+def io_expand(
+    result: ndarray, nulls: Optional[ndarray], fill: Any = None
+) -> ndarray:
     """
-    Converts a numpy.ndarray to either a string or numpy.ndarray depending on the specified output type.
+    Scatters the results of the documents with a value, as kept by `io_compact`, back to the rows of the input, filling the null rows.
+
+    :param result: The results of the documents with a value.
+    :type result: ndarray
+
+    :param nulls: A boolean numpy.ndarray that is True where the input is null.
+    :type nulls: Optional[ndarray]
+
+    :param fill: The value of the null rows, converted to the type of the results: None is False for booleans and "None" for strings, as for the invalid documents.
+    :type fill: Any
+
+    :return: The results of every input row.
+    :rtype: ndarray
+    """
+    if nulls is None:
+        return result
+
+    dtype = result.dtype
+    if dtype.kind in "SU":
+        dtype = promote_types(dtype, f"{dtype.kind}{len(str(fill))}")
+    expanded = full(len(nulls), fill, dtype=dtype)
+    expanded[~nulls] = result
+    return expanded
+
+
+def io_output_narray(
+    obj: ndarray,
+    o_type: type,
+    nulls: Optional[ndarray] = None,
+    missing: Optional[ndarray] = None,
+) -> Any:
+    """
+    Converts a numpy.ndarray to either a string, numpy.ndarray or pyarrow.Array depending on the specified output type.
 
     :param obj: The numpy.ndarray to be converted.
     :type obj: ndarray
@@ -91,16 +466,96 @@ def io_output_narray(obj: ndarray, o_type: type) -> Union[str, ndarray]:
     :param o_type: The desired output type.
     :type o_type: type
 
-    :return: The numpy.ndarray as either a string or numpy.ndarray.
-    :rtype: Union[str, ndarray]
+    :param nulls: A boolean numpy.ndarray that is True where the output must be null, used by outputs with validity bitmaps.
+    :type nulls: Optional[ndarray]
+
+    :param missing: A boolean numpy.ndarray that is True where the input is null, whose results are masked when the output is a numpy.ndarray.
+    :type missing: Optional[ndarray]
+
+    :return: The numpy.ndarray as either a scalar, numpy.ndarray, numpy masked array or pyarrow.Array.
+    :rtype: Union[str, bool, ndarray, pyarrow.Array]
 
     :raises TypeError: If the output type is not supported.
     """
     if o_type == str:
         return obj[0]
+    elif o_type == ndarray and missing is not None:
+        return ma.MaskedArray(obj, mask=missing)
     elif o_type == ndarray:
         return obj
+    elif pa is not None and o_type is pa.Array:
+        return narray_to_arrow(obj, nulls)
     else:
         raise TypeError(
-            f"Type {o_type} not supported, please use str or numpy.ndarray"
+            f"Type {o_type} not supported, please use str, numpy.ndarray or pyarrow.Array"
         )
+
+
+def io_output_validity(
+    valid: ndarray, output: str, nulls: Optional[ndarray] = None
+) -> Union[ndarray, ValidityCounts]:
+    """
+    Compacts the validation results into the requested output format. Null inputs are reported as invalid.
+
+    :param valid: A boolean numpy.ndarray that is True where the document is valid.
+    :type valid: ndarray
+
+    :param output: The output format: "bool" for the boolean array itself, "bitmap" for a uint8 array with one bit per document, as returned by numpy.packbits, "invalid" for the int64 indices of the invalid documents or "count" for the number of valid and invalid documents.
+    :type output: str
+
+    :param nulls: A boolean numpy.ndarray that is True where the input is null.
+    :type nulls: Optional[ndarray]
+
+    :return: The validation results in the requested output format.
+    :rtype: Union[ndarray, ValidityCounts]
+
+    :raises ValueError: If the output format is not recognized.
+    """
+    if output not in VALIDITY_OUTPUTS:
+        raise ValueError(f"output must be one of {VALIDITY_OUTPUTS}")
+    if output == "bool":
+        return valid
+
+    if nulls is not None:
+        valid = valid & ~nulls
+    if output == "bitmap":
+        return packbits(valid)
+    if output == "invalid":
+        return flatnonzero(~valid).astype(int64, copy=False)
+
+    count = int(count_nonzero(valid))
+    return ValidityCounts(count, len(valid) - count)
+
+
+def io_output_strings(
+    values: ndarray, valid: ndarray, output: str
+) -> Union[Tuple[ndarray, ndarray], Any]:
+    """
+    Converts parsed documents or collected attributes, kept as fixed-width strings, into the requested non-object output format. The invalid and null documents are empty strings and their validity is returned apart from the values.
+
+    :param values: The fixed-width strings, one per document.
+    :type values: ndarray
+
+    :param valid: A boolean numpy.ndarray that is True where the document is valid and not null.
+    :type valid: ndarray
+
+    :param output: The output format: "fixed" for a unicode numpy.ndarray, "bytes" for a bytes numpy.ndarray, encoded as UTF-8, each with the validity of each document, or "arrow" for a pyarrow.StringArray, null where the document is not valid.
+    :type output: str
+
+    :return: The values and the validity of the documents, or the Arrow array.
+    :rtype: Union[Tuple[ndarray, ndarray], pyarrow.StringArray]
+
+    :raises ValueError: If the output format is not recognized, or is "arrow" and pyarrow is not installed.
+    """
+    if output not in PARSE_OUTPUTS[1:]:
+        raise ValueError(f"output must be one of {PARSE_OUTPUTS}")
+
+    if output == "fixed":
+        return as_unicode(values), valid
+    if output == "bytes":
+        return as_bytes(values), valid
+
+    if pa is None:
+        raise ValueError('output "arrow" requires pyarrow')
+    # Arrow builds strings from UTF-8 bytes much faster than from UCS4
+    return narray_to_arrow(as_bytes(values), ~valid)
@@ -0,0 +1,381 @@
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import contextmanager
+from math import ceil
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from threading import Lock
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Type,
+    Union,
+)
+
+from numpy import (
+    copyto,
+    dtype,
+    empty,
+    ndarray,
+)
+
+from docbr.core.checkdigit._template import CheckDigit
+from docbr.core.regexp._template import RegExr
+
+
+class _SharedPool:
+    """
+    A persistent executor of one kind, grown to the largest number of workers requested so far. Each call runs at most its own number of tasks at once, so a larger pool does not change how many workers a call uses. A pool replaced by a larger one is shut down once the last call using it has finished.
+
+    :ivar workers: The number of workers of the current pool, 0 if there is none.
+    :vartype workers: int
+    """
+
+    def __init__(self, factory: Callable[[int], Executor]) -> None:
+        self.workers = 0
+        self._factory = factory
+        self._lock = Lock()
+        self._pool: Optional[Executor] = None
+        self._users: Dict[Executor, int] = {}
+
+    def _grow(self, n_jobs: int) -> List[Executor]:
+        """
+        Replaces the current pool by one with `n_jobs` workers if it is smaller. Must be called with the lock held.
+
+        :return: The replaced pool if nothing uses it anymore, to be shut down.
+        :rtype: List[Executor]
+        """
+        if self._pool is not None and n_jobs <= self.workers:
+            return []
+
+        old = self._pool
+        self._pool = self._factory(n_jobs)
+        self.workers = n_jobs
+        self._users[self._pool] = 0
+        if old is None or self._users[old]:
+            return []
+        del self._users[old]
+        return [old]
+
+    def get(self, n_jobs: int) -> Executor:
+        """
+        Returns the current pool, grown to at least `n_jobs` workers.
+        """
+        with self._lock:
+            idle = self._grow(n_jobs)
+            pool = self._pool
+        for old in idle:
+            old.shutdown(wait=False)
+        assert pool is not None
+        return pool
+
+    @contextmanager
+    def lease(self, n_jobs: int) -> Iterator[Executor]:
+        """
+        Lends the current pool, grown to at least `n_jobs` workers, to a call that submits to it inside the context. The pool is not shut down by a resize until it is returned.
+        """
+        with self._lock:
+            idle = self._grow(n_jobs)
+            pool = self._pool
+            assert pool is not None
+            self._users[pool] += 1
+        for old in idle:
+            old.shutdown(wait=False)
+
+        try:
+            yield pool
+        finally:
+            with self._lock:
+                self._users[pool] -= 1
+                retired = pool is not self._pool and not self._users[pool]
+                if retired:
+                    del self._users[pool]
+            if retired:
+                pool.shutdown(wait=False)
+
+    def shutdown(self) -> None:
+        """
+        Shuts every pool down.
+        """
+        with self._lock:
+            pools = list(self._users)
+            self._users.clear()
+            self._pool = None
+            self.workers = 0
+        for pool in pools:
+            pool.shutdown()
+
+
+_pools = _SharedPool(lambda n_jobs: ProcessPoolExecutor(max_workers=n_jobs))
+_thread_pools = _SharedPool(
+    lambda n_jobs: ThreadPoolExecutor(
+        max_workers=n_jobs, thread_name_prefix="docbr"
+    )
+)
+
+MIN_SHARD_SIZE = 65536
+THREAD_CHUNK_SIZE = 32768
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """
+    Resolves the number of workers to be used, where -1 means all CPUs.
+
+    :param n_jobs: The requested number of workers.
+    :type n_jobs: int
+
+    :return: The number of workers.
+    :rtype: int
+
+    :raises ValueError: If `n_jobs` is 0 or lower than -1.
+    """
+    if n_jobs == -1:
+        return cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError("n_jobs must be a positive integer or -1")
+    return n_jobs
+
+
+def get_process_pool(n_jobs: int) -> Executor:
+    """
+    Returns the persistent process pool, with at least `n_jobs` workers, creating it on first use. Workers stay alive between calls, so the start-up cost is paid only once. A call with more workers than the pool has replaces it by a larger one, and the old pool is shut down once the calls using it have finished.
+
+    :param n_jobs: The number of worker processes.
+    :type n_jobs: int
+
+    :return: The process pool.
+    :rtype: ProcessPoolExecutor
+    """
+    return _pools.get(n_jobs)
+
+
+def get_thread_pool(n_jobs: int) -> Executor:
+    """
+    Returns the persistent thread pool, with at least `n_jobs` workers, creating it on first use. It grows like the process pool.
+
+    :param n_jobs: The number of worker threads.
+    :type n_jobs: int
+
+    :return: The thread pool.
+    :rtype: ThreadPoolExecutor
+    """
+    return _thread_pools.get(n_jobs)
+
+
+def shutdown_thread_pool() -> None:
+    """
+    Shuts the persistent thread pools down, if they exist.
+    """
+    _thread_pools.shutdown()
+
+
+def shutdown_process_pool() -> None:
+    """
+    Shuts the persistent process pools down, if they exist.
+    """
+    _pools.shutdown()
+
+
+def run_threads(
+    func: Callable[[Any], Any], items: Sequence[Any], n_jobs: int
+) -> List[Any]:
+    """
+    Calls `func` on each item on the persistent thread pool, starting the items in order, with at most `n_jobs` of them running at once whatever the size of the pool.
+
+    :param func: The function to be called on each item.
+    :type func: Callable[[Any], Any]
+
+    :param items: The items.
+    :type items: Sequence[Any]
+
+    :param n_jobs: The maximum number of items processed at once.
+    :type n_jobs: int
+
+    :return: The result of each item, in the order of `items`.
+    :rtype: List[Any]
+    """
+    results: List[Any] = [None] * len(items)
+    pending = iter(range(len(items)))
+    lock = Lock()
+
+    def lane() -> None:
+        while True:
+            with lock:
+                index = next(pending, None)
+            if index is None:
+                return
+            results[index] = func(items[index])
+
+    with _thread_pools.lease(n_jobs) as pool:
+        futures = [pool.submit(lane) for _ in range(min(n_jobs, len(items)))]
+        wait(futures)
+    for future in futures:
+        future.result()
+    return results
+
+
+def _validate_shard(
+    engine: Type[Union[CheckDigit, RegExr]],
+    lazy: bool,
+    docs_name: str,
+    docs_dtype: str,
+    valid_name: str,
+    size: int,
+    start: int,
+    end: int,
+) -> None:
+    """
+    Validates a shard of the documents stored in shared memory and writes the results into the shared output buffer. Runs inside the worker processes.
+    """
+    docs_shm = SharedMemory(name=docs_name)
+    valid_shm = SharedMemory(name=valid_name)
+    try:
+        docs = ndarray((size,), dtype=docs_dtype, buffer=docs_shm.buf)
+        valid = ndarray((size,), dtype=bool, buffer=valid_shm.buf)
+        valid[start:end] = engine(docs[start:end]).validate(lazy)
+        del docs, valid
+    finally:
+        docs_shm.close()
+        valid_shm.close()
+
+
+def validate_processes(
+    docs: ndarray,
+    engine: Type[Union[CheckDigit, RegExr]],
+    lazy: bool,
+    n_jobs: int,
+) -> ndarray:
+    """
+    Validates documents in parallel on the persistent process pool.
+
+    The documents are copied once into shared memory and split into at most `n_jobs` contiguous shards, one per worker. Workers attach to the shared block instead of receiving pickled copies, and write their results straight into a shared boolean buffer.
+
+    :param docs: A fixed-width string numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :param engine: The validation class of the document type.
+    :type engine: Type[Union[CheckDigit, RegExr]]
+
+    :param lazy: Whether or not to skip the extraction of the documents before validating.
+    :type lazy: bool
+
+    :param n_jobs: The number of worker processes, -1 means all CPUs.
+    :type n_jobs: int
+
+    :return: A numpy.ndarray containing booleans indicating the validity of each document.
+    :rtype: numpy.ndarray
+    """
+    n_jobs = resolve_n_jobs(n_jobs)
+    size = len(docs)
+    shards = min(n_jobs, ceil(size / MIN_SHARD_SIZE))
+    if shards <= 1:
+        return engine(docs).validate(lazy)
+
+    docs_shm = SharedMemory(create=True, size=max(docs.nbytes, 1))
+    valid_shm = SharedMemory(create=True, size=size)
+    try:
+        shared = ndarray(docs.shape, dtype=docs.dtype, buffer=docs_shm.buf)
+        copyto(shared, docs)
+        del shared
+
+        bounds = [size * i // shards for i in range(shards + 1)]
+        with _pools.lease(n_jobs) as pool:
+            futures = [
+                pool.submit(
+                    _validate_shard,
+                    engine,
+                    lazy,
+                    docs_shm.name,
+                    dtype(docs.dtype).str,
+                    valid_shm.name,
+                    size,
+                    start,
+                    end,
+                )
+                for start, end in zip(bounds[:-1], bounds[1:])
+            ]
+            wait(futures)
+        for future in futures:
+            future.result()
+
+        valid = ndarray((size,), dtype=bool, buffer=valid_shm.buf).copy()
+        return valid
+    finally:
+        docs_shm.close()
+        docs_shm.unlink()
+        valid_shm.close()
+        valid_shm.unlink()
+
+
+def _validate_chunk(
+    engine: Type[Union[CheckDigit, RegExr]],
+    lazy: bool,
+    docs: ndarray,
+    valid: ndarray,
+    start: int,
+    end: int,
+) -> None:
+    """
+    Validates a chunk of the documents and writes the results into its slice of the output array. Runs inside the worker threads.
+    """
+    valid[start:end] = engine(docs[start:end]).validate(lazy)
+
+
+def validate_threads(
+    docs: ndarray,
+    engine: Type[Union[CheckDigit, RegExr]],
+    lazy: bool,
+    n_jobs: int,
+    chunk_size: int = THREAD_CHUNK_SIZE,
+) -> ndarray:
+    """
+    Validates documents in parallel on the persistent thread pool.
+
+    The documents are cut into cache-sized chunks that are validated by at most `n_jobs` threads at once, each chunk by its own engine instance, while NumPy releases the GIL. Every chunk writes into its own slice of a single preallocated result array, so threads share no mutable state and the memory peak is bounded by the chunks in flight.
+
+    :param docs: A fixed-width string numpy.ndarray with the documents.
+    :type docs: numpy.ndarray
+
+    :param engine: The validation class of the document type.
+    :type engine: Type[Union[CheckDigit, RegExr]]
+
+    :param lazy: Whether or not to skip the extraction of the documents before validating.
+    :type lazy: bool
+
+    :param n_jobs: The number of worker threads, -1 means all CPUs.
+    :type n_jobs: int
+
+    :param chunk_size: The number of documents validated by each task.
+    :type chunk_size: int
+
+    :return: A numpy.ndarray containing booleans indicating the validity of each document.
+    :rtype: numpy.ndarray
+
+    :raises ValueError: If `chunk_size` is lower than 1.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be greater than 0")
+
+    n_jobs = resolve_n_jobs(n_jobs)
+    size = len(docs)
+    if size <= chunk_size:
+        return engine(docs).validate(lazy)
+
+    valid = empty(size, dtype=bool)
+    run_threads(
+        lambda start: _validate_chunk(
+            engine, lazy, docs, valid, start, min(start + chunk_size, size)
+        ),
+        range(0, size, chunk_size),
+        n_jobs,
+    )
+    return valid
@@ -0,0 +1,273 @@
+import tracemalloc
+from collections import namedtuple
+from contextlib import contextmanager
+from functools import wraps
+from threading import (
+    Lock,
+    current_thread,
+    local,
+    main_thread,
+)
+from time import perf_counter_ns
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+ProfileEvent = namedtuple(
+    "ProfileEvent",
+    ["doctype", "stage", "rows", "width", "elapsed_ns", "allocated_bytes"],
+)
+
+_hooks: List[Callable[[ProfileEvent], None]] = []
+_hooks_lock = Lock()
+
+# the stages measured by each thread, each with the traced memory at its start
+# and its peak so far, kept over the peak resets of the stages nested in it
+_open_stages = local()
+
+
+def add_profile_hook(hook: Callable[[ProfileEvent], None]) -> None:
+    """
+    Registers a callback that receives a ProfileEvent for each internal stage executed, with the doctype, stage name, number of rows, input width, elapsed time in nanoseconds and bytes allocated (None unless tracemalloc is tracing and the stage runs on the main thread).
+
+    Hooks are called in the thread that executed the stage. Stages executed by worker processes are not reported. The traced memory and its peak are global to the process, so the allocations are only attributed to the stages of the main thread, and include those made meanwhile by other threads.
+
+    :param hook: The callback to be registered.
+    :type hook: Callable[[ProfileEvent], None]
+    """
+    global _hooks
+    with _hooks_lock:
+        _hooks = _hooks + [hook]
+
+
+def remove_profile_hook(hook: Callable[[ProfileEvent], None]) -> None:
+    """
+    Removes a callback registered with `add_profile_hook`.
+
+    :param hook: The callback to be removed.
+    :type hook: Callable[[ProfileEvent], None]
+
+    :raises ValueError: If the callback is not registered.
+    """
+    global _hooks
+    with _hooks_lock:
+        hooks = list(_hooks)
+        hooks.remove(hook)
+        _hooks = hooks
+
+
+def _width(docs: Any) -> int:
+    """
+    Returns the width, in characters, of a string array.
+
+    :param docs: The documents.
+    :type docs: Any
+
+    :return: The number of characters per document, or 0 if `docs` is not a string array.
+    :rtype: int
+    """
+    dtype = getattr(docs, "dtype", None)
+    if dtype is None or dtype.kind not in "SU":
+        return 0
+    return dtype.itemsize // (4 if dtype.kind == "U" else 1)
+
+
+def _stages() -> List[List[int]]:
+    """
+    Returns the stages measured by the current thread, from the outermost.
+    """
+    stages = getattr(_open_stages, "stages", None)
+    if stages is None:
+        stages = _open_stages.stages = []
+    return stages
+
+
+def start_stage() -> Optional[Tuple[int, Optional[List[int]]]]:
+    """
+    Starts measuring a stage.
+
+    The peak of traced memory is reset for the new stage, so the peak reached so far by the stage it is nested in is kept with that stage first. Stages of other threads than the main one do not trace memory, as resetting the peak would disturb the stages of the main thread.
+
+    :return: The start time and the traced memory at the start and peak of the stage, or None if no hook is registered.
+    :rtype: Optional[Tuple[int, Optional[List[int]]]]
+    """
+    if not _hooks:
+        return None
+
+    memory = None
+    if tracemalloc.is_tracing() and current_thread() is main_thread():
+        current, peak = tracemalloc.get_traced_memory()
+        stages = _stages()
+        if stages:
+            stages[-1][1] = max(stages[-1][1], peak)
+        tracemalloc.reset_peak()
+        memory = [current, current]
+        stages.append(memory)
+    return perf_counter_ns(), memory
+
+
+def end_stage(
+    start: Optional[Tuple[int, Optional[List[int]]]],
+    doctype: str,
+    stage: str,
+    docs: Any,
+) -> None:
+    """
+    Finishes measuring a stage and sends its ProfileEvent to the registered hooks.
+
+    :param start: The value returned by `start_stage`.
+    :type start: Optional[Tuple[int, Optional[List[int]]]]
+
+    :param doctype: The name of the document class.
+    :type doctype: str
+
+    :param stage: The name of the stage.
+    :type stage: str
+
+    :param docs: The documents processed by the stage.
+    :type docs: Any
+    """
+    if start is None:
+        return
+
+    elapsed = perf_counter_ns() - start[0]
+    allocated = None
+    memory = start[1]
+    if memory is not None:
+        # stages nested in this one that did not end are dropped with it
+        stages = _stages()
+        for index, opened in enumerate(stages):
+            if opened is memory:
+                del stages[index:]
+                break
+        if tracemalloc.is_tracing():
+            peak = max(tracemalloc.get_traced_memory()[1], memory[1])
+            allocated = max(peak - memory[0], 0)
+
+    event = ProfileEvent(
+        doctype, stage, len(docs), _width(docs), elapsed, allocated
+    )
+    for hook in _hooks:
+        hook(event)
+
+
+def profiled(stage: str) -> Callable:
+    """
+    Decorates a method of a document class so that each call is reported to the profile hooks as `stage`. When no hook is registered, the method is called directly.
+
+    :param stage: The name of the stage.
+    :type stage: str
+
+    :return: The decorator.
+    :rtype: Callable
+    """
+
+    def decorator(method: Callable) -> Callable:
+        @wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            if not _hooks:
+                return method(self, *args, **kwargs)
+
+            docs = self._documents
+            start = start_stage()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                end_stage(start, type(self).__name__, stage, docs)
+
+        return wrapper
+
+    return decorator
+
+
+class Profiler:
+    """
+    A profile hook that aggregates the events by doctype and stage.
+
+    :ivar stats: The number of calls, rows, elapsed nanoseconds and allocated bytes of each doctype and stage.
+    :vartype stats: Dict[Tuple[str, str], List[int]]
+    """
+
+    def __init__(self) -> None:
+        self.stats: Dict[Tuple[str, str], List[int]] = {}
+        self._lock = Lock()
+
+    def __call__(self, event: ProfileEvent) -> None:
+        """
+        Aggregates an event.
+
+        :param event: The event to be aggregated.
+        :type event: ProfileEvent
+        """
+        with self._lock:
+            stats = self.stats.setdefault(
+                (event.doctype, event.stage), [0, 0, 0, 0]
+            )
+            stats[0] += 1
+            stats[1] += event.rows
+            stats[2] += event.elapsed_ns
+            stats[3] += event.allocated_bytes or 0
+
+    def report(self) -> str:
+        """
+        Formats the aggregated profile as a table, grouped by doctype, with the stages sorted by elapsed time.
+
+        :return: The profile table.
+        :rtype: str
+        """
+        header = (
+            f"{'doctype':<14}{'stage':<26}{'calls':>8}{'rows':>12}"
+            f"{'total ms':>12}{'rows/s':>16}{'alloc MB':>12}"
+        )
+        lines = [header, "-" * len(header)]
+
+        with self._lock:
+            stats = sorted(
+                self.stats.items(), key=lambda x: (x[0][0], -x[1][2])
+            )
+
+        for (doctype, stage), (calls, rows, elapsed, allocated) in stats:
+            speed = rows / (elapsed / 1e9) if elapsed else 0
+            lines.append(
+                f"{doctype:<14}{stage:<26}{calls:>8}{rows:>12}"
+                f"{elapsed / 1e6:>12.3f}{speed:>16,.0f}"
+                f"{allocated / 2**20:>12.2f}"
+            )
+        return "\n".join(lines)
+
+    def print_report(self) -> None:
+        """
+        Prints the aggregated profile.
+        """
+        print(self.report())
+
+
+@contextmanager
+def profile(trace_memory: bool = False) -> Iterator[Profiler]:
+    """
+    Profiles the internal stages executed inside the context.
+
+    :param trace_memory: If True, traces the memory allocated by each stage with tracemalloc, which slows the execution down. Only meaningful for single-threaded calls: the stages run by worker threads report no allocation, and the stages of the main thread also count what other threads allocate meanwhile.
+    :type trace_memory: bool
+
+    :return: A Profiler with the aggregated events.
+    :rtype: Iterator[Profiler]
+    """
+    profiler = Profiler()
+    start_tracing = trace_memory and not tracemalloc.is_tracing()
+    if start_tracing:
+        tracemalloc.start()
+
+    add_profile_hook(profiler)
+    try:
+        yield profiler
+    finally:
+        remove_profile_hook(profiler)
+        if start_tracing:
+            tracemalloc.stop()
@@ -1,16 +1,57 @@
+from typing import (
+    Optional,
+    Tuple,
+)
+
 from numpy import (
+    arange,
+    array,
+    ascontiguousarray,
+    char,
+    count_nonzero,
+    cumsum,
+    finfo,
+    flatnonzero,
+    float64,
+    floor,
     frombuffer,
+    intp,
+    isfinite,
+    isin,
     ndarray,
+    newaxis,
+    repeat,
+    take_along_axis,
+    uint8,
+    uint32,
+    uint64,
+    where,
+    zeros,
+)
+
+# character classes of `_numeric_notation`: other, digit, dot, exponent, sign
+# and blank
+NUMERIC_CLASSES = zeros(256, dtype=uint8)
+NUMERIC_CLASSES[48:58] = 1
+NUMERIC_CLASSES[46] = 2
+NUMERIC_CLASSES[[69, 101]] = 3
+NUMERIC_CLASSES[[43, 45]] = 4
+NUMERIC_CLASSES[[0, 32]] = 5
+
+# non-ASCII characters matched by "\s" in regular expressions
+UNICODE_SPACES = array(
+    [0x85, 0xA0, 0x1680, *range(0x2000, 0x200B), 0x2028, 0x2029]
+    + [0x202F, 0x205F, 0x3000]
 )
 
 
 def array_slicer(
-    narray: ndarray, start: int, end: int = None, dtype: type = str
+    narray: ndarray, start: int, end: Optional[int] = None, dtype: type = str
 ) -> ndarray:
     """
     Slices a numpy.ndarray along its second axis based on a start and (optionally) an end index.
 
-    :param narray: The numpy.ndarray to be sliced.
+    :param narray: The numpy.ndarray to be sliced, either unicode (`U`) or bytes (`S`).
     :type narray: ndarray
 
     :param start: The index at which to begin slicing the numpy.ndarray.
@@ -30,13 +71,376 @@ def array_slicer(
     if dtype not in [str, int]:
         raise ValueError("dtype must be str or int")
 
-    narray = narray.view((str, 1)).reshape(len(narray), -1)
+    char_type = narray.dtype.type
+    narray = narray[:, newaxis].view((char_type, 1))
     if end is not None:
         end += 1
         narray = narray[:, start:end]
-        _inner_dtype = (str, end - start)
+        _inner_dtype = (char_type, end - start)
     else:
         narray = narray[:, start]
-        _inner_dtype = (str, 1)
+        _inner_dtype = (char_type, 1)
     narray = frombuffer(narray.tobytes(), dtype=_inner_dtype)
     return narray.astype(dtype)
+
+
+def to_char_matrix(narray: ndarray) -> ndarray:
+    """
+    Returns a zero-copy two-dimensional view of the code units of a string array, one row per document and one column per character. Strided arrays, such as views of the first characters of a wider array, are viewed in place as well.
+
+    Bytes arrays (`S` dtype) are viewed as uint8 and unicode arrays (`U` dtype) as uint32, so both can be scanned with the same integer comparisons.
+
+    :param narray: The string array to be viewed.
+    :type narray: ndarray
+
+    :return: A uint8 or uint32 matrix with shape (len(narray), width).
+    :rtype: ndarray
+
+    :raises ValueError: If the array is not a unicode or bytes array.
+    """
+    if narray.dtype.kind not in "SU":
+        raise ValueError("narray must be a unicode or bytes array")
+
+    unit = uint8 if narray.dtype.kind == "S" else uint32
+    return narray[:, newaxis].view(unit)
+
+
+def to_byte_matrix(narray: ndarray) -> ndarray:
+    """
+    Converts a string array into a two-dimensional uint8 matrix, one row per document and one column per character.
+
+    Bytes arrays (`S` dtype) are viewed in place, without any conversion. Unicode arrays (`U` dtype) are narrowed to one byte per character; code points outside the ASCII range are never part of a document, so they are blanked to 0.
+
+    :param narray: The string array to be converted.
+    :type narray: ndarray
+
+    :return: A uint8 matrix with shape (len(narray), width).
+    :rtype: ndarray
+
+    :raises ValueError: If the array is not a unicode or bytes array.
+    """
+    chars = to_char_matrix(narray)
+    if chars.dtype == uint8:
+        return chars
+
+    if chars.size > 0 and chars.max() > 127:
+        chars = where(chars > 127, 0, chars)
+    return chars.astype(uint8)
+
+
+def from_byte_matrix(matrix: ndarray) -> ndarray:
+    """
+    Converts a two-dimensional uint8 matrix back into a fixed-width bytes array (`S` dtype), one document per row.
+
+    :param matrix: The uint8 matrix to be converted.
+    :type matrix: ndarray
+
+    :return: A bytes array with one element per row of the matrix.
+    :rtype: ndarray
+    """
+    if matrix.shape[1] == 0:
+        return zeros(len(matrix), dtype="S1")
+
+    matrix = ascontiguousarray(matrix, dtype=uint8)
+    return matrix.view(f"S{matrix.shape[1]}").reshape(len(matrix))
+
+
+def from_code_matrix(matrix: ndarray) -> ndarray:
+    """
+    Converts a two-dimensional uint32 matrix of code points back into a fixed-width unicode array (`U` dtype), one document per row.
+
+    :param matrix: The uint32 matrix to be converted.
+    :type matrix: ndarray
+
+    :return: A unicode array with one element per row of the matrix.
+    :rtype: ndarray
+    """
+    if matrix.shape[1] == 0:
+        return zeros(len(matrix), dtype="U1")
+
+    matrix = ascontiguousarray(matrix, dtype=uint32)
+    return matrix.view(f"U{matrix.shape[1]}").reshape(len(matrix))
+
+
+def as_unicode(narray: ndarray) -> ndarray:
+    """
+    Returns a unicode (`U` dtype) version of a string array, decoding bytes (`S` dtype) input if necessary.
+
+    ASCII bytes are widened to UCS4 code points with a single vectorized cast; other bytes are decoded as latin-1. Integer arrays are formatted as their decimal digits.
+
+    :param narray: The string or integer array to be converted.
+    :type narray: ndarray
+
+    :return: The input as a unicode array.
+    :rtype: ndarray
+    """
+    if narray.dtype.kind in "iu":
+        return narray.astype(str)
+    if narray.dtype.kind != "S":
+        return narray
+
+    chars = to_char_matrix(narray)
+    if chars.size > 0 and chars.max() > 127:
+        return char.decode(narray, "latin-1")
+
+    chars = chars.astype(uint32)
+    return chars.view(f"U{chars.shape[1]}").reshape(len(chars))
+
+
+def as_bytes(narray: ndarray) -> ndarray:
+    """
+    Returns a bytes (`S` dtype) version of a string array, encoding unicode (`U` dtype) input if necessary.
+
+    ASCII code points are narrowed to bytes with a single vectorized cast; other strings are encoded as UTF-8.
+
+    :param narray: The string array to be converted.
+    :type narray: ndarray
+
+    :return: The input as a bytes array.
+    :rtype: ndarray
+    """
+    if narray.dtype.kind != "U":
+        return narray
+
+    chars = to_char_matrix(narray)
+    if chars.size > 0 and chars.max() > 127:
+        return char.encode(narray, "utf-8")
+    return from_byte_matrix(chars.astype(uint8))
+
+
+def char_table(chars: str) -> ndarray:
+    """
+    Builds a lookup table that is True at the ASCII codes of the given characters, to classify the codes of a uint8 matrix with a single indexing operation.
+
+    :param chars: The characters of the class.
+    :type chars: str
+
+    :return: A boolean numpy.ndarray with 256 elements.
+    :rtype: ndarray
+    """
+    table = zeros(256, dtype=bool)
+    table[[ord(c) for c in chars]] = True
+    return table
+
+
+def to_ascii_matrix(narray: ndarray, pad: int = 0) -> ndarray:
+    """
+    Converts a unicode string array into a uint8 matrix of ASCII codes, one row per document, followed by `pad` columns of zeros so that patterns can look past the end of the documents without bounds checks.
+
+    Non-ASCII whitespace becomes a space and the other non-ASCII characters become 0, which no ASCII character class matches.
+
+    :param narray: The unicode array to be converted.
+    :type narray: ndarray
+
+    :param pad: The number of columns of zeros added to the right.
+    :type pad: int
+
+    :return: A uint8 matrix with shape (len(narray), width + pad).
+    :rtype: ndarray
+    """
+    chars = to_char_matrix(narray)
+    matrix = zeros((len(chars), chars.shape[1] + pad), dtype=uint8)
+    matrix[:, : chars.shape[1]] = chars
+
+    wide = chars > 127
+    if wide.any():
+        spaces = isin(chars[wide], UNICODE_SPACES)
+        matrix[:, : chars.shape[1]][wide] = where(spaces, 32, 0)
+    return matrix
+
+
+def slice_spans(narray: ndarray, start: ndarray, end: ndarray) -> ndarray:
+    """
+    Slices each document of a unicode array between its own start and end columns.
+
+    :param narray: The unicode array to be sliced.
+    :type narray: ndarray
+
+    :param start: The first column of each slice, or -1 for an empty slice.
+    :type start: ndarray
+
+    :param end: The column after the last one of each slice.
+    :type end: ndarray
+
+    :return: A unicode array with the slices, as wide as the longest one.
+    :rtype: ndarray
+    """
+    found = start >= 0
+    length = where(found, end - start, 0)
+    width = max(int(length.max(initial=0)), 1)
+
+    chars = to_char_matrix(narray)
+    columns = where(found, start, 0)[:, newaxis] + arange(width, dtype=intp)
+    columns = columns.clip(0, chars.shape[1] - 1)
+    sliced = take_along_axis(chars, columns, axis=1)
+    sliced[arange(width) >= length[:, newaxis]] = 0
+    return from_code_matrix(sliced)
+
+
+def pack_rows(chars: ndarray, keep: ndarray) -> ndarray:
+    """
+    Moves the kept characters of each row of a uint32 code matrix to the start of the row, in order, and returns the rows as a unicode array as wide as the longest one.
+
+    :param chars: The uint32 matrix of code points.
+    :type chars: ndarray
+
+    :param keep: A boolean matrix with the same shape, True where the character is kept.
+    :type keep: ndarray
+
+    :return: A unicode array with one document per row.
+    :rtype: ndarray
+    """
+    counts = count_nonzero(keep, axis=1)
+    width = max(int(counts.max(initial=0)), 1)
+
+    values = chars[keep]
+    starts = repeat(cumsum(counts) - counts, counts)
+    rank = arange(len(values), dtype=intp) - starts
+    rows = repeat(arange(len(chars), dtype=intp), counts)
+
+    packed = zeros((len(chars), width), dtype=uint32)
+    packed[rows, rank] = values
+    return from_code_matrix(packed)
+
+
+def fill_mask(chars: ndarray, mask: str) -> ndarray:
+    """
+    Fills the "#" of a formatting mask with the characters of each row of a uint32 code matrix, in order. Rows narrower than the mask leave zeros in the remaining slots.
+
+    :param chars: The uint32 matrix of code points.
+    :type chars: ndarray
+
+    :param mask: The formatting mask.
+    :type mask: str
+
+    :return: A uint32 matrix with one formatted document per row and one column per character of the mask.
+    :rtype: ndarray
+    """
+    template = frombuffer(mask.encode("utf-32-le"), dtype=uint32)
+    slots = flatnonzero(template == ord("#"))
+    width = min(len(slots), chars.shape[1])
+
+    filled = repeat(template[newaxis], len(chars), axis=0)
+    filled[:, slots] = 0
+    filled[:, slots[:width]] = chars[:, :width]
+    return filled
+
+
+def blank_invalid(narray: ndarray, valid: ndarray) -> ndarray:
+    """
+    Replaces the values of the invalid documents with empty strings, keeping the results as fixed-width strings. Fixed-width arrays are blanked in place; other arrays are converted to unicode.
+
+    :param narray: The results, one per document.
+    :type narray: ndarray
+
+    :param valid: A boolean numpy.ndarray that is True where the document is valid.
+    :type valid: ndarray
+
+    :return: The results as a fixed-width string array, empty where the document is invalid.
+    :rtype: ndarray
+    """
+    if narray.dtype.kind not in "SU":
+        return where(valid, narray, "").astype(str)
+
+    narray[~valid] = narray.dtype.type()
+    return narray
+
+
+def _exact_integers(narray: ndarray) -> Tuple[ndarray, ndarray]:
+    """
+    Converts a float array into a uint64 array with the exact integer each float holds.
+
+    Floats only represent every integer up to 2 ** (mantissa bits + 1), 2 ** 53 for float64. Floats at or past that limit may have lost digits, so they are not exact, as are the negative, non-integer and non-finite ones.
+
+    :param narray: The float array to be converted.
+    :type narray: ndarray
+
+    :return: The integers, 0 where the float is not exact, and a boolean array that is True where it is.
+    :rtype: Tuple[ndarray, ndarray]
+    """
+    limit = 2.0 ** (finfo(narray.dtype).nmant + 1)
+    exact = isfinite(narray) & (narray >= 0) & (narray < limit)
+    exact &= floor(narray) == narray
+    return where(exact, narray, 0).astype(uint64), exact
+
+
+def float_to_integer(narray: ndarray) -> ndarray:
+    """
+    Converts a float array into a uint64 array with the exact integer each float holds. Floats past the integer precision of their type (2 ** 53 for float64), negative, non-integer or non-finite are read as 0, which is never a valid document.
+
+    :param narray: The float array to be converted.
+    :type narray: ndarray
+
+    :return: A uint64 array with the integers.
+    :rtype: ndarray
+    """
+    return _exact_integers(narray)[0]
+
+
+def _numeric_notation(narray: ndarray) -> ndarray:
+    """
+    Marks the documents written as a number: an optional sign, digits with at most one dot, and at most one "e" or "E" followed by an optional sign and one to three digits, between optional blanks.
+
+    :param narray: The unicode array to be checked.
+    :type narray: ndarray
+
+    :return: A boolean array that is True where the document is written as a number.
+    :rtype: ndarray
+    """
+    kind = NUMERIC_CLASSES[to_ascii_matrix(narray)]
+    index = arange(len(kind), dtype=intp)
+    width = max(kind.shape[1], 1)
+
+    has_dot = count_nonzero(kind == 2, axis=1)
+    has_exp = count_nonzero(kind == 3, axis=1)
+    filled = kind != 5
+    start = filled.argmax(axis=1)
+    end = kind.shape[1] - filled[:, ::-1].argmax(axis=1)
+    pos_exp = where(has_exp > 0, (kind == 3).argmax(axis=1), end)
+    pos_dot = where(has_dot > 0, (kind == 2).argmax(axis=1), pos_exp)
+    has_lead = kind[index, start % width] == 4
+    has_sign = (has_exp > 0) & (kind[index, (pos_exp + 1) % width] == 4)
+    m_len = pos_exp - start - has_lead - has_dot
+    e_len = where(has_exp > 0, end - pos_exp - 1 - has_sign, 0)
+
+    # with every non-digit counted, the digits fill the rest of the number
+    numeric = (has_dot <= 1) & (has_exp <= 1) & ~(kind == 0).any(axis=1)
+    numeric &= count_nonzero(filled, axis=1) == end - start
+    numeric &= count_nonzero(kind == 1, axis=1) == m_len + e_len
+    numeric &= count_nonzero(kind == 4, axis=1) == has_lead + has_sign
+    numeric &= (m_len >= 1) & (pos_dot <= pos_exp)
+    numeric &= (has_exp == 0) | ((e_len >= 1) & (e_len <= 3))
+    return numeric
+
+
+def numeric_to_integer(narray: ndarray) -> ndarray:
+    """
+    Rewrites the documents written as numbers by spreadsheets, with a ".0" suffix ("12345678901.0") or in exponent notation ("1.2345678901E+10"), as the integer they denote.
+
+    The rows with a dot or an exponent are checked to be written as a number, so that whether a row is converted depends only on the row itself, then parsed as float64 in bulk and kept when they hold an exact integer. Dotted numbers with a non-zero fraction and no exponent are left as they are, as are masked documents, which are not numbers. Numbers in exponent notation that are not integers, or are past 2 ** 53, are flagged as 0, which is never a valid document.
+
+    :param narray: The unicode or bytes array to be normalized.
+    :type narray: ndarray
+
+    :return: A uint64 array when every document is written as a number, or a unicode array with the numbers rewritten as their digits.
+    :rtype: ndarray
+    """
+    narray = as_unicode(narray)
+    dots = char.count(narray, ".")
+    exps = char.count(narray, "e") + char.count(narray, "E")
+    rows = flatnonzero(((dots + exps) > 0) & (dots <= 1) & (exps <= 1))
+    if not len(rows):
+        return narray
+
+    rows = rows[_numeric_notation(narray[rows])]
+    values = narray[rows].astype(float64)
+
+    integers, exact = _exact_integers(values)
+    keep = exact | (exps[rows] > 0)
+    if keep.all() and len(rows) == len(narray):
+        return integers
+
+    rows, integers = rows[keep], integers[keep]
+    result = narray.astype(f"U{max(narray.dtype.itemsize // 4, 20)}")
+    result[rows] = integers.astype(str)
+    return result
@@ -1,26 +1,44 @@
 from typing import (
     Any,
     Callable,
+    Dict,
     List,
-    Literal,
+    Optional,
     Tuple,
 )
 
 from numpy import (
     all,
     array,
+    ascontiguousarray,
+    divmod,
+    empty,
+    flatnonzero,
     frombuffer,
-    hstack,
-    indices,
     int8,
+    int16,
+    intp,
     invert,
+    logical_and,
+    matmul,
     ndarray,
     newaxis,
+    nonzero,
+    ones,
     repeat,
-    roll,
-    sort,
-    zeros,
-    zeros_like,
+    subtract,
+    uint8,
+    uint64,
+    where,
+)
+
+from docbr.core._profile import profiled
+from docbr.core._utils import (
+    as_unicode,
+    blank_invalid,
+    from_byte_matrix,
+    to_byte_matrix,
+    to_char_matrix,
 )
 
 
@@ -28,6 +46,8 @@ class CheckDigit:
     """
     This class provides methods to parse and validate check digits from an array of documents.
 
+    Documents are processed as ASCII bytes: every stage works on uint8 matrices instead of UCS4 code points, and bytes (`S` dtype) input is used as is, without conversion. Integer input is validated on digits extracted arithmetically, without ever being formatted as strings.
+
     :param docs: A numpy.ndarray with the input data.
     :type docs: numpy.ndarray
 
@@ -56,91 +76,188 @@ class CheckDigit:
     :vartype _attributes: dict[str, Any]
     """
 
+    _plans: Dict[type, Tuple[ndarray, Tuple[int, ...]]] = {}
+    _block_size = 65536
+
     def __init__(self, docs: ndarray) -> None:
         self._documents = docs
-        self._is_valid = array([True] * len(docs))
+        self._is_valid = ones(len(docs), dtype=bool)
+        self._scratch: Optional[Dict[str, ndarray]] = None
+        self._in_place = False
+        self._fixed_width = False
 
         self._doc_len = 0
         self._modulo = 0
         self._format_mask = ""
-        self._operation = lambda x: x
+        self._operation: Callable[[Any], Any] = lambda x: x
         self._sequence: List[Tuple[List[int], int]] = []
         self._attributes: dict[str, Any] = {}
 
-    def _fit_documents(self, remove_dot_zero: bool = False) -> None:
+    def _bind(
+        self, docs: ndarray, scratch: Optional[Dict[str, ndarray]] = None
+    ) -> "CheckDigit":
+        """
+        Returns a new instance for `docs` that shares the document specification of this one, without running `__init__` again.
+
+        :param docs: A numpy.ndarray with the input data.
+        :type docs: numpy.ndarray
+
+        :param scratch: A dictionary of buffers reused between calls for the intermediate matrices, or None to allocate them on every call.
+        :type scratch: Optional[Dict[str, numpy.ndarray]]
+
+        :return: The new instance.
+        :rtype: CheckDigit
+        """
+        instance = object.__new__(type(self))
+        instance.__dict__.update(self.__dict__)
+        instance._documents = docs
+        instance._is_valid = ones(len(docs), dtype=bool)
+        instance._scratch = scratch
+        return instance
+
+    def _buffer(
+        self, name: str, shape: Tuple[int, ...], dtype: type
+    ) -> ndarray:
+        """
+        Returns an uninitialized array for an intermediate matrix, reusing the scratch buffer of the same name when its shape and type match.
+
+        :param name: The name of the buffer.
+        :type name: str
+
+        :param shape: The shape of the array.
+        :type shape: Tuple[int, ...]
+
+        :param dtype: The type of the array.
+        :type dtype: type
+
+        :return: The array.
+        :rtype: numpy.ndarray
+        """
+        if self._scratch is None:
+            return empty(shape, dtype=dtype)
+
+        buffer = self._scratch.get(name)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._scratch[name] = empty(shape, dtype=dtype)
+        return buffer
+
+    @profiled("fit_documents")
+    def _fit_documents(self) -> None:
         """
         Fits the input data to the defined document length and formats.
 
-        :param remove_dot_zero: Whether or not to remove '.0' from the end of the documents.
-        :type remove_dot_zero: bool
+        The characters are scanned column by column, from right to left, and every digit is written into a uint8 matrix of the document length, right aligned and left padded with zeros. The input is read through a zero-copy view, so no intermediate matrix of the input size is created. Small batches, where the cost of each column scan is dominated by call overhead, place all digits at once instead.
         """
+        if self._in_place:
+            return self._fit_in_place()
+        if self._documents.dtype.kind in "iu":
+            fitted = self._fit_integers()
+            fitted += 48
+            self._documents = from_byte_matrix(fitted)
+            return
+
+        chars = to_char_matrix(self._documents)
+        doc_qty, width = chars.shape
+
+        fitted = self._buffer("fitted", (doc_qty, self._doc_len), uint8)
+        fitted.fill(48)
+        cursor = self._buffer("cursor", (doc_qty,), intp)
+        cursor.fill(self._doc_len - 1)
+        aligned = doc_qty > 0
+
+        if doc_qty * width <= self._block_size:
+            is_digit = (chars - 48) < 10
+            position = is_digit[:, ::-1].cumsum(axis=1)[:, ::-1]
+            position = self._doc_len - position
+            rows, cols = nonzero(is_digit & (position >= 0))
+            fitted[rows, position[rows, cols]] = chars[rows, cols]
+            width = 0
+
+        for col in range(width - 1, -1, -1):
+            column = chars[:, col]
+            is_digit = (column - 48) < 10
+
+            if aligned and is_digit.all():
+                if cursor[0] >= 0:
+                    fitted[:, cursor[0]] = column
+                cursor -= 1
+                continue
+
+            aligned = False
+            is_digit &= cursor >= 0
+            rows = flatnonzero(is_digit)
+            fitted[rows, cursor[rows]] = column[rows]
+            cursor -= is_digit
+
+        self._documents = from_byte_matrix(fitted)
+
+    @profiled("fit_integers")
+    def _fit_integers(self) -> ndarray:
+        """
+        Fits integer documents to the defined document length without formatting them as strings.
 
-        def keep_only_digits(narray: ndarray) -> ndarray:
-            mask = (narray > 57) | (narray < 48)
-            if remove_dot_zero:  # pragma: no cover
-                last_id = narray.shape[1] - 1
-                ids = indices(narray.shape)[1]
-                mask |= (narray + roll(narray, 1) == 94) & (
-                    (narray + roll(narray, -1) == 48) | (ids == last_id)
-                )
-            narray[mask] = 0
-            return narray
-
-        def align_chars(
-            narray: ndarray, align: Literal["left", "right"]
-        ) -> ndarray:
-            if align not in ["left", "right"]:  # pragma: no cover
-                raise ValueError('align side must be "left" or "right"')
-
-            mask = narray > 0
-            justified_mask = sort(mask, 1)
-            if align == "left":  # pragma: no cover
-                justified_mask = justified_mask[:, ::-1]
-            out = zeros_like(narray)
-            out[justified_mask] = narray[mask]
-            return out
-
-        def fit_length(
-            narray: ndarray, char_len: int, align: Literal["left", "right"]
-        ) -> ndarray:
-            if char_len < 1:  # pragma: no cover
-                raise ValueError("char_len must be greater than 0")
-            if align not in ["left", "right"]:  # pragma: no cover
-                raise ValueError('align side must be "left" or "right"')
-
-            last_id = narray.shape[1] - 1
-            n_cols = char_len - last_id - 1
-
-            if n_cols > 0:
-                zero = zeros((narray.shape[0], n_cols), dtype=int)
-                if align == "left":
-                    return hstack((zero, narray))
-                else:
-                    return hstack((narray, zero))
-
-            elif n_cols < 0:
-                if align == "left":
-                    return narray[:, -char_len:]
-                else:
-                    return narray[:, :char_len]
-
-            else:
-                return narray
-
-        self._documents = (
-            self._documents.view((str, 1))
-            .reshape(len(self._documents), -1)
-            .view(int)
-        )
-        self._documents = keep_only_digits(self._documents)
-        self._documents = align_chars(self._documents, "right")
-        self._documents = fit_length(self._documents, self._doc_len, "left")
-        self._documents[self._documents == 0] = 48
-        self._documents = frombuffer(
-            self._documents.tobytes(), dtype=(str, self._documents.shape[1])
-        )
-        self._documents = self._documents.astype(str)
+        The digits are pulled out arithmetically, one column at a time from right to left, by an in-place division by ten of the whole array, into a uint8 matrix of the document length. The leading zeros lost by integer storage are the columns left when the values run out of digits. As with string documents, documents with more digits keep their last ones. Negative documents are fitted as zeros and are invalid.
+
+        :return: A uint8 matrix with the digits, from 0 to 9, of each document.
+        :rtype: numpy.ndarray
+        """
+        values = self._documents.astype(uint64)
+        if self._documents.dtype.kind == "i":
+            negative = self._documents < 0
+            self._is_valid &= ~negative
+            values[negative] = 0
+
+        doc_qty = len(values)
+        digits = self._buffer("fitted", (doc_qty, self._doc_len), uint8)
+        remainder = self._buffer("remainder", (doc_qty,), uint64)
+
+        # a uint64 has at most 20 decimal digits
+        first = max(self._doc_len - 20, 0)
+        digits[:, :first] = 0
+        for col in range(self._doc_len - 1, first - 1, -1):
+            divmod(values, 10, out=(values, remainder))
+            digits[:, col] = remainder
+        return digits
+
+    def _fit_in_place(self) -> None:
+        """
+        Fits the input data to the defined document length, overwriting the input array instead of creating a new one.
+
+        The characters are scanned from right to left and every digit is written right aligned at the end of its own row, which never overwrites a character not yet scanned. The fitted document is then moved to the beginning of the row and the remaining characters are cleared, so the input array holds the fitted documents and `_documents` becomes a view of their first characters.
+
+        :raises ValueError: If the input array is narrower than the document length.
+        """
+        chars = to_char_matrix(self._documents)
+        doc_qty, width = chars.shape
+        if width < self._doc_len:
+            raise ValueError(
+                f"documents must be at least {self._doc_len} characters wide "
+                "to be fitted in place"
+            )
 
+        offset = width - self._doc_len
+        count = self._buffer("cursor", (doc_qty,), intp)
+        count.fill(0)
+
+        for col in range(width - 1, -1, -1):
+            column = chars[:, col]
+            is_digit = (column - 48) < 10
+            is_digit &= count < self._doc_len
+            rows = flatnonzero(is_digit)
+            chars[rows, width - 1 - count[rows]] = column[rows]
+            count += is_digit
+
+        for col in range(offset, width):
+            chars[count < width - col, col] = 48
+        for col in range(self._doc_len):
+            chars[:, col] = chars[:, offset + col]
+        chars[:, self._doc_len :] = 0
+
+        kind = self._documents.dtype.kind
+        fitted = chars[:, : self._doc_len].view(f"{kind}{self._doc_len}")
+        self._documents = fitted[:, 0]
+
+    @profiled("get_digits")
     def _get_digits(self) -> ndarray:
         """
         Split the documents into digits.
@@ -148,25 +265,24 @@ class CheckDigit:
         :return: A numpy.ndarray containing the digits of the input data.
         :rtype: numpy.ndarray
         """
-        chars = self._documents[newaxis].T
-        chars = chars.view("U1")
-        chars = chars.view(int) - 48
-        chars[(chars < 0) | (chars > 9)] = 0
-        return array(chars, dtype=int8)
+        chars = to_byte_matrix(self._documents)
+        chars = subtract(
+            chars, uint8(48), out=self._buffer("digits", chars.shape, uint8)
+        )
+        chars[chars > 9] = 0
+        return chars.view(int8)
 
+    @profiled("apply_mask")
     def _apply_mask(self) -> None:
         """
         Applies the formatting mask to each document using a given format mask.
         """
-        frmat = array([self._format_mask]).view(int)
-        frmat = repeat([frmat], self._documents.shape[0], axis=0)
-        self._documents = self._documents.view((str, 1)).view(int)
-
-        mask = frmat == 35
-        frmat[mask] = self._documents
+        frmat = frombuffer(self._format_mask.encode("ascii"), dtype=uint8)
+        slots = flatnonzero(frmat == 35)
 
-        frmat = frombuffer(frmat.tobytes(), dtype=(str, frmat.shape[1]))
-        self._documents = frmat.astype(object)
+        frmat = repeat(frmat[newaxis], self._documents.shape[0], axis=0)
+        frmat[:, slots] = to_byte_matrix(self._documents)
+        self._documents = from_byte_matrix(frmat)
 
     def _check_repeated_digits(self, digits: ndarray) -> ndarray:
         """
@@ -195,36 +311,96 @@ class CheckDigit:
         check_digits = self._generate_check_digit(digits)
         return self._validate_check_digit(digits, check_digits)
 
-    def _generate_check_digit(self, digits: ndarray) -> ndarray:
+    def _compile_sequence(self) -> Tuple[ndarray, Tuple[int, ...]]:
+        """
+        Compiles the check digit sequences of the document type into a checksum plan, built once per class and shared by all instances.
+
+        :return: A read-only int16 weight matrix with one column per check digit, and the position of each check digit.
+        :rtype: Tuple[numpy.ndarray, Tuple[int, ...]]
+        """
+        plan = CheckDigit._plans.get(type(self))
+        if plan is None:
+            weights = array([seq for seq, _ in self._sequence], dtype=int16).T
+            weights = ascontiguousarray(weights)
+            weights.flags.writeable = False
+            positions = tuple(position for _, position in self._sequence)
+            plan = CheckDigit._plans.setdefault(
+                type(self), (weights, positions)
+            )
+        return plan
+
+    def _weighted_sums(self, digits: ndarray, weights: ndarray) -> ndarray:
+        """
+        Computes the weighted sums of all check digits in a single matrix product, block by block, so the int16 cast of the digits never exceeds the block size.
+
+        :param digits: The digits of the input data.
+        :type digits: numpy.ndarray
+
+        :param weights: The weight matrix, with one column per check digit.
+        :type weights: numpy.ndarray
+
+        :return: A numpy.ndarray with one weighted sum per document and check digit.
+        :rtype: numpy.ndarray
+        """
+        sums = self._buffer("sums", (digits.shape[0], weights.shape[1]), int16)
+        for start in range(0, digits.shape[0], self._block_size):
+            end = start + self._block_size
+            matmul(digits[start:end], weights, out=sums[start:end])
+        return sums
+
+    def _correct_remainder(
+        self, remainder: ndarray, cache: List[ndarray]
+    ) -> ndarray:
+        """
+        Corrects the remainder of a check digit based on the remainders of the previous ones. Does nothing by default.
+
+        :param remainder: The remainder of the weighted sum of the current check digit.
+        :type remainder: numpy.ndarray
+
+        :param cache: The remainders of the previous check digits.
+        :type cache: List[numpy.ndarray]
+
+        :return: The corrected remainder.
+        :rtype: numpy.ndarray
+        """
+        return remainder
+
+    @profiled("generate_check_digit")
+    def _generate_check_digit(
+        self, digits: ndarray
+    ) -> List[Tuple[ndarray, int]]:
         """
         Generates a check digit for each document in the input data.
 
+        All weighted sums come from one pass over the digits. When a check digit is part of the sum of the next ones, the difference between the generated digit and the digit in the document is added back to those sums afterwards.
+
         :param digits: The digits of the input data.
         :type digits: numpy.ndarray
 
         :return: A list of tuples containing the generated check digit and its position in each document.
         :rtype: List[Tuple[int, int]]
         """
-        doc_qty = digits.shape[0]
-        digits = digits.copy()
-        cache = []
-        out = []
-
-        for sequence, position in self._sequence:
-            doc_length = min(len(sequence), digits.shape[1])
-            sequence_arr = repeat([sequence], doc_qty, axis=0)
+        weights, positions = self._compile_sequence()
+        doc_length = min(weights.shape[0], digits.shape[1])
+        weights = weights[:doc_length]
+        sums = self._weighted_sums(digits[:, :doc_length], weights)
+        cache: List[ndarray] = []
+        out: List[Tuple[ndarray, int]] = []
 
-            digit = (digits[:, :doc_length] * sequence_arr[:, :doc_length]).sum(
-                axis=1
-            )
-            digit = digit % self._modulo
+        for step, position in enumerate(positions):
+            digit = sums[:, step] % self._modulo
+            digit = self._correct_remainder(digit, cache)
 
             cache.append(digit)
             digit = self._operation(digit)
             digit = array(digit, dtype=int8)
 
             position = min(position, digits.shape[1] - 1)
-            digits[:, position] = digit
+            if position < doc_length and weights[position, step + 1 :].any():
+                delta = (digit - digits[:, position]).astype(int16)
+                sums[:, step + 1 :] += (
+                    delta[:, newaxis] * weights[position, step + 1 :]
+                )
             out.append((digit, position))
 
         return out
@@ -251,8 +427,9 @@ class CheckDigit:
             check = digits[:, position] == cv_digit
             checks.append(check)
 
-        return array(checks).all(axis=0)
+        return logical_and.reduce(array(checks), axis=0)
 
+    @profiled("apply_attribute_function")
     def _apply_attribute_function(self, func: Callable) -> ndarray:
         """
         Applies a function to collect an attribute from each document.
@@ -263,10 +440,13 @@ class CheckDigit:
         :return: A numpy.ndarray containing the collected attribute for each document.
         :rtype: numpy.ndarray
         """
-        if self._documents.dtype != str:
+        if self._documents.dtype.kind not in "US":
             self._documents = self._documents.astype(str)
 
-        self._documents[self._documents == ""] = "000000000000000"
+        empty = self._documents == self._documents.dtype.type()
+        if empty.any():
+            fill = self._documents.dtype.type("000000000000000")
+            self._documents = where(empty, fill, self._documents)
         return func(self._documents)
 
     def parse(self, mask: bool) -> ndarray:
@@ -276,7 +456,7 @@ class CheckDigit:
         :param mask: Whether or not to apply the formatting mask to the input data.
         :type mask: bool
 
-        :return: A numpy.ndarray containing the parsed and formatted input data.
+        :return: A numpy.ndarray containing the parsed and formatted input data. With `_fixed_width`, a fixed-width string array where the invalid documents are empty, instead of None.
         :rtype: numpy.ndarray
         """
         self._fit_documents()
@@ -286,23 +466,42 @@ class CheckDigit:
             self._apply_mask()
 
         self._is_valid &= self._check_repeated_digits(self._digits)
+        if self._fixed_width:
+            # the fitted documents may be a view of a reused scratch buffer
+            if self._scratch is not None and not mask:
+                self._documents = self._documents.copy()
+            return blank_invalid(self._documents, self._is_valid)
+
+        self._documents = as_unicode(self._documents)
+        if mask:
+            self._documents = self._documents.astype(object)
         self._documents[~self._is_valid] = None
 
         return self._documents
 
-    def validate(self, lazy: bool) -> ndarray:
+    def validate(self, lazy: bool, out: Optional[ndarray] = None) -> ndarray:
         """
         Validates the input data.
 
         :param lazy: Whether or not to fit the input data before collecting the attribute.
         :type lazy: bool
 
+        :param out: A boolean numpy.ndarray, with one element per document, where the result is written instead of a new array.
+        :type out: Optional[numpy.ndarray]
+
         :return: A numpy.ndarray containing the parsed and formatted input data.
         :rtype: numpy.ndarray
         """
-        if not lazy:
-            self._fit_documents()
-        self._digits = self._get_digits()
+        if out is not None:
+            out.fill(True)
+            self._is_valid = out
+
+        if self._documents.dtype.kind in "iu":
+            self._digits = self._fit_integers().view(int8)
+        else:
+            if not lazy:
+                self._fit_documents()
+            self._digits = self._get_digits()
 
         self._is_valid &= self._validation_process(self._digits)
         self._is_valid &= self._check_repeated_digits(self._digits)
@@ -319,13 +518,13 @@ class CheckDigit:
         :param lazy: Whether or not to fit the input data before collecting the attribute.
         :type lazy: bool
 
-        :return: A numpy.ndarray containing the collected attribute for each document.
+        :return: A numpy.ndarray containing the collected attribute for each document. With `_fixed_width`, a fixed-width string array where the invalid documents are empty, instead of None.
         :rtype: numpy.ndarray
         """
         if attribute not in list(self._attributes.keys()):
             raise ValueError(f'Attribute "{attribute}" not found')
 
-        if not lazy:
+        if not lazy or self._documents.dtype.kind in "iu":
             self._fit_documents()
         self._digits = self._get_digits()
         self._collected_attr = self._apply_attribute_function(
@@ -333,6 +532,8 @@ class CheckDigit:
         )
 
         self._is_valid &= self._check_repeated_digits(self._digits)
+        if self._fixed_width:
+            return blank_invalid(self._collected_attr, self._is_valid)
         self._collected_attr[~self._is_valid] = None
 
         return self._collected_attr
@@ -1,13 +1,8 @@
-from typing import (
-    List,
-    Tuple,
-)
+from typing import List
 
 from numpy import (
     array,
-    int8,
     ndarray,
-    repeat,
     take,
     where,
 )
@@ -100,48 +95,29 @@ class CNH(CheckDigit):
             ([1, 2, 3, 4, 5, 6, 7, 8, 9, 0, 0], 10),
         ]
 
-    def _generate_check_digit(
-        self, digits: ndarray
-    ) -> List[Tuple[ndarray, int]]:
+    def _correct_remainder(
+        self, remainder: ndarray, cache: List[ndarray]
+    ) -> ndarray:
         """
-        Generates a check digit for each document in the input data.
+        Corrects the remainder of the second check digit when the remainder of the first one is 10 or more.
 
-        :param digits: The digits of the input data.
-        :type digits: numpy.ndarray
+        :param remainder: The remainder of the weighted sum of the current check digit.
+        :type remainder: numpy.ndarray
 
-        :return: A list of tuples containing the generated check digit and its position in each document.
-        :rtype: List[Tuple[int, int]]
-        """
-        doc_qty = digits.shape[0]
-        digits = digits.copy()
-        cache: List[ndarray] = []
-        out: List[Tuple[ndarray, int]] = []
-
-        for sequence, position in self._sequence:
-            doc_length = min(len(sequence), digits.shape[1])
-            sequence_arr = repeat([sequence], doc_qty, axis=0)
+        :param cache: The remainders of the previous check digits.
+        :type cache: List[numpy.ndarray]
 
-            digit = (digits[:, :doc_length] * sequence_arr[:, :doc_length]).sum(
-                axis=1
-            )
-            digit = digit % self._modulo
-
-            if len(cache) > 0:
-                digit = where(
-                    cache[0] < 10,
-                    digit,
-                    where(digit - 2 < 0, digit + 9, digit - 2),
-                )
-
-            cache.append(digit)
-            digit = self._operation(digit)
-            digit = array(digit, dtype=int8)
-
-            position = min(position, digits.shape[1] - 1)
-            digits[:, position] = digit
-            out.append((digit, position))
-
-        return out
+        :return: The corrected remainder.
+        :rtype: numpy.ndarray
+        """
+        if len(cache) == 0:
+            return remainder
+
+        return where(
+            cache[0] < 10,
+            remainder,
+            where(remainder - 2 < 0, remainder + 9, remainder - 2),
+        )
 
 
 class TituloEleitor(CheckDigit):
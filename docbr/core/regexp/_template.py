@@ -1,17 +1,39 @@
-from re import search
+from re import (
+    Pattern,
+    compile,
+    search,
+)
 from typing import (
     Any,
     Callable,
+    Optional,
+    Tuple,
+    Union,
 )
 
 from numpy import (
+    arange,
     array,
-    char,
-    frombuffer,
+    full,
+    intp,
     ndarray,
-    repeat,
+    ones,
+)
+
+from docbr.core._profile import profiled
+from docbr.core._utils import (
+    as_unicode,
+    blank_invalid,
+    fill_mask,
+    from_code_matrix,
+    pack_rows,
+    slice_spans,
+    to_ascii_matrix,
+    to_char_matrix,
 )
 
+VECTORIZED_MIN_SIZE = 128
+
 
 class RegExr:
     """
@@ -26,8 +48,8 @@ class RegExr:
     :ivar _is_valid: A numpy.ndarray containing booleans indicating the validity of each document.
     :vartype _is_valid: numpy.ndarray
 
-    :ivar _pattern: The pattern used to search for regular expressions in the input data.
-    :vartype _pattern: str
+    :ivar _pattern: The pattern used to search for regular expressions in the input data, compiled by the validators.
+    :vartype _pattern: Union[str, Pattern[str]]
 
     :ivar _remove_spec_char: Whether or not to remove special characters from the input data.
     :vartype _remove_spec_char: bool
@@ -37,33 +59,133 @@ class RegExr:
 
     :ivar _attributes: A dictionary containing functions to collect document attributes.
     :vartype _attributes: dict[str, Any]
+
+    :ivar _vectorized: Whether or not the subclass matches its pattern with `_match_at` over a matrix of ASCII codes instead of calling `re.search` on each document.
+    :vartype _vectorized: bool
+
+    :ivar _match_len: The minimum and maximum number of characters read by `_match_at` from its start position.
+    :vartype _match_len: Tuple[int, int]
+
+    :ivar _vectorized_min: The number of documents from which the vectorized search is used; smaller batches are searched with `re`, which has no per-call setup.
+    :vartype _vectorized_min: int
     """
 
     def __init__(self, docs: ndarray) -> None:
-        self._documents = docs
-        self._is_valid = array([True] * len(docs))
+        self._documents = as_unicode(docs)
+        self._is_valid = ones(len(docs), dtype=bool)
 
-        self._pattern = r""
+        self._pattern: Union[str, Pattern[str]] = r""
         self._remove_spec_char = True
         self._format_mask = ""
         self._attributes: dict[str, Any] = {}
+        self._vectorized = False
+        self._match_len = (1, 1)
+        self._vectorized_min = VECTORIZED_MIN_SIZE
+        self._fixed_width = False
+
+    def _bind(self, docs: ndarray, scratch: Optional[dict] = None) -> "RegExr":
+        """
+        Returns a new instance for `docs` that shares the document specification of this one, without running `__init__` again.
+
+        :param docs: A numpy.ndarray with the input data.
+        :type docs: numpy.ndarray
+
+        :param scratch: Not used, the regular expressions build their results as new arrays.
+        :type scratch: Optional[dict]
+
+        :return: The new instance.
+        :rtype: RegExr
+        """
+        instance = object.__new__(type(self))
+        instance.__dict__.update(self.__dict__)
+        instance._documents = as_unicode(docs)
+        instance._is_valid = ones(len(docs), dtype=bool)
+        return instance
+
+    def _match_at(self, chars: ndarray, cursor: ndarray) -> ndarray:
+        """
+        Matches the pattern of the document type at the given positions of a flattened matrix of ASCII codes. The subclasses that set `_vectorized` implement it with array operations; by default, `_pattern` is matched with `re` at each position, up to the next 0, which ends every row of the matrix and replaces the non-ASCII characters.
+
+        :param chars: The flattened uint8 matrix of ASCII codes, as returned by `to_ascii_matrix`.
+        :type chars: numpy.ndarray
 
-    def _search_documents(self, return_values: bool) -> None:
+        :param cursor: The flat positions where the matches start.
+        :type cursor: numpy.ndarray
+
+        :return: The flat positions after the end of each match, or -1 where the pattern does not match.
+        :rtype: numpy.ndarray
+        """
+        pattern = compile(self._pattern)
+        text = chars.tobytes().decode("ascii")
+        stop = full(len(cursor), -1, dtype=intp)
+
+        for i, position in enumerate(cursor.tolist()):
+            end = text.find("\x00", position)
+            match = pattern.match(text, position, len(text) if end < 0 else end)
+            if match is not None:
+                stop[i] = match.end()
+        return stop
+
+    def _match_spans(self) -> Tuple[ndarray, ndarray]:
+        """
+        Finds the leftmost match of the pattern in each document, as `re.search` does, trying every start column on the documents that have not matched yet.
+
+        :return: The start column of each match, or -1 where there is none, and the column after its end.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        shortest, longest = self._match_len
+        matrix = to_ascii_matrix(self._documents, pad=longest)
+        stride = matrix.shape[1]
+        chars = matrix.ravel()
+
+        start = full(len(matrix), -1, dtype=intp)
+        end = full(len(matrix), -1, dtype=intp)
+        rows = arange(len(matrix), dtype=intp)
+
+        for column in range(stride - longest - shortest + 1):
+            if not len(rows):
+                break
+            offset = rows * stride
+            stop = self._match_at(chars, offset + column)
+            found = stop >= 0
+            start[rows[found]] = column
+            end[rows[found]] = stop[found] - offset[found]
+            rows = rows[~found]
+
+        return start, end
+
+    @profiled("search_documents")
+    def _search_documents(self, return_values: bool) -> ndarray:
         """
         Searches for regular expressions in the input data.
 
         :param return_values: Whether or not to return the values found by the regular expression search.
         :type return_values: bool
+
+        :return: A numpy.ndarray containing booleans indicating whether the pattern was found in each document.
+        :rtype: numpy.ndarray
         """
-        self._documents = [search(self._pattern, d) for d in self._documents]
-        if return_values:
-            self._documents = [
-                d[0] if d is not None else None for d in self._documents
-            ]
-            self._documents = ["" if d is None else d for d in self._documents]
-        self._documents = array(self._documents, dtype=str)
+        if self._vectorized and len(self._documents) >= self._vectorized_min:
+            start, end = self._match_spans()
+            if return_values:
+                self._documents = slice_spans(self._documents, start, end)
+            return start >= 0
+
+        if not return_values:
+            return array(
+                [search(self._pattern, d) is not None for d in self._documents],
+                dtype=bool,
+            )
+
+        matches = [search(self._pattern, d) for d in self._documents]
+        self._documents = array(
+            ["" if m is None else m[0] for m in matches], dtype=str
+        )
+        return self._documents != ""
 
-    def _check_nulls(self, narray: ndarray, null_value: str = None) -> ndarray:
+    def _check_nulls(
+        self, narray: ndarray, null_value: Optional[str] = None
+    ) -> ndarray:
         """
         Checks for null values in the input data.
 
@@ -71,7 +193,7 @@ class RegExr:
         :type narray: numpy.ndarray
 
         :param null_value: The value considered as a null value.
-        :type null_value: str
+        :type null_value: Optional[str]
 
         :return: A numpy.ndarray containing booleans indicating the validity of each document.
         :rtype: numpy.ndarray
@@ -79,6 +201,7 @@ class RegExr:
         valid = narray != null_value
         return valid
 
+    @profiled("remove_separators")
     def _remove_separators(self, narray: ndarray) -> ndarray:
         """
         Removes special characters from the input data.
@@ -89,12 +212,12 @@ class RegExr:
         :return: A numpy.ndarray containing the processed input data.
         :rtype: numpy.ndarray
         """
-        narray = narray.view((str, 1)).reshape(len(narray), -1).view(int)
+        chars = to_char_matrix(narray)
 
-        mask = (narray >= 40) & (narray <= 47)
-        mask |= (narray >= 58) & (narray <= 64)
-        mask |= (narray >= 91) & (narray <= 96)
-        mask |= (narray >= 123) & (narray <= 126)
+        mask = (chars >= 40) & (chars <= 47)
+        mask |= (chars >= 58) & (chars <= 64)
+        mask |= (chars >= 91) & (chars <= 96)
+        mask |= (chars >= 123) & (chars <= 126)
 
         # | 40 = '(' | 41 = ')' | 44 = ',' | 45 = '-' |
         # | 46 = '.' | 47 = '/' | 58 = ':' | 59 = ';' |
@@ -103,24 +226,18 @@ class RegExr:
         # | 94 = '^' | 95 = '_' | 96 = '`' | 123= '{' |
         # | 124= '|' | 125= '}' | 126= '~' |          |
 
-        narray[mask] = 32
-        narray = frombuffer(narray.tobytes(), dtype=(str, narray.shape[1]))
-        return char.replace(narray, " ", "")
+        mask |= (chars == 32) | (chars == 0)
+        return pack_rows(chars, ~mask)
 
+    @profiled("apply_mask")
     def _apply_mask(self) -> None:
         """
         Applies the formatting mask to each document using a given format mask.
         """
-        frmat = array([self._format_mask]).view(int)
-        frmat = repeat([frmat], self._documents.shape[0], axis=0)
-        self._documents = self._documents.view((str, 1)).view(int)
-
-        mask = frmat == 35
-        frmat[mask] = self._documents
-
-        frmat = frombuffer(frmat.tobytes(), dtype=(str, frmat.shape[1]))
-        self._documents = frmat.astype(object)
+        chars = fill_mask(to_char_matrix(self._documents), self._format_mask)
+        self._documents = from_code_matrix(chars)
 
+    @profiled("apply_attribute_function")
     def _apply_attribute_function(self, func: Callable) -> ndarray:
         """
         Applies a function to collect an attribute from each document.
@@ -134,6 +251,9 @@ class RegExr:
         if self._documents.dtype != str:
             self._documents = self._documents.astype(str)
 
+        # wide enough for the placeholder, so that the attributes can hold "None"
+        if self._documents.itemsize < 60:
+            self._documents = self._documents.astype("U15")
         self._documents[self._documents == ""] = "000000000000000"
         return func(self._documents)
 
@@ -144,7 +264,7 @@ class RegExr:
         :param mask: Whether or not to apply the formatting mask to the input data.
         :type mask: bool
 
-        :return: A numpy.ndarray containing the parsed and formatted input data.
+        :return: A numpy.ndarray containing the parsed and formatted input data. With `_fixed_width`, a fixed-width string array where the invalid documents are empty, instead of None.
         :rtype: numpy.ndarray
         """
         self._search_documents(True)
@@ -156,22 +276,31 @@ class RegExr:
         if mask:
             self._apply_mask()
 
+        if self._fixed_width:
+            return blank_invalid(self._documents, self._is_valid)
+
         self._documents = array(self._documents, dtype=object)
         self._documents[~self._is_valid] = None
         return self._documents
 
-    def validate(self, lazy: bool) -> ndarray:
+    def validate(self, lazy: bool, out: Optional[ndarray] = None) -> ndarray:
         """
         Validates the input data.
 
         :param lazy: Whether or not to fit the input data before collecting the attribute.
         :type lazy: bool
 
+        :param out: A boolean numpy.ndarray, with one element per document, where the result is written instead of a new array.
+        :type out: Optional[numpy.ndarray]
+
         :return: A numpy.ndarray containing the parsed and formatted input data.
         :rtype: numpy.ndarray
         """
-        self._search_documents(False)
-        self._is_valid &= self._check_nulls(self._documents, null_value="None")
+        if out is not None:
+            out.fill(True)
+            self._is_valid = out
+
+        self._is_valid &= self._search_documents(False)
 
         return self._is_valid
 
@@ -185,7 +314,7 @@ class RegExr:
         :param lazy: Whether or not to fit the input data before collecting the attribute.
         :type lazy: bool
 
-        :return: A numpy.ndarray containing the collected attribute for each document.
+        :return: A numpy.ndarray containing the collected attribute for each document. With `_fixed_width`, a fixed-width string array where the invalid documents are empty, instead of None.
         :rtype: numpy.ndarray
         """
         if attribute not in list(self._attributes.keys()):
@@ -199,5 +328,7 @@ class RegExr:
         self._collected_attr = self._apply_attribute_function(
             self._attributes[attribute]
         )
+        if self._fixed_width:
+            return blank_invalid(self._collected_attr, self._is_valid)
         self._collected_attr[~self._is_valid] = None
         return self._collected_attr
@@ -1,15 +1,61 @@
+from string import (
+    ascii_letters,
+    ascii_lowercase,
+    digits,
+)
+from typing import Tuple
+
 from numpy import (
+    arange,
     array,
+    bincount,
     char,
+    count_nonzero,
+    flatnonzero,
+    full,
+    intp,
+    minimum,
     ndarray,
+    ones,
+    searchsorted,
     take,
-    vectorize,
+    uint32,
     where,
+    zeros,
 )
 
-from docbr.core._utils import array_slicer
+from docbr.core._profile import profiled
+from docbr.core._utils import (
+    array_slicer,
+    char_table,
+    fill_mask,
+    from_code_matrix,
+    slice_spans,
+    to_ascii_matrix,
+    to_char_matrix,
+)
 from docbr.core.regexp._template import RegExr
 
+DIGITS = char_table(digits)
+LETTERS = char_table(ascii_letters)
+ALPHANUMERIC = char_table(ascii_letters + digits)
+SPACES = char_table(" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f")
+LOWERCASE = char_table(ascii_lowercase)
+EMAIL_LOCAL = char_table(ascii_letters + digits + "_.-")
+EMAIL_LABEL = char_table(ascii_letters + digits + "-")
+SEPARATORS = char_table(" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f-.")
+
+# the DDD codes accepted by the phone pattern
+PHONE_DDD = zeros(100, dtype=bool)
+for first, second in [
+    ("14689", "123456789"),
+    ("2", "12478"),
+    ("3", "1234578"),
+    ("5", "1345"),
+    ("7", "134579"),
+]:
+    PHONE_DDD[[int(a + b) for a in first for b in second]] = True
+
 
 class CarPlate(RegExr):
     """
@@ -24,6 +70,8 @@ class CarPlate(RegExr):
         self._pattern = r"[a-zA-Z]{3}\s?\-?[0-9][A-Za-z0-9][0-9]{2}"
         self._remove_spec_char = True
         self._format_mask = "###-####"
+        self._vectorized = True
+        self._match_len = (7, 9)
         self._attributes = {
             "padrao": lambda x: where(
                 char.isnumeric(array_slicer(x, 4, dtype=str)),
@@ -32,6 +80,33 @@ class CarPlate(RegExr):
             )
         }
 
+    def _match_at(self, chars: ndarray, cursor: ndarray) -> ndarray:
+        """
+        Matches `_pattern` at the given positions: three letters, an optional whitespace, an optional dash, a digit, a letter or digit and two digits.
+
+        :param chars: The flattened uint8 matrix of ASCII codes.
+        :type chars: numpy.ndarray
+
+        :param cursor: The flat positions where the matches start.
+        :type cursor: numpy.ndarray
+
+        :return: The flat positions after the end of each match, or -1 where the pattern does not match.
+        :rtype: numpy.ndarray
+        """
+        valid = LETTERS[chars[cursor]]
+        valid &= LETTERS[chars[cursor + 1]]
+        valid &= LETTERS[chars[cursor + 2]]
+
+        cursor = cursor + 3
+        cursor += SPACES[chars[cursor]]
+        cursor += chars[cursor] == ord("-")
+
+        valid &= DIGITS[chars[cursor]]
+        valid &= ALPHANUMERIC[chars[cursor + 1]]
+        valid &= DIGITS[chars[cursor + 2]]
+        valid &= DIGITS[chars[cursor + 3]]
+        return where(valid, cursor + 4, -1)
+
 
 class Email(RegExr):
     """
@@ -47,15 +122,82 @@ class Email(RegExr):
             r"[a-zA-Z0-9_.-]+@[a-zA-Z0-9-]+\.[a-z]+(\.[a-z]+)?(\.[a-z]+)?"
         )
         self._remove_spec_char = False
+        self._vectorized = True
         self._attributes = {
-            "local": lambda x: array(
-                [xx[0] for xx in char.split(x, "@")], dtype=str
-            ),
-            "dominio": lambda x: array(
-                [xx[1] for xx in char.split(x, "@")], dtype=str
-            ),
+            "local": lambda x: self._split(x)[0],
+            "dominio": lambda x: self._split(x)[1],
         }
 
+    def _match_spans(self) -> Tuple[ndarray, ndarray]:
+        """
+        Finds the leftmost match of `_pattern` in each document without scanning column by column.
+
+        The documents are flattened into a single buffer of ASCII codes in which every row ends with a 0, so no character run crosses two rows. None of the classes of the pattern contains "@", so a match is anchored at an "@" whose previous character is allowed in the local part: the local part starts after the previous character that is not allowed, the domain label ends before the next character that is not allowed, and so on. All the run boundaries are found with `searchsorted` over the positions of the characters outside each class. The first "@" of a row with a valid local part and domain gives the leftmost match.
+
+        :return: The start column of each match, or -1 where there is none, and the column after its end.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        matrix = to_ascii_matrix(self._documents, pad=1)
+        stride = matrix.shape[1]
+        chars = matrix.ravel()
+        last = len(chars) - 1
+
+        local, label, lower = (
+            flatnonzero(~table[chars])
+            for table in [EMAIL_LOCAL, EMAIL_LABEL, LOWERCASE]
+        )
+
+        def run_end(breaks: ndarray, position: ndarray) -> ndarray:
+            position = minimum(position, last)
+            return breaks[searchsorted(breaks, position)]
+
+        at = flatnonzero(chars == ord("@"))
+        previous = searchsorted(local, at) - 1
+        start = where(previous >= 0, local[previous] + 1, 0)
+        valid = start < at
+
+        dot = run_end(label, at + 1)
+        valid &= (dot > at + 1) & (chars[dot] == ord("."))
+        end = run_end(lower, dot + 1)
+        valid &= end > dot + 1
+
+        for _ in range(2):
+            suffix = run_end(lower, end + 1)
+            more = (chars[end] == ord(".")) & (suffix > end + 1)
+            end = where(more, suffix, end)
+
+        rows = at[valid] // stride
+        first = ones(len(rows), dtype=bool)
+        first[1:] = rows[1:] != rows[:-1]
+        rows = rows[first]
+
+        match_start = full(len(matrix), -1, dtype=intp)
+        match_end = full(len(matrix), -1, dtype=intp)
+        match_start[rows] = start[valid][first] - rows * stride
+        match_end[rows] = end[valid][first] - rows * stride
+        return match_start, match_end
+
+    def _split(self, narray: ndarray) -> Tuple[ndarray, ndarray]:
+        """
+        Splits each email at its first "@". Documents without "@", which are invalid, are kept whole in both parts, so that the results are wide enough to hold the null value written over them.
+
+        :param narray: The emails.
+        :type narray: numpy.ndarray
+
+        :return: The local parts and the domains.
+        :rtype: Tuple[numpy.ndarray, numpy.ndarray]
+        """
+        chars = to_char_matrix(narray)
+        length = count_nonzero(chars, axis=1)
+        at = (chars == ord("@")).argmax(axis=1)
+        found = chars[arange(len(chars)), at] == ord("@")
+
+        zero = zeros(len(narray), dtype=intp)
+        local = slice_spans(narray, zero, where(found, at, length))
+        domain = slice_spans(narray, where(found, at + 1, 0), length)
+        return local, domain
+
+    @profiled("apply_mask")
     def _apply_mask(self) -> None:
         """
         Does nothing for this class.
@@ -75,6 +217,12 @@ class Phone(RegExr):
         super().__init__(docs)
         self._pattern = r"(?:\(?(?:[14689][1-9]|2[12478]|3[1234578]|5[1345]|7[134579])\)?)?\s?(?:[2-8]|9[1-9])[0-9]{3}(?:\s|\-|\.)?[0-9]{4}"
         self._remove_spec_char = True
+        self._vectorized = True
+        self._match_len = (8, 15)
+        # the DDD is tried at every start column, so the vectorized search
+        # only pays off on larger batches
+        self._vectorized_min = 1024
+        self._ddd = PHONE_DDD
         self._ddd_estados = array(
             [
                 None,  # 00
@@ -181,12 +329,14 @@ class Phone(RegExr):
         )
         self._attributes = {
             "ddd": lambda x: where(
-                char.str_len(x) > 9, array_slicer(x, 0, 1, dtype=str), None
+                char.str_len(x) > 9,
+                array_slicer(x, 0, 1, dtype=str),
+                array(None),
             ),
             "estado": lambda x: where(
                 char.str_len(x) > 9,
                 take(self._ddd_estados, array_slicer(x, 0, 1, dtype=int)),
-                None,
+                array(None),
             ),
             "tipo": lambda x: where(
                 (char.str_len(x) == 10) | (char.str_len(x) == 8),
@@ -195,14 +345,92 @@ class Phone(RegExr):
             ),
         }
 
+    def _match_number(self, chars: ndarray, cursor: ndarray) -> ndarray:
+        """
+        Matches the part of `_pattern` after the DDD: an optional whitespace, a digit from 2 to 8 or a 9 followed by a digit from 1 to 9, three digits, an optional separator and four digits.
+
+        :param chars: The flattened uint8 matrix of ASCII codes.
+        :type chars: numpy.ndarray
+
+        :param cursor: The flat positions where the matches start.
+        :type cursor: numpy.ndarray
+
+        :return: The flat positions after the end of each match, or -1 where the pattern does not match.
+        :rtype: numpy.ndarray
+        """
+        cursor = cursor + SPACES[chars[cursor]]
+
+        first = chars[cursor]
+        mobile = (first == ord("9")) & (chars[cursor + 1] >= ord("1"))
+        mobile &= chars[cursor + 1] <= ord("9")
+        valid = ((first >= ord("2")) & (first <= ord("8"))) | mobile
+
+        cursor += 1 + mobile
+        valid &= DIGITS[chars[cursor]]
+        valid &= DIGITS[chars[cursor + 1]]
+        valid &= DIGITS[chars[cursor + 2]]
+
+        cursor += 3
+        cursor += SEPARATORS[chars[cursor]]
+        for i in range(4):
+            valid &= DIGITS[chars[cursor + i]]
+        return where(valid, cursor + 4, -1)
+
+    def _match_at(self, chars: ndarray, cursor: ndarray) -> ndarray:
+        """
+        Matches `_pattern` at the given positions. The optional DDD group is tried first, as the regular expression does, and the number alone is matched where the group fails.
+
+        :param chars: The flattened uint8 matrix of ASCII codes.
+        :type chars: numpy.ndarray
+
+        :param cursor: The flat positions where the matches start.
+        :type cursor: numpy.ndarray
+
+        :return: The flat positions after the end of each match, or -1 where the pattern does not match.
+        :rtype: numpy.ndarray
+        """
+        ddd = cursor + (chars[cursor] == ord("("))
+        first, second = chars[ddd], chars[ddd + 1]
+        valid = DIGITS[first] & DIGITS[second]
+        code = where(valid, (first - 48) * 10 + (second - 48), 0)
+        valid &= self._ddd[code]
+
+        ddd += 2
+        ddd += chars[ddd] == ord(")")
+        stop = self._match_number(chars, ddd)
+        stop[~valid] = -1
+        return where(stop >= 0, stop, self._match_number(chars, cursor))
+
+    @staticmethod
+    def _phone_mask(size: int) -> str:
+        """
+        Returns the formatting mask of the phone numbers with `size` digits: "(##)" for the DDD of numbers with more than 9 digits and a dash before the last 4 digits.
+
+        :param size: The number of digits.
+        :type size: int
+
+        :return: The formatting mask.
+        :rtype: str
+        """
+        if size > 9:
+            return "(##)" + "#" * (size - 6) + "-####"
+        head = max(size - 4, 0)
+        return "#" * head + "-" + "#" * (size - head)
+
+    @profiled("apply_mask")
     def _apply_mask(self) -> None:
         """
-        Applies the formatting mask to each document in the array.
+        Applies the formatting mask to each document in the array. The documents are grouped by length and each group is filled into the mask of its length at once.
         """
-        func = vectorize(
-            lambda x: "({}){}-{}".format(x[:2], x[2:-4], x[-4:])
-            if len(x) > 9
-            else "{}-{}".format(x[:-4], x[-4:])
-        )
-        self._documents = func(self._documents)
-        self._documents = self._documents.astype(object)
+        chars = to_char_matrix(self._documents)
+        length = count_nonzero(chars, axis=1)
+        sizes = flatnonzero(bincount(length, minlength=1)).tolist()
+
+        width = max((len(self._phone_mask(size)) for size in sizes), default=1)
+        masked = zeros((len(chars), width), dtype=uint32)
+        for size in sizes:
+            rows = flatnonzero(length == size)
+            filled = fill_mask(chars[rows], self._phone_mask(size))
+            masked[rows, : filled.shape[1]] = filled
+
+        self._documents = from_code_matrix(masked)
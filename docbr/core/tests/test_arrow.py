@@ -0,0 +1,71 @@
+import unittest
+
+from numpy import (
+    array,
+    frombuffer,
+    shares_memory,
+    testing,
+    uint8,
+)
+
+from docbr.core._arrow import (
+    arrow_null_mask,
+    arrow_to_narray,
+    narray_to_arrow,
+    pa,
+)
+
+
+@unittest.skipIf(pa is None, "pyarrow is not installed")
+class TestCoreArrow(unittest.TestCase):
+    def test_arrow_to_narray(self) -> None:
+        cases = [
+            (pa.array(["ab", None, "cde", ""]), [b"ab", b"", b"cde", b""]),
+            (pa.array(["ab", "cd"], pa.large_string()), [b"ab", b"cd"]),
+            (pa.array(["xab", "cde", "f"])[1:], [b"cde", b"f"]),
+            (pa.array([b"ab", None], pa.binary(2)), [b"ab", b""]),
+            (pa.array(["ção"]), ["ção".encode()]),
+            (
+                pa.chunked_array([pa.array(["a"]), pa.array(["bcd", None])]),
+                [b"a", b"bcd", b""],
+            ),
+            (pa.chunked_array([pa.array([1, 23])]), [1, 23]),
+            (pa.array([82683688377, None]), [82683688377, 0]),
+            (pa.array([82683688377], pa.uint64()), [82683688377]),
+            (pa.array([82683688377.0, None, 1.5]), [82683688377, 0, 0]),
+            (pa.array([], pa.string()), []),
+        ]
+
+        for test, expected in cases:
+            testing.assert_equal(arrow_to_narray(test), array(expected))
+
+    def test_zero_copy(self) -> None:
+        cases = [
+            pa.array(["123", "456", "789"]),
+            pa.array(["x", "123", "456"])[1:],
+            pa.array([b"12", b"34"], pa.binary(2)),
+            pa.array([123, 456]),
+        ]
+
+        for test in cases:
+            data = test.buffers()[-1]
+            result = arrow_to_narray(test)
+            self.assertTrue(shares_memory(result, frombuffer(data, uint8)))
+
+    def test_null_mask(self) -> None:
+        self.assertIsNone(arrow_null_mask(pa.array(["a"])))
+        testing.assert_equal(
+            arrow_null_mask(pa.array(["a", None])), array([False, True])
+        )
+
+    def test_narray_to_arrow(self) -> None:
+        nulls = array([False, True])
+        cases = [
+            ((array([True, False]), nulls), pa.array([True, None])),
+            ((array(["a", "None"]), nulls), pa.array(["a", None])),
+            ((array([b"a", b"b"]), None), pa.array(["a", "b"])),
+            ((array(["a", None], dtype=object), None), pa.array(["a", None])),
+        ]
+
+        for test, expected in cases:
+            self.assertTrue(narray_to_arrow(*test).equals(expected))
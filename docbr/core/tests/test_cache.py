@@ -0,0 +1,121 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from numpy import (
+    arange,
+    array,
+    char,
+    testing,
+)
+
+from docbr.core import _cache
+from docbr.core._cache import (
+    ResultCache,
+    cache_clear,
+    cache_info,
+    cached_results,
+    disable_cache,
+    enable_cache,
+)
+
+
+class TestCoreCache(unittest.TestCase):
+    def tearDown(self) -> None:
+        disable_cache()
+
+    def test_result_cache(self) -> None:
+        cache = ResultCache(2)
+        cache.store(["a", "b"], [1, 2])
+        entries, misses = cache.lookup(["a", "c"])
+
+        self.assertEqual(entries, [1, None])
+        self.assertEqual(misses, [1])
+
+        cache.store(["c"], [3])
+        self.assertEqual(cache.lookup(["b"])[1], [0])
+        self.assertEqual(cache.info(), (1, 2, 1, 2, 2))
+
+        cache.clear()
+        self.assertEqual(cache.info(), (0, 0, 0, 2, 0))
+
+        with self.assertRaises(ValueError):
+            ResultCache(0)
+
+    def test_cached_results(self) -> None:
+        computed = []
+
+        def compute(docs):
+            computed.extend(docs.tolist())
+            return array([d.upper() for d in docs]), array(
+                [d != "x" for d in docs]
+            )
+
+        docs = array(["a", "x", "bc"])
+        testing.assert_equal(
+            cached_results(docs, ("k",), compute)[0], ["A", "X", "BC"]
+        )
+
+        enable_cache(8)
+        cached_results(array(["a", "x"]), ("k",), compute)
+        computed.clear()
+        result, valid = cached_results(docs, ("k",), compute)
+
+        self.assertEqual(computed, ["bc"])
+        testing.assert_equal(result, array(["A", "X", "BC"]))
+        testing.assert_equal(valid, [True, False, True])
+        self.assertEqual(cache_info().hits, 2)
+
+        cached_results(docs, ("other",), compute)
+        self.assertEqual(computed, ["bc", "a", "x", "bc"])
+
+        cache_clear()
+        self.assertEqual(cache_info().currsize, 0)
+
+    def test_cached_results_normalize(self) -> None:
+        computed = []
+
+        def compute(docs):
+            computed.extend(docs.tolist())
+            return char.upper(docs), docs != ""
+
+        def normalize(docs):
+            return char.replace(docs, "-", "")
+
+        enable_cache(8)
+        cached_results(array(["a-b"]), ("k",), compute, normalize)
+        result, _ = cached_results(
+            array(["ab", "a-b", "c"]), ("k",), compute, normalize
+        )
+
+        testing.assert_equal(result, ["AB", "AB", "C"])
+        self.assertEqual(computed, ["ab", "c"])
+        self.assertEqual(cache_info().hits, 2)
+
+    def test_cached_results_threads(self) -> None:
+        enable_cache(1000)
+        docs = (arange(4000) % 1500).astype(str)
+
+        def compute(docs):
+            return docs.astype(int) * 2, docs != ""
+
+        with ThreadPoolExecutor(4) as pool:
+            chunks = [docs[i : i + 500] for i in range(0, len(docs), 500)]
+            results = list(
+                pool.map(
+                    lambda x: cached_results(x, ("k",), compute)[0], chunks
+                )
+            )
+
+        testing.assert_equal(
+            [r for chunk in results for r in chunk], docs.astype(int) * 2
+        )
+        info = cache_info()
+        self.assertEqual(info.hits + info.misses, 4000)
+        self.assertEqual(info.currsize, 1000)
+
+    def test_disabled(self) -> None:
+        self.assertIsNone(cache_info())
+        cache_clear()
+        with mock.patch.object(_cache, "_cache", None):
+            self.assertIsNone(cache_info())
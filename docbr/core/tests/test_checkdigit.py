@@ -0,0 +1,82 @@
+import unittest
+
+from numpy import (
+    array,
+    int64,
+    testing,
+    uint64,
+)
+
+from docbr.core.checkdigit.documents import (
+    CNH,
+    CPF,
+    Certidao,
+)
+
+
+class TestCoreCheckDigit(unittest.TestCase):
+    def test_compile_sequence(self) -> None:
+        weights, positions = CPF(array(["0"]))._compile_sequence()
+
+        self.assertEqual(weights.shape, (11, 2))
+        self.assertEqual(weights.dtype, "int16")
+        self.assertEqual(positions, (9, 10))
+        self.assertFalse(weights.flags.writeable)
+        self.assertIs(CPF(array(["1"]))._compile_sequence()[0], weights)
+        self.assertIsNot(Certidao(array(["1"]))._compile_sequence()[0], weights)
+
+    def test_generate_check_digit(self) -> None:
+        cases = [
+            (CPF, "82683688300", [(7, 9), (7, 10)]),
+            (CNH, "36065120700", [(0, 9), (2, 10)]),
+            (
+                Certidao,
+                "24298401552012167386797522780700",
+                [(9, 30), (4, 31)],
+            ),
+        ]
+
+        for doctype, document, expected in cases:
+            instance = doctype(array([document]))
+            instance._fit_documents()
+            digits = instance._get_digits()
+            check_digits = instance._generate_check_digit(digits)
+            self.assertEqual(
+                [(d[0], p) for d, p in check_digits], expected, doctype
+            )
+
+    def test_block_size(self) -> None:
+        documents = array(["82683688377", "82683688378", "15559539000"] * 5)
+        expected = CPF(documents).validate(False)
+
+        instance = CPF(documents)
+        instance._block_size = 4
+        testing.assert_equal(instance.validate(False), expected)
+
+    def test_fit_integers(self) -> None:
+        documents = array(
+            [82683688377, 8268368837, -1, 2**63 - 1], dtype=int64
+        )
+        instance = CPF(documents)
+
+        testing.assert_equal(
+            instance._fit_integers(),
+            [
+                [8, 2, 6, 8, 3, 6, 8, 8, 3, 7, 7],
+                [0, 8, 2, 6, 8, 3, 6, 8, 8, 3, 7],
+                [0] * 11,
+                [3, 6, 8, 5, 4, 7, 7, 5, 8, 0, 7],
+            ],
+        )
+        testing.assert_equal(instance._is_valid, [True, True, False, True])
+
+        strings = array(["82683688377", "8268368837", "24298401552012"])
+        for doctype, dtype in [(CPF, int64), (Certidao, uint64)]:
+            testing.assert_equal(
+                doctype(strings.astype(dtype)).validate(False),
+                doctype(strings).validate(False),
+            )
+            testing.assert_equal(
+                doctype(strings.astype(dtype)).parse(True),
+                doctype(strings).parse(True),
+            )
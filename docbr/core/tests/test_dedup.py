@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+from numpy import (
+    arange,
+    array,
+    testing,
+    zeros,
+)
+
+from docbr.core import _dedup
+from docbr.core._dedup import (
+    deduplicate,
+    estimate_distinct_ratio,
+    hash_documents,
+    unique_documents,
+)
+from docbr.core.checkdigit.documents import CPF
+from docbr.core.regexp.documents import Email
+
+
+class TestCoreDedup(unittest.TestCase):
+    def test_hash_documents(self) -> None:
+        hashes = hash_documents(array(["abc", "abd", "abc", ""]))
+
+        self.assertEqual(hashes.dtype, "uint64")
+        self.assertEqual(hashes[0], hashes[2])
+        self.assertNotEqual(hashes[0], hashes[1])
+        self.assertEqual(
+            hash_documents(array([b"abc"]))[0],
+            hash_documents(array(["abc"]))[0],
+        )
+
+    def test_unique_documents(self) -> None:
+        docs = array(["b", "a", "b", "c", "a"])
+        uniques, inverse = unique_documents(docs)
+
+        self.assertEqual(len(uniques), 3)
+        testing.assert_equal(uniques[inverse], docs)
+
+        with mock.patch.object(
+            _dedup, "hash_documents", lambda x: zeros(len(x), "uint64")
+        ):
+            uniques, inverse = unique_documents(docs)
+            testing.assert_equal(uniques, array(["a", "b", "c"]))
+            testing.assert_equal(uniques[inverse], docs)
+
+    def test_estimate_distinct_ratio(self) -> None:
+        distinct = arange(100000).astype(str)
+        repeated = (arange(100000) % 100).astype(str)
+
+        self.assertEqual(estimate_distinct_ratio(distinct[:1]), 1.0)
+        self.assertGreater(estimate_distinct_ratio(distinct), 0.5)
+        self.assertLess(estimate_distinct_ratio(repeated), 0.01)
+
+    def test_deduplicate(self) -> None:
+        docs = (arange(20000) % 10).astype(str)
+
+        cases = [
+            ((docs, False, CPF, "parse"), 20000),
+            ((docs, True, CPF, "validate"), 10),
+            ((docs, "auto", CPF, "validate"), 20000),
+            ((docs, "auto", CPF, "parse"), 10),
+            ((docs, "auto", Email, "validate"), 10),
+            ((docs[:100], "auto", Email, "validate"), 100),
+        ]
+
+        for test, expected in cases:
+            result, inverse = deduplicate(*test)
+            self.assertEqual(len(result), expected)
+            if inverse is not None:
+                testing.assert_equal(result[inverse], docs[: len(inverse)])
+
+        with self.assertRaises(ValueError):
+            deduplicate(docs, "always", CPF, "parse")
@@ -0,0 +1,53 @@
+import unittest
+
+from numpy import (
+    testing,
+    zeros,
+)
+from numpy.random import default_rng
+
+from docbr.core._generator import generate_documents
+from docbr.core.checkdigit.documents import (
+    CNH,
+    CPF,
+    Certidao,
+    TituloEleitor,
+)
+from docbr.core.regexp.documents import (
+    CarPlate,
+    Email,
+    Phone,
+)
+
+
+class TestCoreGenerator(unittest.TestCase):
+    def test_generate_documents(self) -> None:
+        invalid = zeros(1000, dtype=bool)
+        invalid[::4] = True
+
+        for engine in [CPF, CNH, TituloEleitor, Certidao, CarPlate, Phone]:
+            for mask in [False, True]:
+                docs = generate_documents(
+                    engine, 1000, mask, invalid, default_rng(0)
+                )
+                self.assertEqual(docs.dtype.kind, "U")
+                testing.assert_equal(engine(docs).validate(False), ~invalid)
+
+        docs = generate_documents(Email, 1000, False, invalid, default_rng(0))
+        testing.assert_equal(Email(docs).validate(False), ~invalid)
+
+    def test_generate_patterns(self) -> None:
+        invalid = zeros(1000, dtype=bool)
+        rng = default_rng(0)
+
+        plates = generate_documents(CarPlate, 1000, False, invalid, rng)
+        padrao = CarPlate(plates).get_attribute("padrao", False)
+        self.assertEqual(set(padrao), {"brasil", "mercosul"})
+
+        phones = generate_documents(Phone, 1000, False, invalid, rng)
+        tipo = Phone(phones).get_attribute("tipo", False)
+        self.assertEqual(set(tipo), {"fixo", "celular"})
+
+        docs = generate_documents(TituloEleitor, 1000, False, invalid, rng)
+        estado = TituloEleitor(docs).get_attribute("estado", False)
+        self.assertNotIn("", set(estado))
@@ -1,28 +1,44 @@
 import unittest
+from array import array as pyarray
 from typing import Iterable
 
 # from pandas import Series, DataFrame
 from numpy import (
     array,
+    int64,
+    ma,
     nan,
     ndarray,
+    shares_memory,
+    testing,
 )
 
+from docbr.core._arrow import pa
 from docbr.core._io import (
+    io_compact,
+    io_expand,
     io_get,
     io_input_narray,
+    io_null_mask,
     io_output_narray,
+    io_output_strings,
+    io_output_validity,
+    io_zero_copy,
+    register_input,
 )
 
 
 class TestCoreIO(unittest.TestCase):
     def test_io_input_narray(self) -> None:
         cases = [
-            (0, array(["0"])),
-            (nan, array(["nan"])),
-            (123.5, array(["123.5"])),
+            (0, array([0])),
+            (nan, array([0])),
+            (123.5, array([0])),
+            (12345678901.0, array([12345678901])),
             ("abc", array(["abc"])),
-            (array([0]), array(["0"])),
+            (b"abc", array([b"abc"])),
+            (array([b"abc"]), array([b"abc"])),
+            (array([0]), array([0])),
             (["abc", 123], array(["abc", "123"])),
             # (Series([0,0,'abc'])         ,array(['0','0','abc'])),
         ]
@@ -33,6 +49,8 @@ class TestCoreIO(unittest.TestCase):
             ([None, None], ValueError),
             (True, TypeError),
             ([{1: 1}, 0], ValueError),
+            (({1: 1}, 0), ValueError),
+            ({1: 1}, TypeError),
             # (Series({'col':[0,0,'abc']}) , ValueError),
             # ([Series([0,0,'abc']),Series([0,0,'abc'])], ValueError),
             # (DataFrame([0,0,'abc']), TypeError),
@@ -46,6 +64,87 @@ class TestCoreIO(unittest.TestCase):
         for test, expected in raises:
             self.assertRaises(expected, io_get, test)
 
+    def test_io_sequences_and_buffers(self) -> None:
+        docs = array([b"123", b"456"])
+        cases = [
+            (("123", "456"), array(["123", "456"])),
+            ((doc for doc in ["123", "456"]), array(["123", "456"])),
+            ((doc for doc in [123, 456]), array([123, 456])),
+            ([], array([], dtype=str)),
+            (memoryview(docs), docs),
+            (docs.view("V3"), docs),
+            (pyarray("q", [123, 456]), array([123, 456])),
+            (bytearray(b"123"), array([b"123"])),
+        ]
+
+        for test, expected in cases:
+            testing.assert_equal(
+                io_input_narray(test, io_get(test)[0]), expected
+            )
+
+        nones = iter([None, None])
+        with self.assertRaises(ValueError):
+            io_input_narray(nones, io_get(nones)[0])
+
+    def test_io_zero_copy(self) -> None:
+        docs = array([b"123", b"456"])
+        integers = pyarray("q", [123, 456])
+        cases = [
+            (docs, docs),
+            (docs.astype("U3"), None),
+            (memoryview(docs), docs),
+            (docs.view("V3"), docs),
+            (ma.masked_array(docs), None),
+            (integers, ndarray(2, "int64", integers)),
+        ]
+
+        for test, source in cases:
+            self.assertTrue(io_zero_copy(test))
+            result = io_input_narray(test, io_get(test)[0])
+            self.assertTrue(
+                shares_memory(result, test if source is None else source)
+            )
+
+        copied = [
+            ["123"],
+            array([123.0, 456.0]),
+            docs.astype(object),
+            pa.array(["123", "45"]),
+            pa.array(["123", None]),
+            pa.array([123, None]),
+            pa.array([123.0, 456.0]),
+            pa.chunked_array([["123"], ["456"]]),
+        ]
+        for test in copied:
+            self.assertFalse(io_zero_copy(test))
+        self.assertTrue(io_zero_copy(pa.array([123, 456])))
+
+    def test_register_input(self) -> None:
+        class Column:
+            def __init__(self, docs: list) -> None:
+                self.docs = docs
+
+        class SubColumn(Column):
+            pass
+
+        register_input(Column, lambda x: array(x.docs), ndarray, False)
+        i_func, o_type = io_get(SubColumn(["123"]))
+        self.assertIs(o_type, ndarray)
+        testing.assert_equal(i_func(SubColumn(["123"])), array(["123"]))
+
+        register_input(
+            lambda x: hasattr(x, "__docbr_test__"), lambda x: array(["456"])
+        )
+        protocol = type("Protocol", (), {"__docbr_test__": True})()
+        testing.assert_equal(
+            io_input_narray(protocol, io_get(protocol)[0]), ["456"]
+        )
+
+        with self.assertRaises(TypeError):
+            register_input(Column, None)
+        with self.assertRaises(TypeError):
+            register_input(0, lambda x: x)
+
     def test_io_output_narray(self) -> None:
         cases = [
             ((array([""]), str), ""),
@@ -60,3 +159,92 @@ class TestCoreIO(unittest.TestCase):
                 self.assertEqual(all(io_output_narray(*test)), all(expected))
             else:
                 self.assertEqual(io_output_narray(*test), expected)
+
+    def test_io_null_mask(self) -> None:
+        cases = [
+            (array([1.0, nan]), array([False, True])),
+            (array(["a", None, nan], dtype=object), array([False, True, True])),
+            (ma.masked_array(["a", "b"], mask=[True, False]), array([1, 0])),
+            (array([1.0, 2.0]), None),
+            (array(["a", "None"]), None),
+            (["a", None], None),
+            (nan, None),
+        ]
+
+        if pa is not None:
+            cases += [
+                (pa.array([1, None]), array([False, True])),
+                (pa.array([1.0, None]), array([False, True])),
+                (pa.chunked_array([[1], [None]]), array([False, True])),
+                (pa.array([1, 2]), None),
+            ]
+
+        for test, expected in cases:
+            testing.assert_equal(io_null_mask(test), expected)
+
+    def test_io_compact_expand(self) -> None:
+        docs = ma.masked_array(["a", "b", "c"], mask=[False, True, False])
+        nulls = io_null_mask(docs)
+        docs = io_input_narray(io_compact(docs, nulls), io_get(docs)[0])
+
+        testing.assert_equal(docs, array(["a", "c"]))
+        testing.assert_equal(
+            io_expand(array([True, True]), nulls), array([True, False, True])
+        )
+        testing.assert_equal(
+            io_expand(array(["1", "2"]), nulls), array(["1", "None", "2"])
+        )
+        testing.assert_equal(
+            io_expand(array(["1", "2"], dtype=object), nulls, ""),
+            array(["1", "", "2"], dtype=object),
+        )
+        self.assertIs(io_compact(docs, None), docs)
+
+        result = io_output_narray(
+            array([True, False]), ndarray, None, nulls[1:]
+        )
+        self.assertIsInstance(result, ma.MaskedArray)
+        testing.assert_equal(result.mask, nulls[1:])
+
+    def test_io_output_validity(self) -> None:
+        valid = array([True, False, True, True, True, True, True, True, False])
+        nulls = array([False, False, True] + [False] * 6)
+
+        testing.assert_equal(
+            io_output_validity(valid, "bitmap"), array([0b10111111, 0])
+        )
+        testing.assert_equal(io_output_validity(valid, "invalid"), [1, 8])
+        self.assertEqual(io_output_validity(valid, "invalid").dtype, int64)
+        self.assertEqual(io_output_validity(valid, "count"), (7, 2))
+        self.assertEqual(io_output_validity(valid, "count", nulls), (6, 3))
+        self.assertIs(io_output_validity(valid, "bool"), valid)
+
+        with self.assertRaises(ValueError):
+            io_output_validity(valid, "list")
+
+    def test_io_output_strings(self) -> None:
+        values = array(["826.836.883-77", "", "ação"])
+        valid = array([True, False, True])
+
+        result, validity = io_output_strings(values, valid, "fixed")
+        testing.assert_equal(result, values)
+        self.assertIs(validity, valid)
+
+        result, _ = io_output_strings(values[:2], valid[:2], "bytes")
+        testing.assert_equal(result, array([b"826.836.883-77", b""]))
+        result, _ = io_output_strings(values, valid, "bytes")
+        self.assertEqual(result[2].decode("utf-8"), "ação")
+
+        result, _ = io_output_strings(array([b"1"]), valid[:1], "fixed")
+        testing.assert_equal(result, array(["1"]))
+
+        if pa is not None:
+            result = io_output_strings(values, valid, "arrow")
+            self.assertEqual(
+                result.to_pylist(), ["826.836.883-77", None, "ação"]
+            )
+            result = io_output_strings(array([b"1"]), valid[:1], "arrow")
+            self.assertEqual(result.type, pa.string())
+
+        with self.assertRaises(ValueError):
+            io_output_strings(values, valid, "object")
@@ -0,0 +1,157 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import sleep
+from unittest import mock
+
+from numpy import (
+    array,
+    testing,
+)
+
+from docbr.core import _parallel
+from docbr.core._parallel import (
+    resolve_n_jobs,
+    run_threads,
+    shutdown_process_pool,
+    shutdown_thread_pool,
+    validate_processes,
+    validate_threads,
+)
+from docbr.core.checkdigit.documents import CNPJ
+from docbr.core.regexp.documents import CarPlate
+
+
+class TestCoreParallel(unittest.TestCase):
+    def tearDown(self) -> None:
+        shutdown_process_pool()
+        shutdown_thread_pool()
+
+    def test_resolve_n_jobs(self) -> None:
+        self.assertEqual(resolve_n_jobs(3), 3)
+        self.assertGreaterEqual(resolve_n_jobs(-1), 1)
+
+        for n_jobs in [0, -2]:
+            with self.assertRaises(ValueError):
+                resolve_n_jobs(n_jobs)
+
+    def test_validate_processes(self) -> None:
+        cases = [
+            (array(["15.559.539/0001-52", "15559539000153", ""] * 7), CNPJ),
+            (array([b"15559539000152", b"15559539000153"] * 7), CNPJ),
+            (array(["ABC-1234", "AB-1234", "abc1d23"] * 7), CarPlate),
+        ]
+
+        with mock.patch.object(_parallel, "MIN_SHARD_SIZE", 4):
+            for docs, engine in cases:
+                expected = engine(docs).validate(False)
+                result = validate_processes(docs, engine, False, 2)
+                testing.assert_equal(result, expected)
+
+            pool = _parallel.get_process_pool(2)
+            validate_processes(cases[0][0], CNPJ, False, 2)
+            self.assertIs(_parallel.get_process_pool(2), pool)
+
+    def test_concurrent_process_pools(self) -> None:
+        docs = array(["15.559.539/0001-52", "15559539000153", ""] * 7)
+        expected = CNPJ(docs).validate(False)
+
+        with mock.patch.object(_parallel, "MIN_SHARD_SIZE", 4):
+            with ThreadPoolExecutor(4) as callers:
+                results = list(
+                    callers.map(
+                        lambda n_jobs: validate_processes(
+                            docs, CNPJ, False, n_jobs
+                        ),
+                        [2, 3, 2, 3],
+                    )
+                )
+
+        for result in results:
+            testing.assert_equal(result, expected)
+        self.assertEqual(_parallel._pools.workers, 3)
+        self.assertEqual(len(_parallel._pools._users), 1)
+
+    def test_concurrent_thread_pools(self) -> None:
+        docs = array(["15.559.539/0001-52", "15559539000153", ""] * 70)
+        expected = CNPJ(docs).validate(False)
+
+        with ThreadPoolExecutor(8) as callers:
+            results = list(
+                callers.map(
+                    lambda n_jobs: validate_threads(
+                        docs, CNPJ, False, n_jobs, 4
+                    ),
+                    [2, 3, 4, 2, 3, 4] * 4,
+                )
+            )
+
+        for result in results:
+            testing.assert_equal(result, expected)
+        self.assertEqual(_parallel._thread_pools.workers, 4)
+        self.assertEqual(len(_parallel._thread_pools._users), 1)
+
+    def test_pool_growth(self) -> None:
+        small = _parallel.get_thread_pool(2)
+        self.assertIs(_parallel.get_thread_pool(1), small)
+
+        with _parallel._thread_pools.lease(2) as leased:
+            self.assertIs(leased, small)
+            large = _parallel.get_thread_pool(3)
+            self.assertIsNot(large, small)
+            self.assertFalse(small._shutdown)
+
+        self.assertTrue(small._shutdown)
+        self.assertIs(_parallel.get_thread_pool(2), large)
+
+        _parallel.get_thread_pool(4)
+        self.assertTrue(large._shutdown)
+        self.assertEqual(len(_parallel._thread_pools._users), 1)
+
+    def test_run_threads(self) -> None:
+        _parallel.get_thread_pool(8)
+        lock = Lock()
+        running = [0, 0]
+
+        def square(item: int) -> int:
+            with lock:
+                running[0] += 1
+                running[1] = max(running)
+            sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return item * item
+
+        self.assertEqual(
+            run_threads(square, range(10), 2),
+            [item * item for item in range(10)],
+        )
+        self.assertLessEqual(running[1], 2)
+        self.assertEqual(run_threads(square, [], 2), [])
+
+        with self.assertRaises(ZeroDivisionError):
+            run_threads(lambda item: 1 // item, [1, 0, 2], 2)
+
+    def test_small_input(self) -> None:
+        docs = array(["15559539000152"])
+        testing.assert_equal(
+            validate_processes(docs, CNPJ, False, 4), array([True])
+        )
+        self.assertIsNone(_parallel._pools._pool)
+
+    def test_validate_threads(self) -> None:
+        docs = array(["15.559.539/0001-52", "15559539000153", ""] * 7)
+        expected = CNPJ(docs).validate(False)
+
+        for chunk_size in [1, 4, 100]:
+            result = validate_threads(docs, CNPJ, False, 3, chunk_size)
+            testing.assert_equal(result, expected)
+
+        plates = array(["ABC-1234", "AB-1234", "abc1d23"] * 7)
+        testing.assert_equal(
+            validate_threads(plates, CarPlate, False, 2, 5),
+            CarPlate(plates).validate(False),
+        )
+
+        with self.assertRaises(ValueError):
+            validate_threads(docs, CNPJ, False, 2, 0)
@@ -0,0 +1,108 @@
+import tracemalloc
+import unittest
+from threading import Thread
+
+from numpy import array
+
+from docbr import (
+    get_attribute,
+    parse,
+    validate,
+)
+from docbr.core import _profile
+from docbr.core._profile import (
+    Profiler,
+    add_profile_hook,
+    end_stage,
+    profile,
+    remove_profile_hook,
+    start_stage,
+)
+
+
+class TestCoreProfile(unittest.TestCase):
+    def test_profile_hook(self) -> None:
+        events = []
+        add_profile_hook(events.append)
+        try:
+            validate(array(["826.836.883-77", "82683688378"]), "cpf")
+        finally:
+            remove_profile_hook(events.append)
+
+        stages = [event.stage for event in events]
+        self.assertEqual(stages[0], "io_input")
+        self.assertIn("fit_documents", stages)
+        self.assertIn("generate_check_digit", stages)
+
+        fit = events[stages.index("fit_documents")]
+        self.assertEqual(fit.doctype, "CPF")
+        self.assertEqual((fit.rows, fit.width), (2, 14))
+        self.assertGreater(fit.elapsed_ns, 0)
+        self.assertIsNone(fit.allocated_bytes)
+
+        validate("826.836.883-77", "cpf")
+        self.assertEqual(len(events), len(stages))
+        self.assertEqual(_profile._hooks, [])
+
+        with self.assertRaises(ValueError):
+            remove_profile_hook(events.append)
+
+    def test_profile(self) -> None:
+        with profile(trace_memory=True) as profiler:
+            parse(["ABC-1234", "11987659876"], "placa", True)
+            parse(["11987659876"], "tfone", True)
+            get_attribute(["82683688377"] * 3, "cpf", "regiao")
+
+        self.assertIsInstance(profiler, Profiler)
+        self.assertEqual(profiler.stats[("CarPlate", "apply_mask")][:2], [1, 2])
+        self.assertEqual(profiler.stats[("Phone", "apply_mask")][:2], [1, 1])
+        self.assertEqual(
+            profiler.stats[("CPF", "apply_attribute_function")][:2], [1, 3]
+        )
+        self.assertGreater(profiler.stats[("CPF", "fit_documents")][3], 0)
+
+        report = profiler.report()
+        self.assertIn("search_documents", report)
+        self.assertEqual(len(report.splitlines()), len(profiler.stats) + 2)
+
+    def test_nested_stages(self) -> None:
+        events = []
+        add_profile_hook(events.append)
+        tracemalloc.start()
+        try:
+            outer = start_stage()
+            block = bytearray(2**20)
+            del block
+            inner = start_stage()
+            end_stage(inner, "CPF", "inner", [])
+            end_stage(outer, "CPF", "outer", [])
+        finally:
+            tracemalloc.stop()
+            remove_profile_hook(events.append)
+
+        allocated = {event.stage: event.allocated_bytes for event in events}
+        self.assertLess(allocated["inner"], 2**20)
+        self.assertGreaterEqual(allocated["outer"], 2**20)
+        self.assertEqual(_profile._stages(), [])
+
+    def test_thread_stages(self) -> None:
+        events = []
+        add_profile_hook(events.append)
+        tracemalloc.start()
+        try:
+            outer = start_stage()
+            block = bytearray(2**20)
+            del block
+            worker = Thread(
+                target=lambda: end_stage(start_stage(), "CPF", "worker", [])
+            )
+            worker.start()
+            worker.join()
+            end_stage(outer, "CPF", "outer", [])
+        finally:
+            tracemalloc.stop()
+            remove_profile_hook(events.append)
+
+        allocated = {event.stage: event.allocated_bytes for event in events}
+        self.assertIsNone(allocated["worker"])
+        self.assertGreaterEqual(allocated["outer"], 2**20)
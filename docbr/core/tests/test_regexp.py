@@ -0,0 +1,119 @@
+import unittest
+from unittest import mock
+
+from numpy import (
+    array,
+    ndarray,
+    testing,
+)
+from numpy.random import default_rng
+
+from docbr.core._generator import generate_documents
+from docbr.core.regexp._template import RegExr
+from docbr.core.regexp.documents import (
+    CarPlate,
+    Email,
+    Phone,
+)
+
+
+class TestCoreRegExr(unittest.TestCase):
+    def test_vectorized_search(self) -> None:
+        rng = default_rng(0)
+        alphabets = [
+            list("ABCabc0123456789 -.()\t"),
+            list("0123456789" * 2 + "( )-.　\x1ca"),
+            list("ab@.c-_Z9@. é"),
+        ]
+        docs = [
+            "".join(rng.choice(alphabet, rng.integers(0, 20)))
+            for alphabet in alphabets
+            for _ in range(5000)
+        ]
+        docs += ["ABC 1234", "abc-1d23", "x(21) 3456.7890", "(1)23456789"]
+        docs += ["a@b@c.com", "x y@b.com.br.net.org", "@b.com", "a@b.cOM"]
+
+        for engine in [CarPlate, Phone, Email]:
+            invalid = rng.random(1000) < 0.3
+            generated = generate_documents(engine, 1000, True, invalid, rng)
+            doclist = array(docs + list(generated))
+
+            for return_values in [True, False]:
+                vectorized = engine(doclist)
+                regex = engine(doclist)
+                regex._vectorized = False
+
+                testing.assert_equal(
+                    vectorized._search_documents(return_values),
+                    regex._search_documents(return_values),
+                )
+                if return_values:
+                    testing.assert_equal(
+                        vectorized._documents, regex._documents
+                    )
+                    self.assertEqual(
+                        vectorized._documents.dtype, regex._documents.dtype
+                    )
+
+    def test_default_match_at(self) -> None:
+        class Code(RegExr):
+            def __init__(self, docs: ndarray) -> None:
+                super().__init__(docs)
+                self._pattern = r"[A-Z]{2}-?[0-9]+"
+                self._vectorized = True
+                self._match_len = (3, 6)
+                self._vectorized_min = 0
+
+        docs = array(["xAB-123y", "AB1", "ab-12", "", "é AB12345", "ABé1"])
+
+        for return_values in [True, False]:
+            vectorized = Code(docs)
+            regex = Code(docs)
+            regex._vectorized = False
+
+            testing.assert_equal(
+                vectorized._search_documents(return_values),
+                regex._search_documents(return_values),
+            )
+            if return_values:
+                testing.assert_equal(vectorized._documents, regex._documents)
+
+    def test_small_batch(self) -> None:
+        cases = [
+            (CarPlate, ["ABC-1234", "AB-1234"]),
+            (Phone, ["(11) 98765-4321", "123"]),
+            (Email, ["a@b.com", "a@b"]),
+        ]
+
+        for engine, docs in cases:
+            with mock.patch.object(
+                engine, "_match_spans", side_effect=AssertionError
+            ):
+                testing.assert_equal(
+                    engine(array(docs)).validate(False), [True, False]
+                )
+
+    def test_email_split(self) -> None:
+        local, domain = Email(array([]))._split(array(["abc@d.com", "x@y.z"]))
+
+        testing.assert_equal(local, array(["abc", "x"]))
+        testing.assert_equal(domain, array(["d.com", "y.z"]))
+
+    def test_phone_mask(self) -> None:
+        docs = array(["11987654321", "1134567890", "987654321", "34567890", ""])
+        phone = Phone(docs)
+        phone._apply_mask()
+
+        testing.assert_equal(
+            phone._documents,
+            array(
+                [
+                    "(11)98765-4321",
+                    "(11)3456-7890",
+                    "98765-4321",
+                    "3456-7890",
+                    "-",
+                ],
+                dtype=object,
+            ),
+        )
@@ -1,11 +1,31 @@
 import unittest
 
 from numpy import (
+    append,
     array,
+    inf,
+    nan,
     testing,
+    uint64,
 )
 
-from docbr.core._utils import array_slicer
+from docbr.core._utils import (
+    array_slicer,
+    as_bytes,
+    as_unicode,
+    blank_invalid,
+    char_table,
+    fill_mask,
+    float_to_integer,
+    from_byte_matrix,
+    from_code_matrix,
+    numeric_to_integer,
+    pack_rows,
+    slice_spans,
+    to_ascii_matrix,
+    to_byte_matrix,
+    to_char_matrix,
+)
 
 
 class TestCoreUtils(unittest.TestCase):
@@ -14,6 +34,8 @@ class TestCoreUtils(unittest.TestCase):
             ((array(["01234"]), 0, 2, str), array(["012"])),
             ((array(["01234"]), 2, None, str), array(["2"])),
             ((array(["01234"]), 2, 4, int), array([234])),
+            ((array([b"01234"]), 0, 2, str), array(["012"])),
+            ((array([b"01234"]), 2, 4, int), array([234])),
         ]
 
         raises = [
@@ -27,3 +49,147 @@ class TestCoreUtils(unittest.TestCase):
         for test, expected in raises:
             with self.assertRaises(expected):
                 array_slicer(*test)
+
+    def test_char_matrix(self) -> None:
+        testing.assert_equal(
+            to_char_matrix(array(["ab", "c"])), array([[97, 98], [99, 0]])
+        )
+        testing.assert_equal(
+            to_char_matrix(array([b"ab", b"c"])), array([[97, 98], [99, 0]])
+        )
+        self.assertEqual(to_char_matrix(array([b"ab"])).dtype, "uint8")
+        self.assertEqual(to_char_matrix(array(["ab"])).dtype, "uint32")
+
+        with self.assertRaises(ValueError):
+            to_char_matrix(array([1, 2]))
+
+    def test_byte_matrix(self) -> None:
+        cases = [
+            (array(["12", "3"]), array([[49, 50], [51, 0]])),
+            (array([b"12", b"3"]), array([[49, 50], [51, 0]])),
+            (array(["1ç"]), array([[49, 0]])),
+        ]
+
+        for test, expected in cases:
+            matrix = to_byte_matrix(test)
+            self.assertEqual(matrix.dtype, "uint8")
+            testing.assert_equal(matrix, expected)
+
+        documents = array([b"123", b"45"])
+        matrix = to_byte_matrix(documents)
+        self.assertTrue(matrix.base is documents)
+        testing.assert_equal(from_byte_matrix(matrix), documents)
+
+    def test_as_unicode(self) -> None:
+        cases = [
+            (array(["abc"]), array(["abc"])),
+            (array([b"abc", b"d"]), array(["abc", "d"])),
+            (array([b"\xe7a"]), array(["ça"])),
+        ]
+
+        for test, expected in cases:
+            testing.assert_equal(as_unicode(test), expected)
+
+    def test_as_bytes(self) -> None:
+        cases = [
+            (array([b"abc"]), array([b"abc"])),
+            (array(["abc", "d", ""]), array([b"abc", b"d", b""])),
+            (array(["ça"]), array(["ça".encode("utf-8")])),
+        ]
+
+        for test, expected in cases:
+            testing.assert_equal(as_bytes(test), expected)
+            self.assertEqual(as_bytes(test).dtype, expected.dtype)
+
+    def test_blank_invalid(self) -> None:
+        valid = array([True, False])
+
+        for test in [array(["abc", "de"]), array([b"abc", b"de"])]:
+            result = blank_invalid(test, valid)
+            self.assertIs(result, test)
+            testing.assert_equal(result, array(["abc", ""]).astype(test.dtype))
+        testing.assert_equal(
+            blank_invalid(array(["ab", None], dtype=object), valid),
+            array(["ab", ""]),
+        )
+
+    def test_ascii_matrix(self) -> None:
+        matrix = to_ascii_matrix(array(["a\u00a0b", "\u00e91"]), pad=2)
+
+        testing.assert_equal(
+            matrix, array([[97, 32, 98, 0, 0], [0, 49, 0, 0, 0]])
+        )
+        testing.assert_equal(
+            char_table("ab")[matrix[0]], [True, False, True, False, False]
+        )
+
+    def test_slice_spans(self) -> None:
+        docs = array(["xABC-1234", "abc", ""])
+        start, end = array([1, -1, -1]), array([9, -1, -1])
+
+        sliced = slice_spans(docs, start, end)
+        testing.assert_equal(sliced, array(["ABC-1234", "", ""]))
+        self.assertEqual(sliced.dtype, "U8")
+        self.assertEqual(slice_spans(docs[1:], start[1:], end[1:]).dtype, "U1")
+
+    def test_pack_rows(self) -> None:
+        docs = array(["(11) 9876-5432", "a.b", ""])
+        chars = to_char_matrix(docs)
+
+        testing.assert_equal(
+            pack_rows(chars, (chars >= 48) & (chars <= 57)),
+            array(["1198765432", "", ""]),
+        )
+        testing.assert_equal(
+            from_code_matrix(
+                fill_mask(to_char_matrix(array(["ABC1234"])), "###-####")
+            ),
+            array(["ABC-1234"]),
+        )
+        testing.assert_equal(
+            from_code_matrix(fill_mask(chars[1:2], "#-#")), array(["a-."])
+        )
+
+    def test_float_to_integer(self) -> None:
+        testing.assert_equal(
+            float_to_integer(
+                array(
+                    [12345678901.0, 2.0**53 - 1, 2.0**53, 1.5, -1, nan, inf]
+                )
+            ),
+            array([12345678901, 2**53 - 1, 0, 0, 0, 0, 0], dtype=uint64),
+        )
+
+    def test_numeric_to_integer(self) -> None:
+        cases = [
+            (
+                array(["12345678901.0", "1.2345678901E+10", " 1.5e2 "]),
+                array([12345678901, 12345678901, 150], dtype=uint64),
+            ),
+            (
+                array(["826.836.883-77", "12345.67", "1.55e1", "1.2E+99"]),
+                array(["826.836.883-77", "12345.67", "0", "0"]),
+            ),
+            (
+                array(["8268368837.0", "1.2E+", "e5", "82683688377"]),
+                array(["8268368837", "1.2E+", "e5", "82683688377"]),
+            ),
+            (array([b"100e-2", b"abc"]), array(["1", "abc"])),
+            (array(["abc"]), array(["abc"])),
+            (
+                array(["+5.2998224725e10", "-1.0e3", "1_0.0", "1.0e1"]),
+                array(["52998224725", "0", "1_0.0", "10"]),
+            ),
+        ]
+
+        for test, expected in cases:
+            testing.assert_equal(numeric_to_integer(test), expected)
+
+        # a row is converted the same way whatever the other rows are
+        signed = array(["+5.2998224725e10", " -12.0 ", "1_0.0"])
+        alone = [numeric_to_integer(signed[i : i + 1])[0] for i in range(3)]
+        for other in ["abc", "826.836.883-77", "1.e+"]:
+            mixed = numeric_to_integer(append(signed, other))
+            testing.assert_equal(
+                mixed[:3].astype(str), array(alone).astype(str)
+            )
@@ -1,10 +1,29 @@
-CPF = "cpf"
-CNPJ = "cnpj"
-CNH = "cnh"
-T_ELEITOR = "te"
-PIS = "pis"
-CERTIDAO = "cert"
-RENAVAM = "rnvam"
-PLACA = "placa"
-TELEFONE = "tfone"
-EMAIL = "email"
+from typing import (
+    Final,
+    Literal,
+)
+
+# the document types accepted by the API functions
+DocType = Literal[
+    "cnpj",
+    "cpf",
+    "cnh",
+    "te",
+    "pis",
+    "cert",
+    "rnvam",
+    "placa",
+    "tfone",
+    "email",
+]
+
+CPF: Final = "cpf"
+CNPJ: Final = "cnpj"
+CNH: Final = "cnh"
+T_ELEITOR: Final = "te"
+PIS: Final = "pis"
+CERTIDAO: Final = "cert"
+RENAVAM: Final = "rnvam"
+PLACA: Final = "placa"
+TELEFONE: Final = "tfone"
+EMAIL: Final = "email"
@@ -0,0 +1,81 @@
+import unittest
+
+from numpy import (
+    array,
+    concatenate,
+    testing,
+)
+
+from docbr import detect
+from docbr import doctypes as d
+from docbr import (
+    generate,
+    validate,
+)
+from docbr.core._arrow import pa
+
+
+class TestDetect(unittest.TestCase):
+    def test_detect(self) -> None:
+        docs = [
+            "826.836.883-77",
+            "15.559.539/0001-52",
+            "8268368837",
+            "751.45500.06-5",
+            "389441060167",
+            "abc",
+            "1" * 20,
+        ]
+        cases = [
+            (
+                (docs,),
+                ["cpf", "cnpj", "cpf", "cpf", "cnpj", "", ""],
+                [True, True, False, False, False, False, False],
+            ),
+            (
+                (docs, [d.CPF, d.PIS, d.T_ELEITOR, d.CNPJ]),
+                ["cpf", "cnpj", "cpf", "pis", "te", "", ""],
+                [True, True, False, True, True, False, False],
+            ),
+        ]
+
+        raises = [
+            ((docs, [d.CPF, d.PLACA]), ValueError),
+            ((docs, []), ValueError),
+            ((docs, ["ccard"]), ValueError),
+        ]
+
+        for test, doctypes, valid in cases:
+            result = detect(*test)
+            testing.assert_equal(result[0], array(doctypes))
+            testing.assert_equal(result[1], array(valid))
+
+        for test, expected in raises:
+            with self.assertRaises(expected):
+                detect(*test)
+
+        self.assertEqual(detect("15559539000152"), ("cnpj", True))
+
+    def test_matches_validate(self) -> None:
+        docs = concatenate(
+            [
+                generate(300, d.CPF, mask=True, invalid_ratio=0.2, seed=0),
+                generate(300, d.CNPJ, mask=True, invalid_ratio=0.2, seed=1),
+            ]
+        )
+        doctypes, valid = detect(docs)
+
+        testing.assert_equal(doctypes, array(["cpf"] * 300 + ["cnpj"] * 300))
+        testing.assert_equal(
+            valid,
+            concatenate(
+                [validate(docs[:300], d.CPF), validate(docs[300:], d.CNPJ)]
+            ),
+        )
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_input(self) -> None:
+        doctypes, valid = detect(pa.array(["82683688377", None, "abc"]))
+
+        self.assertTrue(doctypes.equals(pa.array(["cpf", None, None])))
+        self.assertTrue(valid.equals(pa.array([True, None, None])))
@@ -1,12 +1,32 @@
 import unittest
 
+from numpy import (
+    array,
+    empty,
+    flatnonzero,
+    ma,
+    nan,
+    packbits,
+    testing,
+    zeros,
+)
+
 from docbr import attributes as attr
+from docbr import (
+    cache_clear,
+    cache_info,
+    disable_cache,
+)
 from docbr import doctypes as d
 from docbr import (
+    enable_cache,
+    generate,
     get_attribute,
+    normalize_numeric,
     parse,
     validate,
 )
+from docbr.core._arrow import pa
 
 
 class TestDocbr(unittest.TestCase):
@@ -83,6 +103,301 @@ class TestDocbr(unittest.TestCase):
         for test, expected in cases:
             self.assertEqual(validate(*test), expected)
 
+    def test_validate_executors(self) -> None:
+        docs = array(["826.836.883-77", "82683688378", "11111111111"] * 3)
+        expected = array([True, False, False] * 3)
+
+        for executor in ["process", "thread"]:
+            testing.assert_equal(
+                validate(docs, d.CPF, n_jobs=2, executor=executor), expected
+            )
+
+        with self.assertRaises(ValueError):
+            validate(docs, d.CPF, n_jobs=2, executor="gpu")
+
+    def test_dedup(self) -> None:
+        docs = array(["826.836.883-77", "82683688378", "ABC-1234"] * 5)
+
+        for dedup in [True, "auto"]:
+            testing.assert_equal(
+                validate(docs, d.CPF, dedup=dedup), validate(docs, d.CPF)
+            )
+            testing.assert_equal(
+                parse(docs, d.PLACA, True, dedup=dedup),
+                parse(docs, d.PLACA, True),
+            )
+            testing.assert_equal(
+                get_attribute(docs, d.CPF, attr.CPF_REGIAO, dedup=dedup),
+                get_attribute(docs, d.CPF, attr.CPF_REGIAO),
+            )
+
+        with self.assertRaises(ValueError):
+            validate(docs, d.CPF, dedup="yes")
+
+    def test_cache(self) -> None:
+        docs = ["826.836.883-77", "82683688378", "ABC-1234"]
+        expected = [
+            validate(docs, d.CPF),
+            parse(docs, d.CPF, True),
+            parse(docs, d.PLACA),
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO),
+        ]
+
+        enable_cache(16)
+        try:
+            for _ in range(2):
+                results = [
+                    validate(docs, d.CPF),
+                    parse(docs, d.CPF, True),
+                    parse(docs, d.PLACA),
+                    get_attribute(docs, d.CPF, attr.CPF_REGIAO),
+                ]
+                for result, value in zip(results, expected):
+                    testing.assert_equal(result, value)
+                    self.assertEqual(result.dtype, value.dtype)
+            self.assertEqual(validate(docs[0], d.CPF), True)
+            self.assertEqual(cache_info().hits, 13)
+
+            # the spellings of a document share one entry
+            cache_clear()
+            self.assertTrue(validate("529.982.247-25", d.CPF))
+            spellings = ["52998224725", 52998224725, "529982247-25 "]
+            testing.assert_equal(validate(spellings, d.CPF), [True] * 3)
+            self.assertEqual(cache_info()[:2], (3, 1))
+            testing.assert_equal(
+                validate(spellings[:2], d.CPF, lazy=True), [True, True]
+            )
+            self.assertEqual(cache_info().misses, 3)
+            testing.assert_equal(
+                parse(["52998224725", 52998224725], d.CPF, True),
+                ["529.982.247-25"] * 2,
+            )
+        finally:
+            disable_cache()
+
+    def test_validate_output(self) -> None:
+        docs = generate(1000, d.CNPJ, invalid_ratio=0.2, seed=0)
+        valid = validate(docs, d.CNPJ)
+
+        testing.assert_equal(
+            validate(docs, d.CNPJ, output="bitmap"), packbits(valid)
+        )
+        testing.assert_equal(
+            validate(docs, d.CNPJ, output="invalid"), flatnonzero(~valid)
+        )
+        counts = validate(docs, d.CNPJ, output="count")
+        self.assertEqual(counts.valid, valid.sum())
+        self.assertEqual(counts.invalid, (~valid).sum())
+
+        with self.assertRaises(ValueError):
+            validate(docs, d.CNPJ, output="mask")
+
+    def test_parse_output(self) -> None:
+        for doctype in [d.CPF, d.CNPJ, d.PLACA, d.TELEFONE, d.EMAIL]:
+            docs = generate(200, doctype, invalid_ratio=0.2, seed=0)
+            for mask in [False, True]:
+                # invalid documents are parsed as None or, in unicode
+                # results, as "None"
+                expected = parse(docs, doctype, mask).astype(object)
+                valid = (expected != None) & (expected != "None")  # noqa: E711
+                expected[~valid] = None
+
+                values, validity = parse(docs, doctype, mask, output="fixed")
+                self.assertEqual(values.dtype.kind, "U")
+                testing.assert_equal(validity, valid)
+                testing.assert_equal(values[valid], expected[valid])
+                self.assertTrue((values[~valid] == "").all())
+
+                values, _ = parse(docs, doctype, mask, output="bytes")
+                self.assertEqual(values.dtype.kind, "S")
+                testing.assert_equal(values[valid].astype(str), expected[valid])
+
+                if pa is not None:
+                    result = parse(docs, doctype, mask, output="arrow")
+                    self.assertEqual(result.to_pylist(), expected.tolist())
+
+        docs = array(["82683688377", None, "11111111111"], dtype=object)
+        values, validity = parse(docs, d.CPF, True, dedup=True, output="fixed")
+        testing.assert_equal(values, array(["826.836.883-77", "", ""]))
+        testing.assert_equal(validity, [True, False, False])
+
+        values, validity = get_attribute(
+            docs, d.CPF, attr.CPF_REGIAO, output="bytes"
+        )
+        testing.assert_equal(values, array([b"CE/MA/PI", b"", b""]))
+        testing.assert_equal(validity, [True, False, False])
+
+        out = empty(3, dtype="U17")
+        values, _ = get_attribute(
+            docs, d.CPF, attr.CPF_REGIAO, out=out, output="fixed"
+        )
+        self.assertIs(values, out)
+
+        with self.assertRaises(ValueError):
+            parse(docs, d.CPF, output="list")
+        with self.assertRaises(ValueError):
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO, out=out, output="arrow")
+
+    def test_out(self) -> None:
+        docs = array(["826.836.883-77", "82683688378", "ABC-1234"] * 3)
+        out = zeros(len(docs), dtype=bool)
+
+        self.assertIs(validate(docs, d.CPF, out=out), out)
+        testing.assert_equal(out, validate(docs, d.CPF))
+        self.assertIs(validate(docs, d.CPF, dedup=True, out=out), out)
+        testing.assert_equal(out, validate(docs, d.CPF))
+
+        regions = empty(len(docs), dtype=object)
+        self.assertIs(
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO, out=regions), regions
+        )
+        testing.assert_equal(
+            regions, get_attribute(docs, d.CPF, attr.CPF_REGIAO)
+        )
+
+        for out in [zeros(2, dtype=bool), zeros(len(docs), dtype=int), [1]]:
+            with self.assertRaises(ValueError):
+                validate(docs, d.CPF, out=out)
+
+    def test_in_place(self) -> None:
+        docs = array(["826.836.883-77", "82683688378", "111.111.111-11"])
+        expected = validate(docs, d.CPF)
+
+        for doclist in [docs.copy(), docs.astype("S")]:
+            testing.assert_equal(validate(doclist, d.CPF, copy=False), expected)
+            self.assertEqual(doclist.astype(str)[0], "82683688377")
+
+        doclist = docs.copy()
+        testing.assert_equal(
+            parse(doclist, d.CPF, True, copy=False), parse(docs, d.CPF, True)
+        )
+        testing.assert_equal(
+            get_attribute(docs.copy(), d.CPF, attr.CPF_REGIAO, copy=False),
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO),
+        )
+
+        read_only = docs.copy()
+        read_only.flags.writeable = False
+        for doclist in [list(docs), read_only, array(["826836"])]:
+            with self.assertRaises(ValueError):
+                validate(doclist, d.CPF, copy=False)
+
+    def test_generate(self) -> None:
+        docs = generate(100, d.CNPJ, mask=True, invalid_ratio=0.3, seed=1)
+        valid = validate(docs, d.CNPJ)
+
+        self.assertEqual(len(docs), 100)
+        self.assertEqual(valid.sum(), 70)
+        testing.assert_equal(
+            docs, generate(100, d.CNPJ, mask=True, invalid_ratio=0.3, seed=1)
+        )
+        testing.assert_equal(parse(docs, d.CNPJ, True)[valid], docs[valid])
+        self.assertEqual(len(generate(0, d.EMAIL)), 0)
+
+        for n, ratio in [(-1, 0.0), (10, 1.5)]:
+            with self.assertRaises(ValueError):
+                generate(n, d.CPF, invalid_ratio=ratio)
+
+    def test_bytes_input(self) -> None:
+        docs = array([b"826.836.883-77", b"82683688378", b"11111111111"])
+
+        testing.assert_equal(validate(docs, d.CPF), array([True, False, False]))
+        testing.assert_equal(
+            parse(docs, d.CPF, True),
+            array(["826.836.883-77", "826.836.883-78", None], dtype=object),
+        )
+        testing.assert_equal(
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO)[:2],
+            array(["CE/MA/PI", "CE/MA/PI"]),
+        )
+        self.assertEqual(validate(b"ABC-1234", d.PLACA), True)
+        self.assertEqual(parse(b"abc@abc.com.br", d.EMAIL), "abc@abc.com.br")
+
+    def test_integer_input(self) -> None:
+        docs = generate(100, d.CPF, invalid_ratio=0.2, seed=0)
+        integers = docs.astype("int64")
+
+        testing.assert_equal(validate(integers, d.CPF), validate(docs, d.CPF))
+        testing.assert_equal(
+            parse(integers, d.CPF, True), parse(docs, d.CPF, True)
+        )
+        testing.assert_equal(
+            get_attribute(integers, d.CPF, attr.CPF_REGIAO),
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO),
+        )
+        self.assertEqual(validate(1559539000152, d.CNPJ), False)
+        self.assertEqual(validate(15559539000152, d.CNPJ), True)
+        self.assertEqual(parse(2918124141, d.CPF, True), "029.181.241-41")
+        testing.assert_equal(
+            validate([82683688377, -82683688377], d.CPF), array([True, False])
+        )
+        testing.assert_equal(
+            validate(array([11987659876]), d.TELEFONE), array([True])
+        )
+
+    def test_input_types(self) -> None:
+        docs = array(["82683688377", "82683688378"])
+        expected = array([True, False])
+
+        for test in [
+            tuple(docs),
+            (doc for doc in docs),
+            memoryview(docs.astype("S11")),
+            docs.astype("S11").view("V11"),
+        ]:
+            testing.assert_equal(validate(test, d.CPF), expected)
+        testing.assert_equal(validate([], d.CPF), array([], dtype=bool))
+        self.assertEqual(parse(bytearray(b"82683688377"), d.CPF), "82683688377")
+
+    def test_null_input(self) -> None:
+        docs = array(["82683688377", None, "82683688378", nan], dtype=object)
+        masked = ma.masked_array(
+            ["82683688377", "", "82683688378", ""], mask=[0, 1, 0, 1]
+        )
+        floats = array([82683688377.0, nan, 82683688378.0, nan])
+
+        for test in [docs, masked, floats]:
+            for dedup in [False, True]:
+                result = validate(test, d.CPF, dedup=dedup)
+                self.assertIsInstance(result, ma.MaskedArray)
+                testing.assert_equal(result.mask, [False, True, False, True])
+                testing.assert_equal(result.data, [True, False, False, False])
+
+            self.assertEqual(validate(test, d.CPF, output="count"), (1, 3))
+            testing.assert_equal(
+                parse(test, d.CPF, True),
+                array(["826.836.883-77", None, "826.836.883-78", None]),
+            )
+
+        out = zeros(4, dtype=bool)
+        self.assertIs(validate(docs, d.CPF, out=out), out)
+        testing.assert_equal(out, [True, False, False, False])
+
+    def test_float_input(self) -> None:
+        docs = generate(100, d.CPF, invalid_ratio=0.2, seed=0)
+        floats = docs.astype("float64")
+
+        testing.assert_equal(validate(floats, d.CPF), validate(docs, d.CPF))
+        self.assertEqual(validate(82683688377.0, d.CPF), True)
+        self.assertEqual(parse(2918124141.0, d.CPF, True), "029.181.241-41")
+        testing.assert_equal(
+            validate([82683688377.0, 82683688377.5, float("nan")], d.CPF),
+            array([True, False, False]),
+        )
+
+    def test_normalize_numeric(self) -> None:
+        spreadsheet = normalize_numeric(["82683688377.0", "8.2683688377E+10"])
+        testing.assert_equal(spreadsheet, array([82683688377, 82683688377]))
+        testing.assert_equal(validate(spreadsheet, d.CPF), array([True, True]))
+        testing.assert_equal(
+            normalize_numeric(["2918124141.0", "826.836.883-77", "1.55e1"]),
+            array(["2918124141", "826.836.883-77", "0"]),
+        )
+        testing.assert_equal(
+            parse(normalize_numeric(array(["2918124141.0"])), d.CPF, True),
+            array(["029.181.241-41"]),
+        )
+
     def test_attributes(self) -> None:
         cases = [
             (("15559539000152", d.CNPJ, attr.CNPJ_RAIZ, True), "15559539"),
@@ -111,3 +426,58 @@ class TestDocbr(unittest.TestCase):
         for test, expected in raises:
             with self.assertRaises(expected):
                 get_attribute(*test)
+
+        testing.assert_equal(
+            get_attribute(
+                ["abc", "abc@abc.com.br"], d.EMAIL, attr.EMAIL_DOMINIO
+            ),
+            array(["None", "abc.com.br"]),
+        )
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_input(self) -> None:
+        docs = pa.array(["826.836.883-77", None, "82683688378", "11111111111"])
+
+        self.assertTrue(
+            validate(docs, d.CPF).equals(pa.array([True, None, False, False]))
+        )
+        self.assertTrue(
+            parse(docs, d.CPF, True).equals(
+                pa.array(["826.836.883-77", None, "826.836.883-78", None])
+            )
+        )
+        self.assertTrue(
+            get_attribute(docs, d.CPF, attr.CPF_REGIAO).equals(
+                pa.array(["CE/MA/PI", None, "CE/MA/PI", None])
+            )
+        )
+
+        cases = [
+            pa.array([82683688377, 82683688378]),
+            pa.array([82683688377, 82683688378], pa.uint64()),
+            pa.array([82683688377.0, 82683688378.0]),
+        ]
+        for numbers in cases:
+            self.assertEqual(
+                validate(numbers, d.CPF).to_pylist(), [True, False]
+            )
+            self.assertEqual(
+                parse(numbers, d.CPF, True).to_pylist()[0], "826.836.883-77"
+            )
+        for numbers in [
+            pa.array([2918124141, None]),
+            pa.array([2918124141.0, None]),
+        ]:
+            self.assertTrue(
+                validate(numbers, d.CPF).equals(pa.array([True, None]))
+            )
+            self.assertTrue(
+                parse(numbers, d.CPF).equals(pa.array(["02918124141", None]))
+            )
+
+        emails = pa.chunked_array([["abc@abc.com.br", None], ["abc"]])
+        self.assertTrue(
+            parse(emails, d.EMAIL).equals(
+                pa.array(["abc@abc.com.br", None, None])
+            )
+        )
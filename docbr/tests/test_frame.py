@@ -0,0 +1,124 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import (
+    array,
+    nan,
+    testing,
+)
+
+from docbr import attributes as attr
+from docbr import doctypes as d
+from docbr import (
+    generate,
+    get_attribute,
+    parse,
+    validate,
+    validate_frame,
+)
+from docbr.core._arrow import pa
+
+try:
+    import pandas as pd
+except ImportError:  # pragma: no cover
+    pd = None
+
+
+class TestFrame(unittest.TestCase):
+    def setUp(self) -> None:
+        self.data = {
+            "cpf": generate(50, d.CPF, mask=True, invalid_ratio=0.2, seed=0),
+            "placa": generate(50, d.PLACA, invalid_ratio=0.2, seed=1),
+            "email": generate(50, d.EMAIL, invalid_ratio=0.2, seed=2),
+        }
+        self.columns = {"cpf": d.CPF, "placa": d.PLACA, "email": d.EMAIL}
+
+    def test_validate_frame(self) -> None:
+        for n_jobs in [1, 2]:
+            result = validate_frame(self.data, self.columns, n_jobs=n_jobs)
+
+            self.assertEqual(list(result), ["cpf", "placa", "email"])
+            for column, doctype in self.columns.items():
+                testing.assert_equal(
+                    result[column], validate(self.data[column], doctype)
+                )
+
+    def test_concurrent_calls(self) -> None:
+        docs = generate(70000, d.CPF, invalid_ratio=0.2, seed=0)
+        expected = validate(docs, d.CPF)
+
+        def run(n_jobs: int) -> None:
+            if n_jobs:
+                result = validate(docs, d.CPF, n_jobs=n_jobs, executor="thread")
+                testing.assert_equal(result, expected)
+            else:
+                result = validate_frame(self.data, self.columns, n_jobs=2)
+                self.assertEqual(list(result), ["cpf", "placa", "email"])
+
+        with ThreadPoolExecutor(6) as callers:
+            list(callers.map(run, [0, 3, 0, 4, 0, 2] * 5))
+
+    def test_ops(self) -> None:
+        ops = {"cpf": ["validate", "parse", attr.CPF_REGIAO], "email": "parse"}
+        result = validate_frame(self.data, self.columns, ops, mask=True)
+
+        self.assertEqual(
+            list(result),
+            ["cpf_validate", "cpf_parse", "cpf_regiao", "placa", "email"],
+        )
+        testing.assert_equal(
+            result["cpf_parse"], parse(self.data["cpf"], d.CPF, True)
+        )
+        testing.assert_equal(
+            result["cpf_regiao"],
+            get_attribute(self.data["cpf"], d.CPF, attr.CPF_REGIAO),
+        )
+        testing.assert_equal(
+            result["email"], parse(self.data["email"], d.EMAIL, True)
+        )
+
+        raises = [
+            ((self.data, {"cpf": "ccard"}), ValueError),
+            ((self.data, {"cpf": d.CPF}, "estado"), ValueError),
+            (
+                (self.data, {"cpf": d.CPF}, "validate", False, False, 0),
+                ValueError,
+            ),
+        ]
+
+        for test, expected in raises:
+            with self.assertRaises(expected):
+                validate_frame(*test)
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_dataframe(self) -> None:
+        df = pd.DataFrame(self.data, index=[f"row{i}" for i in range(50)])
+        result = validate_frame(df, self.columns, ["validate", "parse"])
+
+        self.assertIsInstance(result, pd.DataFrame)
+        testing.assert_equal(result.index.to_numpy(), df.index.to_numpy())
+        testing.assert_equal(
+            result["placa_validate"].to_numpy(),
+            validate(self.data["placa"], d.PLACA),
+        )
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_columns(self) -> None:
+        data = {"cpf": pa.array(["82683688377", None, "82683688378"])}
+        result = validate_frame(data, {"cpf": d.CPF})
+
+        self.assertTrue(result["cpf"].equals(pa.array([True, None, False])))
+
+    @unittest.skipIf(pd is None, "pandas is not installed")
+    def test_null_values(self) -> None:
+        df = pd.DataFrame({"cpf": ["82683688377", None, "82683688378", nan]})
+        result = validate_frame(df, {"cpf": d.CPF}, ["validate", "parse"])
+
+        self.assertEqual(result["cpf_validate"].dtype, "boolean")
+        self.assertEqual(
+            result["cpf_validate"].tolist(), [True, pd.NA, False, pd.NA]
+        )
+        testing.assert_equal(
+            result["cpf_parse"].to_numpy(),
+            array(["82683688377", "None", "82683688378", "None"]),
+        )
@@ -0,0 +1,90 @@
+import unittest
+
+from numpy import (
+    array,
+    testing,
+)
+
+from docbr import doctypes as d
+from docbr import (
+    parse,
+    parse_records,
+    validate,
+    validate_records,
+)
+from docbr.core._arrow import pa
+
+
+class TestRecords(unittest.TestCase):
+    def test_validate_records(self) -> None:
+        docs = array(
+            [
+                "826.836.883-77",
+                "ABC-1234",
+                "15.559.539/0001-52",
+                "82683688378",
+                "abc@abc.com.br",
+                "ABC1234",
+            ]
+        )
+        doctypes = [d.CPF, d.PLACA, d.CNPJ, d.CPF, d.EMAIL, d.CPF]
+
+        testing.assert_equal(
+            validate_records(docs, doctypes),
+            array([True, True, True, False, True, False]),
+        )
+        testing.assert_equal(
+            parse_records(docs, doctypes, mask=True),
+            array(
+                [
+                    "826.836.883-77",
+                    "ABC-1234",
+                    "15.559.539/0001-52",
+                    "826.836.883-78",
+                    "abc@abc.com.br",
+                    "000.000.012-34",
+                ],
+                dtype=object,
+            ),
+        )
+        self.assertEqual(validate_records("ABC1234", d.PLACA), True)
+
+        raises = [
+            ((docs, doctypes[:-1]), ValueError),
+            ((docs, doctypes[:-1] + ["ccard"]), ValueError),
+        ]
+
+        for test, expected in raises:
+            with self.assertRaises(expected):
+                validate_records(*test)
+
+    def test_matches_validate(self) -> None:
+        docs = array(["826.836.883-77", "11987659876", "82683688378"] * 4)
+        doctypes = array([d.CPF, d.TELEFONE, d.CPF] * 4)
+
+        for doctype in [d.CPF, d.TELEFONE]:
+            rows = doctypes == doctype
+            testing.assert_equal(
+                validate_records(docs, doctypes)[rows],
+                validate(docs[rows], doctype),
+            )
+            testing.assert_equal(
+                parse_records(docs, doctypes, True)[rows],
+                parse(docs[rows], doctype, True),
+            )
+
+    @unittest.skipIf(pa is None, "pyarrow is not installed")
+    def test_arrow_input(self) -> None:
+        docs = pa.array(["82683688377", None, "ABC1234"])
+        doctypes = [d.CPF, d.CPF, d.PLACA]
+
+        self.assertTrue(
+            validate_records(docs, doctypes).equals(
+                pa.array([True, None, True])
+            )
+        )
+        self.assertTrue(
+            parse_records(docs, doctypes).equals(
+                pa.array(["82683688377", None, "ABC1234"])
+            )
+        )
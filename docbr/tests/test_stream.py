@@ -0,0 +1,98 @@
+import sqlite3
+import unittest
+
+from numpy import (
+    array,
+    concatenate,
+    testing,
+)
+
+from docbr import attributes as attr
+from docbr import doctypes as d
+from docbr import (
+    get_attribute_iter,
+    parse_iter,
+    validate_iter,
+)
+from docbr.api.stream import iter_chunks
+
+
+class TestStream(unittest.TestCase):
+    def test_iter_chunks(self) -> None:
+        cases = [
+            ((["a", "b", "c"], 2), [["a", "b"], ["c"]]),
+            ((iter([1, 2, 3]), 5), [[1, 2, 3]]),
+            (([["a", "b", "c"], ("d",)], 2), [["a", "b"], ["c"], ["d"]]),
+            ((["a", ["b", "c"], "d"], 5), [["a"], ["b", "c"], ["d"]]),
+            (([array(["a", "b", "c"])], 2), [["a", "b"], ["c"]]),
+            (([], 2), []),
+            (([("a",), ("b",), ("c",)], 2), [["a", "b"], ["c"]]),
+            (([[("a",), ("b",)], [("c",)]], 5), [["a", "b", "c"]]),
+        ]
+
+        raises = [
+            (("abc", 2), TypeError),
+            ((1, 2), TypeError),
+            ((["abc"], 0), ValueError),
+            (([[("a",), ("b", 1)]], 2), TypeError),
+        ]
+
+        for test, expected in cases:
+            chunks = [list(c) for c in iter_chunks(*test)]
+            self.assertEqual(chunks, expected)
+
+        for test, expected in raises:
+            with self.assertRaises(expected):
+                list(iter_chunks(*test))
+
+    def test_validate_iter(self) -> None:
+        docs = ["826.836.883-77", "82683688378", 82683688377] * 3
+        results = list(validate_iter(iter(docs), d.CPF, chunk_size=4))
+
+        self.assertEqual([len(r) for r in results], [4, 4, 1])
+        testing.assert_equal(
+            concatenate(results), array([True, False, True] * 3)
+        )
+
+        results = validate_iter(docs, d.CPF, chunk_size=4, output="invalid")
+        testing.assert_equal(concatenate(list(results)), [1, 4, 7])
+
+    def test_cursor(self) -> None:
+        docs = ["826.836.883-77", "82683688378", 82683688377] * 3
+        connection = sqlite3.connect(":memory:")
+        connection.execute("CREATE TABLE people (cpf)")
+        connection.executemany(
+            "INSERT INTO people VALUES (?)", [(doc,) for doc in docs]
+        )
+        expected = array([True, False, True] * 3)
+
+        cursor = connection.execute("SELECT cpf FROM people")
+        results = list(validate_iter(cursor, d.CPF, chunk_size=4))
+        self.assertEqual([len(r) for r in results], [4, 4, 1])
+        testing.assert_equal(concatenate(results), expected)
+
+        cursor = connection.execute("SELECT cpf FROM people")
+        batches = iter(lambda: cursor.fetchmany(2), [])
+        results = list(validate_iter(batches, d.CPF, chunk_size=4))
+        self.assertEqual([len(r) for r in results], [4, 4, 1])
+        testing.assert_equal(concatenate(results), expected)
+        connection.close()
+
+    def test_parse_iter(self) -> None:
+        chunks = [["ABC1234", "ABC-1234"], ("abc",)]
+        results = list(parse_iter(chunks, d.PLACA, mask=True))
+
+        self.assertEqual(len(results), 2)
+        testing.assert_equal(
+            concatenate(results),
+            array(["ABC-1234", "ABC-1234", None], dtype=object),
+        )
+
+    def test_get_attribute_iter(self) -> None:
+        lines = (f"{doc}\n" for doc in ["15559539000152"] * 5)
+        results = list(
+            get_attribute_iter(lines, d.CNPJ, attr.CNPJ_RAIZ, chunk_size=2)
+        )
+
+        self.assertEqual([len(r) for r in results], [2, 2, 1])
+        testing.assert_equal(concatenate(results), array(["15559539"] * 5))
@@ -0,0 +1,161 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from numpy import (
+    testing,
+    zeros,
+)
+
+from docbr import Validator
+from docbr import attributes as attr
+from docbr import doctypes as d
+from docbr import (
+    generate,
+    get_attribute,
+    parse,
+    validate,
+)
+from docbr.api import facade
+
+
+class TestValidator(unittest.TestCase):
+    def test_matches_facade(self) -> None:
+        doctypes = [
+            d.CPF,
+            d.CNPJ,
+            d.CNH,
+            d.T_ELEITOR,
+            d.PIS,
+            d.CERTIDAO,
+            d.RENAVAM,
+            d.PLACA,
+            d.TELEFONE,
+            d.EMAIL,
+        ]
+
+        for doctype in doctypes:
+            validator = Validator(doctype)
+            docs = generate(200, doctype, True, invalid_ratio=0.2, seed=0)
+            for _ in range(2):
+                testing.assert_equal(
+                    validator.validate(docs), validate(docs, doctype)
+                )
+                testing.assert_equal(
+                    validator.parse(docs), parse(docs, doctype)
+                )
+                testing.assert_equal(
+                    validator.parse(docs, mask=True), parse(docs, doctype, True)
+                )
+                for output in ["fixed", "bytes"]:
+                    testing.assert_equal(
+                        validator.parse(docs, output=output),
+                        parse(docs, doctype, output=output),
+                    )
+
+        validator = Validator(d.CPF)
+        self.assertEqual(validator.validate("826.836.883-77"), True)
+        self.assertEqual(
+            validator.get_attribute("82683688377", attr.CPF_REGIAO, True),
+            get_attribute("82683688377", d.CPF, attr.CPF_REGIAO, True),
+        )
+        self.assertEqual(repr(validator), "Validator('cpf')")
+
+        with self.assertRaises(ValueError):
+            Validator("ccard")
+
+    def test_threads(self) -> None:
+        validator = Validator(d.CNPJ)
+        batches = [
+            generate(size, d.CNPJ, invalid_ratio=0.5, seed=size)
+            for size in [10, 100, 10, 1000, 100, 10] * 4
+        ]
+
+        with ThreadPoolExecutor(4) as pool:
+            results = list(pool.map(validator.validate, batches))
+
+        for docs, result in zip(batches, results):
+            testing.assert_equal(result, validate(docs, d.CNPJ))
+
+    def test_reuse_buffers(self) -> None:
+        docs = generate(100, d.CPF, seed=0)
+
+        validator = Validator(d.CPF)
+        validator.validate(docs)
+        buffers = dict(validator._scratch())
+        result = validator.validate(docs)
+
+        self.assertTrue(result.all())
+        self.assertIn("fitted", buffers)
+        for name, buffer in validator._scratch().items():
+            self.assertIs(buffer, buffers[name])
+
+        first, _ = validator.parse(docs, output="bytes")
+        validator.parse(docs[::-1], output="bytes")
+        testing.assert_equal(first, docs.astype("S"))
+
+        validator = Validator(d.CPF, reuse_buffers=False)
+        self.assertTrue(validator.validate(docs).all())
+        self.assertIsNone(validator._scratch())
+
+    def test_read_only_spec(self) -> None:
+        validator = Validator(d.TELEFONE)
+
+        with self.assertRaises(ValueError):
+            validator._spec._ddd_estados[0] = "SP"
+
+    def test_out_and_in_place(self) -> None:
+        docs = generate(100, d.CPF, mask=True, invalid_ratio=0.5, seed=0)
+        expected = validate(docs, d.CPF)
+        validator = Validator(d.CPF)
+
+        out = zeros(len(docs), dtype=bool)
+        doclist = docs.copy()
+        self.assertIs(validator.validate(doclist, out=out, copy=False), out)
+        testing.assert_equal(out, expected)
+        testing.assert_equal(
+            validator.parse(docs.copy(), mask=True, copy=False),
+            parse(docs, d.CPF, True),
+        )
+
+        with self.assertRaises(ValueError):
+            validator.validate(docs, out=zeros(3, dtype=bool))
+
+    def test_output(self) -> None:
+        docs = generate(100, d.PIS, invalid_ratio=0.5, seed=0)
+        validator = Validator(d.PIS)
+
+        for output in ["bitmap", "invalid", "count"]:
+            for _ in range(2):
+                testing.assert_equal(
+                    validator.validate(docs, output=output),
+                    validate(docs, d.PIS, output=output),
+                )
+        self.assertIn("valid", validator._scratch())
+
+    def test_options(self) -> None:
+        docs = generate(300, d.CNPJ, True, invalid_ratio=0.3, seed=0)
+        validator = Validator(d.CNPJ)
+        expected = validator.validate(docs)
+
+        testing.assert_equal(validator.validate(docs, dedup=True), expected)
+        testing.assert_equal(
+            validator.validate(docs, n_jobs=2, executor="thread"), expected
+        )
+        testing.assert_equal(
+            validator.parse(docs, dedup=True), validator.parse(docs)
+        )
+        testing.assert_equal(
+            validator.get_attribute(docs, attr.CNPJ_RAIZ, dedup=True),
+            get_attribute(docs, d.CNPJ, attr.CNPJ_RAIZ),
+        )
+
+        with self.assertRaises(ValueError):
+            validator.validate(docs, executor="fork")
+
+    def test_facade_validators(self) -> None:
+        validator = facade._get_validator(d.CPF)
+
+        self.assertIs(facade._get_validator(d.CPF), validator)
+        self.assertFalse(validator.reuse_buffers)
+        with self.assertRaises(ValueError):
+            facade._get_validator("rg")